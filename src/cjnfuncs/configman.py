@@ -12,8 +12,28 @@ import re
 import ast
 import time
 import sys
+import os
 import datetime
-from threading import Thread
+import hashlib
+import json
+import zlib
+import heapq
+import itertools
+import marshal
+import mmap
+import select
+import struct
+import ctypes
+import ctypes.util
+try:
+    import posix_ipc                    # Linux only - used by publish_shared() and shared_config
+except ImportError:
+    posix_ipc = None
+import weakref
+from pathlib import Path
+from types import MappingProxyType
+from threading import Thread, Event, Lock, Condition, get_ident
+from concurrent.futures import ThreadPoolExecutor
 
 from .core      import setuplogging, logging, ConfigError #, set_logging_level, restore_logging_level, pop_logging_level_stack, get_logging_level_stack
 from .mungePath import mungePath, check_path_exists
@@ -25,6 +45,19 @@ import cjnfuncs.core as core
 # Configs / Constants
 RWT_NTRIES =    3
 RWT_TIMEOUT =   2.0
+PARSE_CACHE_ENTRIES =   4       # Max parse cache files retained per config file
+WATCH_POLL_INTERVAL =   1.0     # Seconds between file checks when inotify is not available
+SAVE_SCHEDULER_MAX_WAIT = 60.0  # Max seconds between scheduled save checks, to follow any system clock change
+JOURNAL_COMPACT_SIZE =  65536   # Default persistent_config journal size (bytes) that triggers a background compaction
+JSON_STORAGE_HEADER =   '#cjnfuncs persistent_config json'     # First line of a storage='json' file, followed by the version
+JSON_STORAGE_VERSION =  1
+SHARED_CONTROL_MAGIC =  b'CJNSHCT1'
+SHARED_CONTROL =        struct.Struct('<8sQ')       # publish_shared() control segment:  magic, current generation
+SHARED_SEGMENT_MAGIC =  b'CJNSHCF1'
+SHARED_SEGMENT_HEADER = struct.Struct('<8sQQQ')     # publish_shared() segment:  magic, generation, content length, index length
+SHARED_ATTACH_TRIES =   3                           # shared_config.loadconfig() tries when a segment is replaced while attaching
+FSYNC_POLICIES =        ('none', 'file', 'file+dir')    # write() / modify_configfile() fsync options
+_IMMUTABLE_SCALARS =    (bool, int, float, complex, str, bytes, type(None))     # persistent_config.setcfg() skips tracking when set to an equal value of these types
 
 # Logging events within this module are at the INFO and DEBUG levels.  With this module's child logger set to
 # a minimum of WARNING level by default, then logging from this module is effectively disabled.  To enable
@@ -33,6 +66,249 @@ RWT_TIMEOUT =   2.0
 configman_logger = logging.getLogger('cjnfuncs.configman')
 
 
+#=====================================================================================
+#=====================================================================================
+#  C o n f i g   f i l e   p a r s e r   h e l p e r s
+#=====================================================================================
+#=====================================================================================
+
+# Parser regexs are compiled once at import, rather than on each read_string() call
+find_comment_pattern = r"""
+    ('''|\""")                      # Match opening triple quotes
+    (?:\\.|(?!\1).)*?\1             # Match content inside triple quotes until matching closing
+    |                               # OR
+    (["'])(?:\\.|(?!\2).)*?\2       # Match single or double quotes with matching pairs
+    |                               # OR
+    (\#)                            # Match unquoted # (group 3)
+"""
+split_line_re =     re.compile(r'([^\s=:#]+)[\s=:]*(.*)')       # Identify param - value (with possible comment)
+find_comment_re =   re.compile(find_comment_pattern, re.VERBOSE) # Find unquoted '#'
+section_name_re =   re.compile(r'\[([^\]]*)\]')                 # Get section name
+int_value_re =      re.compile(r'[-+]?(?:0+|[1-9][0-9]*)')      # int literal forms (no leading zeros)
+float_value_re =    re.compile(r'[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))(?:[eE][-+]?[0-9]+)?')    # float literal forms
+bare_words_re =     re.compile(r'[^\W\d](?:[^,#()\[\]{}+\-\'"]*[^,#()\[\]{}+\-\'"\s])?')   # Starts with a letter and can't form a literal (eg, 'True, 5')
+literal_consts =    {'True': True, 'False': False, 'None': None}
+line_format_re =    re.compile(r'(\s*)([^\s=:]+)([\s=:]+)([^#]+)(.*)')    # modify_configfile() line parts
+lazy_line_re =      re.compile(rb'^[ \t]*([^\s=:#]+)[ \t=:]*([^\n]*)', re.MULTILINE)     # persistent_config lazy_load section and param lines
+lazy_continuation_re = re.compile(rb'\\[ \t]*(?:#[^\n]*)?\r?$', re.MULTILINE)     # Possible continuation line - not lazy loaded
+
+
+def _strip_comment(value_portion):
+    # Private module function
+    # Returns value_portion with any comment (first '#' outside of quotes) removed.
+    # Most lines have no '#', or no quote before the first '#', and are handled without the regex scan.
+    hash_index = value_portion.find('#')
+    if hash_index == -1:
+        return value_portion
+    leading = value_portion[:hash_index]
+    if '"' not in leading  and  "'" not in leading:
+        return leading.strip()
+    for match in find_comment_re.finditer(value_portion):
+        if match.group(3):
+            return value_portion[:match.start(3)].strip()
+    return value_portion
+
+
+def _parse_value(value_portion):
+    # Private module function
+    # Returns the native-typed value for the value_portion str, with the same results as ast.literal_eval()
+    # (falling back to str).  Scalars and simple quoted strings are resolved directly.  Only container literals and
+    # unusual forms (escapes, string prefixes, underscores in numbers, ...) go through ast.literal_eval().
+    if value_portion in literal_consts:
+        return literal_consts[value_portion]
+    if int_value_re.fullmatch(value_portion):
+        return int(value_portion)
+    if float_value_re.fullmatch(value_portion):
+        return float(value_portion)
+
+    first_char = value_portion[0]
+    if first_char in '"\'':
+        if len(value_portion) > 1  and  value_portion[-1] == first_char  and  first_char not in value_portion[1:-1]  and  '\\' not in value_portion:
+            return value_portion[1:-1]
+    elif bare_words_re.fullmatch(value_portion):
+        return value_portion                        # Bare word(s) - not a literal
+
+    try:
+        return ast.literal_eval(value_portion)
+    except:
+        return value_portion                        # default to str
+
+
+def _decode_value(value_portion, force_str=False):
+    # Private module function
+    # Returns the loaded value for a param line's value_portion (with any comment removed), as loaded by read_string()
+    if len(value_portion) in (4, 5):
+        if value_portion.lower() == 'true':
+            value_portion = 'True'
+        elif value_portion.lower() == 'false':
+            value_portion = 'False'
+    elif value_portion == '':
+        value_portion = 'True'
+    if not force_str:
+        value_portion = _parse_value(value_portion)
+    return value_portion
+
+
+def _section_dict(cfg, defaults, section):
+    # Private module function
+    # Returns the dictionary holding the section's params
+    if section == '':
+        return cfg
+    if section == 'DEFAULT':
+        return defaults
+    return cfg[section]
+
+
+def _modified_line(out, value):
+    # Private module function
+    # Returns a config file line (matched by line_format_re) with the value replaced, retaining the comment position where possible
+    len_current_whitespace = len(out.group(4)) - len(out.group(4).strip())
+    len_new_whitespace = len_current_whitespace - (len(value) - len(out.group(4).strip()))
+    if len_new_whitespace < 1:
+        len_new_whitespace = 1
+    if len_current_whitespace == 0:
+        len_new_whitespace = 0
+    return out.group(1) + out.group(2) + out.group(3) + value + ' '*len_new_whitespace + out.group(5)
+
+
+def _change_signature(stat, change_detect):
+    # Private module function
+    # Returns the value compared by loadconfig() to detect a changed file, per the change_detect mode
+    if change_detect == 'mtime':
+        return int(stat.st_mtime)                   # integer-second resolution
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _stat_signature(file_path):
+    # Private module function
+    # Returns a tuple that changes whenever the file content is changed or replaced, or None if the file is not accessible
+    try:
+        return _change_signature(os.stat(file_path), 'stat')
+    except OSError:
+        return None
+
+
+def _file_digest(file_path):
+    # Private module function
+    # Returns the sha256 hex digest of a file's content.  Raises OSError if the file cannot be read.
+    return hashlib.sha256(mungePath(file_path).full_path.read_bytes()).hexdigest()
+
+
+def _write_file(file_path, content, atomic=False, fsync='none'):
+    # Private module function
+    # Writes content to file_path.  With atomic=True the content is written to a temp file in the same directory
+    # and renamed over file_path, so file_path holds either the prior or the new content, never a partial write.
+    # fsync='file' flushes the file data to disk before returning (before the rename if atomic), and 'file+dir'
+    # also flushes the directory entry (the rename or file creation).  The directory flush is skipped on Windows.
+    # content may be str, or bytes for a binary file.
+    mode = 'wb'  if isinstance(content, bytes)  else 'w'
+    if not atomic:
+        with open(file_path, mode) as ofile:
+            ofile.write(content)
+            if fsync != 'none':
+                ofile.flush()
+                os.fsync(ofile.fileno())
+    else:
+        tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{get_ident()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            with open(fd, mode) as ofile:
+                ofile.write(content)
+                if fsync != 'none':
+                    ofile.flush()
+                    os.fsync(ofile.fileno())
+            try:
+                os.chmod(tmp_path, os.stat(file_path).st_mode & 0o7777)     # Retain the replaced file's permissions
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    if fsync == 'file+dir':
+        _fsync_dir(file_path.parent)
+
+
+def _fsync_dir(dir_path):
+    # Private module function
+    # Flushes a directory's entries (file creations and renames) to disk.  Not supported on Windows.
+    if os.name == 'posix':
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _append_file(file_path, text, fsync='none'):
+    # Private module function
+    # Appends text to file_path, per the fsync policy as for _write_file()
+    new_file = not file_path.exists()
+    with open(file_path, 'a') as ofile:
+        ofile.write(text)
+        if fsync != 'none':
+            ofile.flush()
+            os.fsync(ofile.fileno())
+    if new_file  and  fsync == 'file+dir':
+        _fsync_dir(file_path.parent)
+
+
+def _map_file(file_path):
+    # Private module function
+    # Returns a read-only mmap of the file, and the file's (size, mtime_ns, inode) stamp.  Returns (None, None) for an empty file.
+    with open(file_path, 'rb') as ifile:
+        stat = os.fstat(ifile.fileno())
+        if stat.st_size == 0:
+            return None, None
+        return mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ), (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _shared_name(name):
+    # Private module function
+    # Returns the posix_ipc shared memory name, which must start with '/'
+    return name  if name.startswith('/')  else '/' + name
+
+
+def _unlink_shared(name):
+    # Private module function
+    # Removes a shared memory segment, if it exists
+    try:
+        posix_ipc.unlink_shared_memory(name)
+    except posix_ipc.ExistentialError:
+        pass
+
+
+def _read_if_exists(file_path):
+    # Private module function
+    # Returns the file's text content, or '' if the file doesn't exist
+    try:
+        return file_path.read_text()
+    except FileNotFoundError:
+        return ''
+
+
+def _rotate_journal(journal_path, compacting_path):
+    # Private module function
+    # Moves the journal content to compacting_path, appending it to any content left by a failed or interrupted compaction
+    if not compacting_path.exists():
+        try:
+            os.replace(journal_path, compacting_path)
+        except FileNotFoundError:
+            compacting_path.touch()
+        return
+    journal_text = _read_if_exists(journal_path)
+    if journal_text:
+        with open(compacting_path, 'a') as ofile:
+            ofile.write(journal_text)
+            ofile.flush()
+            os.fsync(ofile.fileno())
+    journal_path.unlink(missing_ok=True)
+
+
 #=====================================================================================
 #=====================================================================================
 #  C l a s s   c o n f i g _ i t e m
@@ -40,11 +316,12 @@ configman_logger = logging.getLogger('cjnfuncs.configman')
 #=====================================================================================
 
 initial_logging_setup_done = False   # Global since more than one config can be loaded
+_novalue = object()                 # getcfg() not-found marker, distinct from any loaded value
 
 
 class config_item():
     """
-## Class config_item (config_file=None, remap_logdirbase=True, force_str=False, secondary_config=False, safe_mode=False) - Create a configuration instance
+## Class config_item (config_file=None, remap_logdirbase=True, force_str=False, secondary_config=False, safe_mode=False, parse_cache=False, watch=False, watch_callback=None, change_detect='mtime', import_workers=0, atomic_reload=False, atomic_write=False, fsync='none', lazy_decode=False) - Create a configuration instance
 The config_item() class provides handling of one or more config file instances.  Class methods include:
  - Config file loading and reloading - `loadconfig()`
  - Loading config data from strings and dictionaries - `read_string()`, `read_dict()`
@@ -77,6 +354,55 @@ is properly set up.
 - If `safe_mode=False` then checks for the existence of config files runs the risk of application hang.
 - See Behavior NOTE below.
 
+`parse_cache` (bool, default False)
+- If `parse_cache=True` then the parsed results of the config file are saved in `core.tool.cache_dir`, and
+a later load of identical file content (and identical imported files content) is taken from the cache rather 
+than being parsed again.
+- See Behavior note below.
+
+`watch` (bool or str, default False)
+- If `watch=True` then the config file and all imported files are watched for changes by a background thread, using 
+Linux inotify if available, or otherwise by checking the files' stat every 1 second.  `watch='poll'` forces stat checking.
+- With watching active, `loadconfig()` does no file system accesses unless a change has been detected.
+- See Behavior note below.
+
+`watch_callback` (function, default None)
+- Called (with no args) from the watcher thread each time a change to a watched file is detected.
+
+`change_detect` (str, default 'mtime')
+- Selects how `loadconfig()` determines that the config file has changed
+- `'mtime'` - The file modification time, with integer-second resolution
+- `'stat'` - The file modification time in nanoseconds, size, and inode number
+- `'digest'` - As for `'stat'`, but if the stat values have changed then the file content is hashed and the config is 
+reloaded only if the content has changed
+- See Behavior note below.
+
+`import_workers` (int, default 0)
+- If greater than 0, the files imported by the config file are loaded concurrently by up to this number of threads, 
+before being merged in the order of the `import` lines.
+- See Behavior note below.
+
+`atomic_reload` (bool, default False)
+- If True, `loadconfig()` loads the config into new dictionaries and then switches the config_item over to them at once, 
+rather than changing the current dictionaries in place.
+- See Behavior note below.
+
+`atomic_write` (bool, default False)
+- If True, `write()` and `modify_configfile(save=True)` write to a temp file in the target directory and then rename
+it over the target file.
+- See Behavior note below.
+
+`fsync` (str, default 'none')
+- `'none'` - File writes are left to the operating system to flush to disk
+- `'file'` - File writes are flushed to disk before returning (before the rename with `atomic_write=True`)
+- `'file+dir'` - As for `'file'`, and the directory is also flushed so that the file creation or rename is durable (not done on Windows)
+- See Behavior note below.
+
+`lazy_decode` (bool, default False)
+- If True, `loadconfig()` and `read_string()` store each param's value_portion as loaded, and the value's type is resolved 
+on the param's first access by `getcfg()`.
+- See Behavior note below.
+
 
 ### Useful class attributes
 The current values of all public class attributes may be printed using `print(my_config)`.
@@ -101,6 +427,13 @@ instantiation `config_file` is a relative path (uses mungePath)
 `.config_dir` (Path or None)
 - The directory above  `.config_full_path`
 
+`.imported_files` (list of Paths)
+- Full paths of all files imported (including nested imports) by the most recent load
+
+`.file_changed` (bool)
+- With `watch` enabled, set True by the watcher thread when a change to the config file or an imported file is detected,
+and set False when `loadconfig()` reloads the config.
+
 
 ### Returns
 - Handle to the `config_item()` instance
@@ -141,6 +474,65 @@ directory.  With `remap_logdirbase=True`, the log dir will also be set to the to
 
 1. Details of the configuration instance may be printed, eg, `print(my_config)`.
 
+1. **Parse cache** - With `parse_cache=True`, the cache is keyed by a hash of the config file content and the `force_str`
+setting, and is stored in the `core.tool.cache_dir/configman_cache` directory.  A cache entry records the content hashes of any
+imported files, and is used only if those files are also unchanged.  Up to 4 cache entries are retained per config 
+file, so reverting a config file to recent content is also a cache hit.  The parse cache is used only for file loads by `loadconfig()`,
+not by direct calls to `read_string()`.  Failures to read or write the cache are logged and otherwise ignored.
+Parse cache use is logged at the `cjnfuncs.configman` INFO level.
+
+1. **Change detection modes** - With the default `change_detect='mtime'`, two changes to the config file within the same second
+may be missed.  `change_detect='stat'` detects any change to the file's modification time (at the file system's timestamp resolution), 
+size, or inode (the file being replaced by a save-by-rename), so no periodic `force_reload=True` calls are needed to catch missed changes.  
+`change_detect='digest'` additionally avoids reloads when the file is touched or rewritten with identical content, at the cost of 
+reading the file on each detected stat change.
+
+1. **Watching for config file changes** - With `watch` enabled, the watcher is started by the first `loadconfig()` call that finds
+the config file, and watches the config file and all imported files.  Calls to `loadconfig()` return `0` immediately 
+if no change has been detected, and reload the config if any watched file has changed (even within the same second).
+Changes by editors that save by writing a new file and renaming it over the config file are detected.
+The `watch_callback` may be used to signal a service loop to call `loadconfig()`.  Calling `loadconfig()` from 
+within the `watch_callback` is not advised unless all config data readers are paused, since the cfg dictionary may be flushed.
+Call `stop_watch()` to terminate the watcher thread.
+NOTE: inotify does not report changes made to network file system (eg, NFS or SMB) files by other computers.  Use 
+`watch='poll'` for config files on network file systems (which has the hang risk noted above for `safe_mode=False`).
+
+1. **Parallel import loading** - With `import_workers` greater than 0, `loadconfig()` scans the config file content for `import` lines
+and loads all of the (changed) imported files concurrently, each with its nested imports, then processes the config file content
+as usual.  The imported params are merged in the order of the `import` lines, so override results are the same as for a sequential load.
+The load time for a config with many imported files on a slow network file system approaches that of the slowest single file. 
+Errors while loading an imported file are raised at the point of the `import` line, as for a sequential load.
+
+1. **Atomic reloads for multithreaded readers** - With `atomic_reload=True`, a reload by `loadconfig()` (including with 
+`flush_on_reload=True`) loads the config file into a new set of `cfg`, `defaults`, and `sections_list` containers (starting 
+from copies of the current content if not flushing), and then publishes them with a single reference assignment.  Threads calling 
+`getcfg()`, `resolved()`, or reading `bind()` handles during a reload see either the complete prior config or the complete reloaded 
+config, without locking, and never a partially loaded or flushed config.  If the reload fails (eg, a missing imported file) the 
+prior config remains in place.
+A thread that holds a reference to the prior `my_config.cfg` dictionary continues to see the prior content, so readers should
+access params via `getcfg()` (or `my_config.cfg` afresh) rather than holding on to the dictionary.
+Other changes (`setcfg()`, `read_dict()`, etc.) are made in place, as usual.
+
+1. **Atomic and durable writes** - With the default `atomic_write=False`, the target file is truncated and rewritten, so a crash 
+or power loss during the write can leave a truncated or empty file.  With `atomic_write=True` the target file holds either the 
+prior or the new content, and readers (and the config watcher) see the new content appear at once.  The replaced file's permissions 
+are retained, but the file's inode changes (hard links to the prior file are not updated).  
+The `fsync` setting trades write latency for durability:  with `'none'` a write that has returned may still be lost in a power 
+failure, while `'file'` ensures the content is on disk and `'file+dir'` additionally ensures the (renamed) file is found after a power failure.  
+A durable atomic save uses `atomic_write=True, fsync='file+dir'`.  See `tests/bench-configman.py` benchmark 5 for typical save latencies.
+
+1. **Compact storage** - config_item attributes are held in `__slots__`, so other attributes cannot be added to a config_item instance 
+(a derived class may add its own).  Param and section names loaded by `loadconfig()` and `read_string()` are interned, so configs and 
+sections having the same param names share a single copy of each name.  For processes holding many small configs, see 
+`tests/bench-configman.py` benchmark 11 for the memory use per config and per param.
+
+1. **Lazy value decoding** - With `lazy_decode=True`, the type resolution of a param's value_portion (eg, the parsing of a large 
+list or dict literal) is deferred until the param's first `getcfg()` access (including by `bind()` handles), and the result is 
+stored in the `cfg` dictionary for later accesses.  Params that are never accessed are never decoded.
+Params not yet accessed are not in the `cfg` (or `defaults`) dictionary, so direct access (eg, `my_config.cfg['table']`) must be 
+preceded by a `getcfg()` for that param.  `resolved()`, `dump()`, `write()`, and `remove_param()` first decode the values that they use.  
+Params loaded from imported files and from the parse cache are decoded as usual.  See `tests/bench-configman.py` benchmark 10.
+
 1. Logging of the operations within loadconfig() and (other configman methods) may be controlled with setting 
 the named child logger `cjnfuncs.configman` to INFO or DEBUG level (the default logging level is WARNING which
 produces no logging events from this module), eg:
@@ -148,17 +540,57 @@ produces no logging events from this module), eg:
         logging.getLogger('cjnfuncs.configman').setLevel(logging.INFO)
     """
 
-    def __init__(self, config_file=None, remap_logdirbase=True, force_str=False, secondary_config=False, safe_mode=False, missing_ok=False):
+    # Attributes are held in slots rather than a per-instance __dict__, for processes that load many configs
+    __slots__ = ('force_str', 'secondary_config', 'safe_mode', 'parse_cache', 'watch', 'watch_callback', 'watcher', 'file_changed',
+                 'change_detect', 'import_workers', 'atomic_reload', 'atomic_write', 'fsync', 'lazy_decode', 'config_signature',
+                 'config_digest', 'loaded', 'cfg', 'current_section_name', 'sections_list', '_section_names', 'defaults',
+                 '_generation', '_resolved', '_resolved_generation', '_bound_params', '_bound_lock', '_snapshot', 'imported_files',
+                 '_config_lines', '_config_line_index', '_import_records', '_import_signatures', '_lazy_values', '_lazy_lock',
+                 'config_file', 'config_dir', 'config_full_path', 'config_timestamp', 'config_content', '__weakref__')
+
+    def __init__(self, config_file=None, remap_logdirbase=True, force_str=False, secondary_config=False, safe_mode=False, missing_ok=False, parse_cache=False, watch=False, watch_callback=None, change_detect='mtime', import_workers=0, atomic_reload=False, atomic_write=False, fsync='none', lazy_decode=False):
         global tool
 
+        if change_detect not in ('mtime', 'stat', 'digest'):
+            raise ConfigError (f"change_detect must be 'mtime', 'stat', or 'digest', received <{change_detect}>")
+        if fsync not in FSYNC_POLICIES:
+            raise ConfigError (f"fsync must be 'none', 'file', or 'file+dir', received <{fsync}>")
+
         self.force_str =            force_str
         self.secondary_config =     secondary_config
         self.safe_mode =            safe_mode
+        self.parse_cache =          parse_cache
+        self.watch =                watch
+        self.watch_callback =       watch_callback
+        self.watcher =              None
+        self.file_changed =         False
+        self.change_detect =        change_detect
+        self.import_workers =       import_workers
+        self.atomic_reload =        atomic_reload
+        self.atomic_write =         atomic_write
+        self.fsync =                fsync
+        self.lazy_decode =          lazy_decode
+        self.config_signature =     None        # Compared to the file's current signature by loadconfig()
+        self.config_digest =        None        # Content hash for change_detect='digest'
         self.loaded =               False
         self.cfg =                  {}
         self.current_section_name = ''
         self.sections_list =        []
+        self._section_names =       set()   # Same content as sections_list, for O(1) section lookups
         self.defaults =             {}
+        self._generation =          0       # Incremented for each change to the cfg content made by class methods
+        self._resolved =            {}      # resolved() views by section, valid for _resolved_generation
+        self._resolved_generation = -1
+        self._bound_params =        None    # WeakSet of bind() handles, invalidated by _content_changed().  Created by the first bind().
+        self._bound_lock =          Lock()  # Serializes bind() handle resolution and invalidation
+        self._snapshot =            (self.cfg, self.defaults, self._section_names)  # Read by getcfg() and resolved() as one consistent set
+        self.imported_files =       []      # Paths of all (nested) imports loaded by read_string()
+        self._config_lines =        None    # modify_configfile() working content (removed lines are None), until saved
+        self._config_line_index =   None    # modify_configfile() param name to _config_lines line numbers
+        self._import_records =      {}      # Per imported file load results, keyed by path.  Shared across the import tree.
+        self._import_signatures =   {}      # Signatures of all imported files as of the most recent load
+        self._lazy_values =         None    # Not yet decoded params (a _lazy_strings or _lazy_values instance), see lazy_decode
+        self._lazy_lock =           Lock()  # Serializes the release of _lazy_values with the publishing of new _lazy_values
 
         if config_file == None:
             self.config_file =      None
@@ -188,6 +620,53 @@ produces no logging events from this module), eg:
             core.tool.log_dir_base = core.tool.config_dir
 
 
+    def _content_changed(self):
+        # Private class method
+        # Called after any change to the cfg content by a class method.  Invalidates resolved() views and bind() handles.
+        self._generation += 1
+        if self._bound_params:
+            with self._bound_lock:
+                for bound_param in self._bound_params:
+                    bound_param._invalidate()
+
+
+    def _staging_item(self, copy_content):
+        # Private class method
+        # Returns a config_item with this config's load settings, for an atomic_reload load.  Content containers are 
+        # empty, or copies of the current content (sections copied one level deep so that the current content is not changed).
+        staged = config_item(force_str=self.force_str, remap_logdirbase=False, import_workers=self.import_workers, lazy_decode=self.lazy_decode)
+        staged.config_file =        self.config_file
+        staged.config_dir =         self.config_dir
+        staged.config_full_path =   self.config_full_path
+        staged._import_records =    self._import_records
+        if copy_content:
+            cfg, defaults, section_names = self._snapshot
+            staged.cfg =            {key: (dict(value) if key in section_names else value) for key, value in cfg.items()}
+            staged.defaults =       dict(defaults)
+            staged.sections_list =  list(self.sections_list)
+            staged._section_names = set(section_names)
+            staged._snapshot =      (staged.cfg, staged.defaults, staged._section_names)
+            lazy_values = self._lazy_values
+            if lazy_values is not None:
+                staged._lazy_values = lazy_values.copy(staged.cfg, staged.defaults)
+        return staged
+
+
+    def _publish(self, staged):
+        # Private class method
+        # Switch over to the content loaded into a _staging_item().  getcfg() and resolved() see the new content
+        # in full with the single _snapshot assignment.  Not yet decoded values are decoded into the staged content.
+        with self._lazy_lock:
+            self._lazy_values = staged._lazy_values
+        self._snapshot =        (staged.cfg, staged.defaults, staged._section_names)
+        self.cfg =              staged.cfg
+        self.defaults =         staged.defaults
+        self.sections_list =    staged.sections_list
+        self._section_names =   staged._section_names
+        self.imported_files =   staged.imported_files
+        self._content_changed()
+
+
     def _add_key(self, key, value, section=''):
         if section == '':
             self.cfg[key] = value
@@ -356,7 +835,9 @@ the tool script to do any post-config-load operations.
    - **Note** that if using threading, and a thread is accessing the config data, then the thread should be paused while the config file 
   is being reloaded with `flush_on_reload=True` since the params will disappear briefly.
   Use the `prereload_callback` mechanism to manage any code dependencies before the cfg dictionary is purged.
-   - Changes to imported files are not tracked for changes.
+  Alternately, use `atomic_reload=True` on the `config_item()` instantiation.
+   - Imported files are also checked for changes.  On a reload, only the changed imported files (and the files that import them) 
+  are re-read.  The prior load results are reused for unchanged imported files.
 
 1. **Tolerating intermittent config file access** - When implementing a service loop, if `tolerate_missing=True` 
 (default False) then loadconfig() will return `-1` if the config file cannot be accessed, informing the 
@@ -375,6 +856,8 @@ cannot be accessed.
             initial_logging_setup_done = True
 
         config = self.config_full_path
+        string_blob = None
+        flush_first = False                                     # For atomic_reload, flush by loading into empty containers
 
         # Operations only on top-level config file
         is_top_level = not isimport
@@ -384,13 +867,20 @@ cannot be accessed.
                 if not flush_on_reload:
                     configman_logger.info(f"Config  <{self.config_file}>  Force reload, not flushed")
                 else:
-                    self.clear()
+                    if self.atomic_reload:
+                        flush_first = True
+                    else:
+                        self.clear()
                     configman_logger.info(f"Config  <{self.config_file}>  Force reload, flushed first")
                 # configman_logger.info(f"Config  <{self.config_file}>  force reloaded (force_reload)")
                 # if flush_on_reload:
                 #     self.clear()
                 #     configman_logger.info(f"Config  <{self.config_file}>  flushed (flush_on_reload)")
-                self.config_timestamp = 0                       # Force reload of the config file
+                self.config_signature = None                    # Force reload of the config file
+                self._import_records = {}                       #   and all imported files
+
+            elif self.watcher is not None  and  not self.file_changed:
+                return 0                                        # No changes reported by the watcher
 
             # Check if config file is available and has changed
             _exists = False
@@ -408,12 +898,31 @@ cannot be accessed.
                 else:
                     raise ConfigError (f"Could not find  <{self.config_file}>")
 
-            current_timestamp = int(self.config_full_path.stat().st_mtime)  # force integer-second resolution   # Minor hang risk - above exists check should protect
-            if self.config_timestamp == current_timestamp:
+            if self.watcher is not None:
+                if self.file_changed:
+                    self.config_signature = None                # Reload even if changed within the same second
+                self.file_changed = False
+            elif self.watch:
+                self.watcher = _config_watcher(self, use_inotify = self.watch != 'poll')
+                self.watcher.set_paths([self.config_full_path] + self.imported_files)
+
+            stat = self.config_full_path.stat()                 # Minor hang risk - above exists check should protect
+            current_timestamp = int(stat.st_mtime)
+            current_signature = _change_signature(stat, self.change_detect)
+            imports_changed = self.config_signature is not None  and  self._imports_changed()
+            if self.config_signature == current_signature  and  not imports_changed:
                 return 0                                        # 0 indicates that the config file was NOT (re)loaded
 
+            if self.change_detect == 'digest'  and  self.config_signature is not None  and  not imports_changed:
+                string_blob = config.read_text()
+                if hashlib.sha256(string_blob.encode()).hexdigest() == self.config_digest:
+                    configman_logger.info (f"Config  <{self.config_file}>  file changed but content unchanged - not reloaded")
+                    self.config_signature = current_signature
+                    return 0
+
             # It's an initial load call, or config file has changed, or force_reload...  Do (re)load
             self.config_timestamp = current_timestamp
+            self.config_signature = current_signature
             if prereload_callback:
                 configman_logger.debug("Pre-reload callback user function called")
                 prereload_callback()
@@ -427,7 +936,10 @@ cannot be accessed.
                     if not flush_on_reload:
                         configman_logger.info(f"Config  <{self.config_file}>  Reload due to changed file, not flushed")
                     else:
-                        self.clear()
+                        if self.atomic_reload:
+                            flush_first = True
+                        else:
+                            self.clear()
                         configman_logger.info(f"Config  <{self.config_file}>  Reload due to changed file, flushed first")
 
             # if flush_on_reload:
@@ -442,13 +954,39 @@ cannot be accessed.
             # to be handled at the next higher level, until we reach the top-level loadconfig() call, and the exception is passed to the 
             # tool script code.
         configman_logger.info (f"Loading  <{config}>")
+        load_into = self
+        if is_top_level:
+            if self.atomic_reload:
+                load_into = self._staging_item(copy_content=not flush_first)
+            else:
+                self.imported_files = []
         try:
-            string_blob = config.read_text()        # Minor hang risk - above exists check should protect
-            self.read_string (string_blob, isimport=isimport)
+            if string_blob is None:
+                string_blob = load_into._read_config_file(config)  # Minor hang risk - above exists check should protect
+            if is_top_level  and  self.change_detect == 'digest':
+                self.config_digest = hashlib.sha256(string_blob.encode()).hexdigest()
+            if self.parse_cache  and  is_top_level:
+                load_into._read_string_cached (string_blob)
+            else:
+                if self.import_workers  and  is_top_level:
+                    load_into._prefetch_imports (string_blob)
+                load_into.read_string (string_blob, isimport=isimport)
+            if load_into is not self:
+                self._publish (load_into)
             self.loaded = True
         except:
             raise
 
+        if is_top_level:
+            # Record the imported files' signatures for change checks, and drop records for files no longer imported
+            self._import_signatures = {}
+            for import_path in self.imported_files:
+                record = self._import_records.get(import_path)
+                self._import_signatures[import_path] = record['signatures'][import_path] if record else _stat_signature(import_path)
+            self._import_records = {import_path: self._import_records[import_path] for import_path in self._import_records if import_path in self._import_signatures}
+
+        if is_top_level  and  self.watcher is not None:
+            self.watcher.set_paths([self.config_full_path] + self.imported_files)
 
         # Operations only for finishing a top-level call on the primary config
         if is_top_level  and  not self.secondary_config:
@@ -512,29 +1050,26 @@ flush_on_reload, force_reload, and tolerate_missing.
 - A ConfigError is also raised if an imported config file cannot accessed
         """
         continuation_line = False
-        split_line_re =     re.compile(r'([^\s=:#]+)[\s=:]*(.*)')       # Identify param - value (with possible comment)
-        xx = fr"""
-            ('''|\""")                      # Match opening triple quotes
-            (?:\\.|(?!\1).)*?\1             # Match content inside triple quotes until matching closing
-            |                               # OR
-            (["'])(?:\\.|(?!\2).)*?\2       # Match single or double quotes with matching pairs
-            |                               # OR
-            (\#)                            # Match unquoted # (group 3)
-        """
-        find_comment_re =   re.compile(xx, re.VERBOSE)                  # Find unquoted '#'
-        section_name_re =   re.compile(r'\[([^\]]*)\]')                 # Get section name
-
+        debug_logging =     configman_logger.isEnabledFor(logging.DEBUG)
+        lazy_strings =      None
+        if self.lazy_decode  and  not isimport:
+            if not isinstance(self._lazy_values, _lazy_strings):
+                self._decode_all()
+                self._lazy_values = _lazy_strings(self.cfg, self.defaults, self.force_str)
+            lazy_strings = self._lazy_values
 
         for line in str_blob.split('\n'):
+            stripped_line = line.strip()
 
-            if line.strip().startswith('['):                            # Section
+            if stripped_line.startswith('['):                           # Section
                 section_name = None
-                out = section_name_re.match(line.strip())
+                out = section_name_re.match(stripped_line)
                 if out:
-                    section_name = out.group(1).strip()
-                    if section_name != ''  and  section_name not in self.sections_list  and  section_name != 'DEFAULT':
+                    section_name = sys.intern(out.group(1).strip())
+                    if section_name != ''  and  section_name not in self._section_names  and  section_name != 'DEFAULT':
                         self.cfg[section_name] = {}
                         self.sections_list.append(section_name)
+                        self._section_names.add(section_name)
                 if section_name is None:
                     raise ConfigError (f"Malformed section line <{line}>")
                 else:
@@ -545,20 +1080,16 @@ flush_on_reload, force_reload, and tolerate_missing.
 
             if not continuation_line:
                 param_name = value_portion = ''
-                out = split_line_re.match(line.strip())
+                out = split_line_re.match(stripped_line)
                 if out:
-                    param_name =        out.group(1)
+                    param_name =        sys.intern(out.group(1))    # Configs and sections with the same param names share the name strs
                     value_portion =     out.group(2)
             else:
-                value_portion +=        ' ' + line.strip()
+                value_portion +=        ' ' + stripped_line
                 continuation_line =     False
 
             if value_portion != '':
-                # Remove after first '#' outside of quotes
-                for match in find_comment_re.finditer(value_portion):
-                    if match.group(3):
-                        value_portion = value_portion[:match.start(3)].strip()
-                        break
+                value_portion = _strip_comment(value_portion)           # Remove after first '#' outside of quotes
 
             if value_portion.endswith('\\'):                            # Continuation line
                 value_portion =         value_portion[:-1].strip()
@@ -568,30 +1099,159 @@ flush_on_reload, force_reload, and tolerate_missing.
             if param_name != '':
                 if param_name.lower().startswith('import'):             # import line
                     target = mungePath(value_portion, self.config_dir).full_path
-                    imported_config = config_item(target, secondary_config=True)
-                    imported_config.loadconfig(isimport=True)           # May raise exception, caught by higher level
-                    for key in imported_config.cfg:
+                    import_record = self._load_import(target)           # May raise exception, caught by higher level
+                    self.imported_files.append(target)
+                    self.imported_files.extend(import_record['imported_files'])
+                    imported_cfg = import_record['cfg']
+                    for key in imported_cfg:
+                        if self._lazy_values is not None:
+                            self._lazy_values.discard(self.current_section_name, key)
                         if self.current_section_name == '':
-                            self.cfg[key] = imported_config.cfg[key]
+                            self.cfg[key] = imported_cfg[key]
                         elif self.current_section_name == 'DEFAULT':
-                            self.defaults[key] = imported_config.cfg[key]
+                            self.defaults[key] = imported_cfg[key]
                         else:
-                            self.cfg[self.current_section_name][key] = imported_config.cfg[key]
+                            self.cfg[self.current_section_name][key] = imported_cfg[key]
+                elif lazy_strings is not None:                          # param - value line, decoded on first access
+                    lazy_strings.add(self.current_section_name, param_name, value_portion)
+                    if debug_logging:
+                        configman_logger.debug (f"Loaded {param_name} = <{value_portion}>  (not yet decoded)")
                 else:                                                   # param - value line
-                    if value_portion.lower() == 'true':
-                        value_portion = 'True'
-                    if value_portion.lower() == 'false':
-                        value_portion = 'False'
-                    if value_portion == '':
-                        value_portion = 'True'
-                    if not self.force_str:
-                        try:
-                            value_portion = ast.literal_eval(value_portion)
-                        except:
-                            pass                                        # default to str
+                    value_portion = _decode_value(value_portion, self.force_str)
                     self._add_key(param_name, value_portion, self.current_section_name)
-                    configman_logger.debug (f"Loaded {param_name} = <{value_portion}>  ({type(value_portion)})")
+                    if self._lazy_values is not None:
+                        self._lazy_values.discard(self.current_section_name, param_name)
+                    if debug_logging:                                   # Skip formatting the message when not logged
+                        configman_logger.debug (f"Loaded {param_name} = <{value_portion}>  ({type(value_portion)})")
         self.loaded = True
+        self._content_changed()
+
+
+    def _load_import(self, import_path):
+        # Private class method
+        # Returns the import record for import_path, loading the file only if it, or any file that it imports, has 
+        # changed since its last load.  A record holds the file's loaded params (including nested imports), the paths
+        # of its nested imports, and the stat signatures of the file and its nested imports at the time of loading.
+
+        record = self._import_records.get(import_path)
+        if record is not None:
+            for path, signature in record['signatures'].items():
+                if _stat_signature(path) != signature:
+                    break
+            else:
+                configman_logger.debug (f"Import  <{import_path}>  unchanged - prior load reused")
+                return record
+
+        signature = _stat_signature(import_path)                        # Taken before the read so that a concurrent change is caught next time
+        imported_config = config_item(import_path, secondary_config=True)
+        imported_config._import_records = self._import_records
+        imported_config.loadconfig(isimport=True)
+        signatures = {import_path: signature}
+        for nested_path in imported_config.imported_files:
+            signatures[nested_path] = self._import_records[nested_path]['signatures'][nested_path]
+        record = {'signatures': signatures, 'cfg': imported_config.cfg, 'imported_files': imported_config.imported_files}
+        self._import_records[import_path] = record
+        return record
+
+
+    def _prefetch_imports(self, str_blob):
+        # Private class method
+        # Load the files imported by str_blob concurrently, leaving current import records for the following read_string() 
+        # to merge in declaration order.  Failures are ignored here, and are raised by read_string() at the failing import line.
+
+        import_paths = []
+        for line in str_blob.split('\n'):
+            out = split_line_re.match(line.strip())
+            if out  and  out.group(1).lower().startswith('import'):
+                import_path = mungePath(_strip_comment(out.group(2)), self.config_dir).full_path
+                if import_path not in import_paths:
+                    import_paths.append(import_path)
+        if len(import_paths) < 2:
+            return
+
+        def prefetch(import_path):
+            try:
+                self._load_import(import_path)
+            except Exception as e:
+                configman_logger.debug (f"Import  <{import_path}>  prefetch failed - {type(e).__name__}: {e}")
+
+        configman_logger.debug (f"Prefetching {len(import_paths)} imported files with up to {self.import_workers} threads")
+        with ThreadPoolExecutor(max_workers=min(self.import_workers, len(import_paths)), thread_name_prefix='configman_import') as executor:
+            list(executor.map(prefetch, import_paths))
+
+
+    def _imports_changed(self):
+        # Private class method
+        # Returns True if any file imported by the most recent load has since changed
+        for import_path, signature in self._import_signatures.items():
+            if _stat_signature(import_path) != signature:
+                configman_logger.info (f"Config  <{self.config_file}>  imported file <{import_path}> changed")
+                return True
+        return False
+
+
+    def _read_string_cached(self, str_blob):
+        # Private class method
+        # Load str_blob from the parse cache if an entry exists for this content (and unchanged imports), 
+        # else parse str_blob and save the results to the parse cache.
+
+        key = hashlib.sha256(f"{sys.version_info[:2]}|{self.force_str}|{self.config_dir}|".encode() + str_blob.encode()).hexdigest()
+        path_tag = hashlib.sha256(str(self.config_full_path).encode()).hexdigest()[:12]
+        cache_dir = mungePath('configman_cache', core.tool.cache_dir).full_path
+        cache_file = cache_dir / f"{self.config_full_path.name}.{path_tag}.{key[:32]}"
+
+        try:
+            cached = marshal.loads(cache_file.read_bytes())
+            for import_path, import_digest in cached['imports']:
+                if _file_digest(import_path) != import_digest:
+                    raise ValueError (f"Imported file <{import_path}> changed")
+            self._merge_parsed(cached['cfg'], cached['defaults'], cached['sections_list'])
+            self.imported_files = [mungePath(import_path).full_path for import_path, _ in cached['imports']]
+            configman_logger.info (f"Config  <{self.config_file}>  loaded from parse cache")
+            return
+        except FileNotFoundError:
+            configman_logger.info (f"Config  <{self.config_file}>  not in parse cache")
+        except Exception as e:
+            configman_logger.info (f"Config  <{self.config_file}>  parse cache entry not usable - {type(e).__name__}: {e}")
+
+        # Cache miss - parse into a clean config_item so that just this file's results are cached
+        parsed = config_item(force_str=self.force_str, remap_logdirbase=False)
+        parsed.config_dir = self.config_dir
+        parsed._import_records = self._import_records
+        if self.import_workers:
+            self._prefetch_imports (str_blob)
+        parsed.read_string(str_blob)
+        self._merge_parsed(parsed.cfg, parsed.defaults, parsed.sections_list)
+        self.imported_files = parsed.imported_files
+
+        try:
+            imports = [(str(import_path), _file_digest(import_path)) for import_path in parsed.imported_files]
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(marshal.dumps({'cfg': parsed.cfg, 'defaults': parsed.defaults, 'sections_list': parsed.sections_list, 'imports': imports}))
+            # Retain only the most recent PARSE_CACHE_ENTRIES for this config file
+            entries = sorted(cache_dir.glob(f"{self.config_full_path.name}.{path_tag}.*"), key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:-PARSE_CACHE_ENTRIES]:
+                entry.unlink(missing_ok=True)
+            configman_logger.info (f"Config  <{self.config_file}>  saved to parse cache")
+        except Exception as e:
+            configman_logger.info (f"Config  <{self.config_file}>  failed saving to parse cache - {type(e).__name__}: {e}")
+
+
+    def _merge_parsed(self, cfg, defaults, sections_list):
+        # Private class method
+        # Merge separately parsed content on top of the current content, with the same results as if parsed in-place
+        self._decode_all()
+        for key in cfg:
+            if key in sections_list:
+                if key not in self._section_names:
+                    self.cfg[key] = {}
+                    self.sections_list.append(key)
+                    self._section_names.add(key)
+                self.cfg[key].update(cfg[key])
+            else:
+                self.cfg[key] = cfg[key]
+        self.defaults.update(defaults)
+        self._content_changed()
 
 
 #=====================================================================================
@@ -649,6 +1309,10 @@ Loaded content is added to and/or modifies any previously loaded content.
 ```
         """
 
+        self._content_changed()
+        if self._lazy_values is not None:
+            for key in param_dict:
+                self._lazy_values.discard(section, key)
         try:
             if section == '':
                 for key in param_dict:
@@ -657,9 +1321,10 @@ Loaded content is added to and/or modifies any previously loaded content.
                 for key in param_dict:
                     self.defaults[key] = param_dict[key]
             else:
-                if section not in self.sections_list:
+                if section not in self._section_names:
                     self.cfg[section] = {}
                     self.sections_list.append(section)
+                    self._section_names.add(section)
                 for key in param_dict:
                     self.cfg[section][key] = param_dict[key]
         except Exception:
@@ -717,39 +1382,187 @@ This can lead to cleaner tool script code.  Either access method may be used, al
 - If the param is not found, or the param's type is not in the `types` list, if specified, then a ConfigError is raised.
         """
 
-        _value = '__nonevalue__'
+        if self._lazy_values is not None:
+            self._decode_lazy(param, section)
+        cfg, defaults, section_names = self._snapshot
         if section == '':                           # Top-level case
-            if param in self.cfg:
-                _value = self.cfg[param]
-            elif param in self.defaults:
-                _value = self.defaults[param]
-        else:
-            if section in self.sections_list:       # Section exists case
-                if param in self.cfg[section]:
-                    _value = self.cfg[section][param]
-                elif param in self.defaults:
-                    _value = self.defaults[param]
-            else:                                   # Section doesn't exist case
-                if param in self.defaults:
-                    _value = self.defaults[param]
-
-        if _value == '__nonevalue__':
+            _value = cfg.get(param, _novalue)
+            if _value is _novalue:
+                _value = defaults.get(param, _novalue)
+        elif section in section_names:              # Section exists case
+            _value = cfg[section].get(param, _novalue)
+            if _value is _novalue:
+                _value = defaults.get(param, _novalue)
+        else:                                       # Section doesn't exist case
+            _value = defaults.get(param, _novalue)
+
+        if _value is _novalue:
             if fallback != '_nofallback':
                 return fallback
             else:
                 raise ConfigError (f"Param <[{section}] {param}> not in <{self.config_file}> and no default or fallback.")
-        else:
-            # Optional type checking
-            if isinstance(types, type):
-                types = [types]
 
-            if types == []:
-                    return _value
+        # Optional type checking
+        if not types  or  type(_value) is types:    # No types, or a single type that matches
+            return _value
+        if isinstance(types, type):
+            types = [types]
+        if type(_value) in types:
+            return _value
+        raise ConfigError (f"Config parameter <[{section}] {param}> value <{_value}> type {type(_value)} not of expected type(s): {types}")
+
+
+    def _decode_lazy(self, param, section):
+        # Private class method
+        # Decodes any not yet decoded value of param in the section, and in DEFAULT, into the cfg dictionary that the
+        # lazy values were loaded for (the staged content, for an atomic_reload).
+        # The value is stored before it is discarded from the lazy values, so a concurrent getcfg() finds one or the other.
+        lazy_values = self._lazy_values
+        if lazy_values is None:
+            return
+        for lazy_section in (section, 'DEFAULT'):
+            value = lazy_values.lookup(lazy_section, param)
+            if value is not _novalue:
+                _section_dict(lazy_values.cfg, lazy_values.defaults, lazy_section)[param] = value
+                lazy_values.discard(lazy_section, param)
+
+
+    def _decode_all(self):
+        # Private class method
+        # Decodes all not yet decoded values into the cfg dictionary, and releases the lazy values
+        lazy_values = self._lazy_values
+        if lazy_values is None:
+            return
+        for section, param, value in lazy_values.items():
+            _section_dict(lazy_values.cfg, lazy_values.defaults, section)[param] = value
+        with self._lazy_lock:
+            if self._lazy_values is lazy_values:            # Not replaced by a concurrent atomic_reload
+                self._lazy_values = None
+
+
+    def _read_config_file(self, config_path):
+        # Private class method
+        # Returns the config file content to be loaded by read_string().  Overridden by persistent_config for lazy_load.
+        return config_path.read_text()
+
+
+#=====================================================================================
+#=====================================================================================
+#  r e s o l v e d
+#=====================================================================================
+#=====================================================================================
+
+    def resolved(self, section=''):
+        """
+## resolved (section='') - Get a read-only view of a section's params merged with the DEFAULT section
+
+***config_item() class member function***
+
+Returns a read-only mapping of all params visible to `getcfg()` for the `section`, with the section's params 
+overriding the `DEFAULT` section params.  `my_config.resolved('my section')['param']` returns the same value as
+`my_config.getcfg('param', section='my section')`, with a single dictionary access.  The view is built on the first call
+for a section, and reused until the config content is changed.
+
+
+### Args
+`section` (str, default '' (top-level))
+- Select the section to be viewed.  If the section does not exist, the view holds just the DEFAULT section params.
+
+
+### Returns
+- A `types.MappingProxyType` view of the merged params
+- Missing params raise a KeyError rather than a ConfigError.  Use `.get()` for fallback handling.
+
+
+### Behaviors and rules
+- The views are discarded when the config content is changed by any config_item method (eg, `loadconfig()`, `read_string()`,
+`read_dict()`, `setcfg()`, `remove_param()`, `clear()`).  A view obtained before such a change continues to hold the prior
+content, so a fresh view should be obtained by calling `resolved()` on each pass of a service loop, after any `loadconfig()` call.
+- Direct changes to the `.cfg` or `.defaults` dictionaries are not reflected in existing views.
+- The top-level view also includes the section sub-dictionaries, as does `my_config.cfg`.
+        """
+
+        if self._lazy_values is not None:
+            self._decode_all()
+        if self._resolved_generation != self._generation:
+            self._resolved =            {}
+            self._resolved_generation = self._generation
+        view = self._resolved.get(section)
+        if view is None:
+            cfg, defaults, section_names = self._snapshot
+            if section == '':
+                merged = {**defaults, **cfg}
+            elif section in section_names:
+                merged = {**defaults, **cfg[section]}
             else:
-                if type(_value) in types:
-                    return _value
-                else:
-                    raise ConfigError (f"Config parameter <[{section}] {param}> value <{_value}> type {type(_value)} not of expected type(s): {types}")
+                merged = dict(defaults)
+            view = MappingProxyType(merged)
+            self._resolved[section] = view
+        return view
+
+
+#=====================================================================================
+#=====================================================================================
+#  b i n d
+#=====================================================================================
+#=====================================================================================
+
+    def bind(self, param, section='', types=[], fallback='_nofallback'):
+        """
+## bind (param, section='', types=[], fallback='_nofallback') - Get an accessor handle for a frequently read param
+
+***config_item() class member function***
+
+Returns a handle whose `.value` attribute is the param's current value, as would be returned by 
+`getcfg(param, fallback, types, section)`.  The value is resolved, and type checked, once, and is re-resolved only 
+after the config content has been changed, so reading `.value` in a tight loop is a plain attribute access.
+
+
+### Args
+`param` (str)
+- String name of param to be accessed
+
+`section` (str, default '' (top-level))
+- Select the section from which to get the param value
+
+`types` (single or list of as-expected types, default '[]' (any type accepted))
+- As for `getcfg()`
+
+`fallback` (any, default effectively `None`, technically '_nofallback')
+- As for `getcfg()`
+
+
+### Returns
+- A handle with attributes `.value`, `.param`, `.section`, `.types`, and `.fallback`
+- A ConfigError is raised (by `bind()` and by `.value`) if the param is not found and no fallback is given, or 
+if the param's type is not in the `types` list, as for `getcfg()`
+
+
+### Behaviors and rules
+- The handle's cached value is discarded when the config content is changed by any config_item method, 
+eg, `loadconfig()` (when the config is reloaded), `read_string()`, `read_dict()`, `setcfg()`, `remove_param()`, and `clear()`.
+The next `.value` access then re-resolves the param.
+- Direct changes to the `.cfg` or `.defaults` dictionaries are not seen by existing handles.
+
+Example:
+```
+    poll_interval = my_config.bind('PollInterval', types=[int, float], fallback=10)
+    while True:
+        my_config.loadconfig()
+        ...
+        time.sleep(poll_interval.value)
+```
+        """
+        with self._bound_lock:
+            if self._bound_params is None:
+                self._bound_params = weakref.WeakSet()
+            generation = self._generation
+        bound_param = _bound_param(self, param, section, types, fallback)
+        with self._bound_lock:                          # Serialized with the _content_changed() invalidation of bound params
+            self._bound_params.add(bound_param)
+            if self._generation != generation:          # Content changed before the handle was registered
+                bound_param._invalidate()
+        return bound_param
 
 
 #=====================================================================================
@@ -795,11 +1608,15 @@ This can lead to cleaner tool script code.  Either access method may be used, al
         elif section == 'DEFAULT':                  # DEFAULT case
             self.defaults[param] = value
         else:                                       # section case - create section if doesn't exist
-            if section not in self.sections_list:
+            if section not in self._section_names:
                 self.cfg[section] = {}
                 self.sections_list.append(section)
+                self._section_names.add(section)
 
             self.cfg[section][param] = value
+        if self._lazy_values is not None:
+            self._lazy_values.discard(section, param)
+        self._content_changed()
         configman_logger.debug (f"Set [{section}] {param} = <{value}>  ({type(value)})")
 
 
@@ -834,9 +1651,12 @@ This can lead to cleaner tool script code.  Either access method may be used, al
 - Raises ConfigError if missing_ok=False and the param does not exist in the designated section
         """
 
+        if self._lazy_values is not None:
+            self._decode_lazy(param, section)
         if section == '':                           # Top-level case
             if param in self.cfg:
                 del self.cfg[param]
+                self._content_changed()
                 configman_logger.debug (f"Removed [{section}] {param}")
                 return
             elif missing_ok:
@@ -846,6 +1666,7 @@ This can lead to cleaner tool script code.  Either access method may be used, al
         elif section == 'DEFAULT':                  # DEFAULT case
             if param in self.defaults:
                 del self.defaults[param]
+                self._content_changed()
                 configman_logger.debug (f"Removed [{section}] {param}")
                 return
             elif missing_ok:
@@ -853,10 +1674,11 @@ This can lead to cleaner tool script code.  Either access method may be used, al
             raise ConfigError (f"Param <[DEFAULT] {param}> not found in config {self.config_file}")
 
         else:                                       # section case
-            if section not in self.sections_list  and  not missing_ok:
+            if section not in self._section_names  and  not missing_ok:
                 raise ConfigError (f"Section <{section}> not found in config {self.config_file}")
             if param in self.cfg[section]:
                 del self.cfg[section][param]
+                self._content_changed()
                 configman_logger.debug (f"Removed [{section}] {param}")
                 return
             elif missing_ok:
@@ -870,12 +1692,12 @@ This can lead to cleaner tool script code.  Either access method may be used, al
 #=====================================================================================
 #=====================================================================================
 
-    def modify_configfile (self, param='', value='', remove=False, add_if_not_existing=False, save=False):
+    def modify_configfile (self, param='', value='', remove=False, add_if_not_existing=False, save=False, edits=None):
         # TODO Comment out / uncomment out a param
         # TODO Add section select parameter for selective changes.  Also all mode
         # TODO Add a section label
         """
-## modify_configfile (param='', value='', remove=False, add_if_not_existing=False, save=False) - Make edits to the config file
+## modify_configfile (param='', value='', remove=False, add_if_not_existing=False, save=False, edits=None) - Make edits to the config file
 
 ***config_item() class member function***
 
@@ -891,6 +1713,8 @@ calls to modify_configfile() may be made, with the changes applied to the in-mem
 all changes have been applied the final call to modify_configfile() must have `save=True` to 
 cause the memory version to be written out to the config file.  If the script code checks for
 modifications of the config file then the modified content will be reloaded into the cfg dictionary.
+The in-memory copy is indexed by param name when first read, so each following call (or batch of `edits`) touches 
+only the lines of the params being changed, rather than scanning the full file.
 
 
 ### Args
@@ -913,6 +1737,11 @@ modifications of the config file then the modified content will be reloaded into
 - Write the modified config file content back to the file
 - `save=True` may be specified on the last modification call or an a standalone call.
 
+`edits` (dict, default None)
+- A batch of edits, as a dictionary of `{param: value}`, applied in a single pass through the config file content
+- The `remove` and `add_if_not_existing` settings apply to all params in the batch.  For `remove=True` the values are ignored.
+- If `edits` is given then `param` and `value` are ignored
+
 
 ### Returns
 - None
@@ -929,63 +1758,73 @@ It may be necessary to add a `time.sleep(0.5)` delay between saving the modified
 reload call to avoid multiple config reloads.
         """
 
-        line_format_re = re.compile(r'(\s*)([^\s=:]+)([\s=:]+)([^#]+)(.*)')
-
         if self.config_file is None:
             raise ConfigError ("Config file is None. Cannot modify config not loaded from a file.")
 
-        if self.config_content == '':
-            if self.safe_mode:
-                self.config_content = run_with_timeout(self.config_full_path.read_text, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
-            else:
-                self.config_content = self.config_full_path.read_text()
-        found_param = False
-        updated_content = ''
-        value = str(value)
-
-        for line in self.config_content.split('\n'):
-            out = line_format_re.match(line)
-            if out:
-                # print (f"1: <{out.group(1)}>")    # Any leading whitespace
-                # print (f"2: <{out.group(2)}>")    # param
-                # print (f"3: <{out.group(3)}>")    # whitespace, '=', ':' between param and value
-                # print (f"4: <{out.group(4)}>")    # value, with trailing whitespace
-                # print (f"5: <{out.group(5)}>")    # comment
-
-                if out.group(2) != param:
-                    updated_content += line + '\n'
+        if self._config_lines is None:
+            if self.config_content == '':
+                if self.safe_mode:
+                    self.config_content = run_with_timeout(self.config_full_path.read_text, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
                 else:
-                    found_param = True
-                    if remove == True:
-                        continue                            # just don't save the line
-
-                    # Update value for the current line
-                    len_current_whitespace = len(out.group(4)) - len(out.group(4).strip())
-                    len_new_whitespace = len_current_whitespace - (len(value) - len(out.group(4).strip()))
-                    if len_new_whitespace < 1:
-                        len_new_whitespace = 1
-                    if len_current_whitespace == 0:
-                        len_new_whitespace = 0
-                    updated_content += out.group(1) + out.group(2) + out.group(3) + value + ' '*len_new_whitespace + out.group(5) + '\n'
-            else:
-                updated_content += line + '\n'
-
-        if found_param == False:
-            if add_if_not_existing == True:
-                updated_content += f"{param}    {value}\n"
-            elif param==''  and  value==''  and  save==True: # Save-only call
-                pass
-            else:
-                configman_logger.warning (f"Modification of param <{param}> failed - not found in config file.  Modification skipped.")
+                    self.config_content = self.config_full_path.read_text()
+            self._config_lines =        []
+            self._config_line_index =   {}
+            for line in self.config_content.split('\n'):
+                self._append_config_line(line)
+            self.config_content =       ''                  # Not needed while the working content exists
+
+        if edits is None:
+            edits = {param: value}
+        lines = self._config_lines
+
+        for edit_param, edit_value in edits.items():
+            edit_value = str(edit_value)
+            found_param = False
+            for line_num in self._config_line_index.get(edit_param, ()):
+                if lines[line_num] is None:                 # Previously removed
+                    continue
+                out = line_format_re.match(lines[line_num])
+                if not out:                                 # No longer parsable after a prior modification
+                    continue
+                # out.group(1)  Any leading whitespace
+                # out.group(2)  param
+                # out.group(3)  whitespace, '=', ':' between param and value
+                # out.group(4)  value, with trailing whitespace
+                # out.group(5)  comment
+                found_param = True
+                if remove == True:
+                    lines[line_num] = None                  # just don't save the line
+                else:
+                    lines[line_num] = _modified_line(out, edit_value)
 
-        self.config_content = updated_content[:-1]          # Avoid adding extra \n at end of file
+            if found_param == False:
+                if add_if_not_existing == True:
+                    self._append_config_line(f"{edit_param}    {edit_value}")
+                elif edit_param==''  and  edit_value==''  and  save==True:     # Save-only call
+                    pass
+                else:
+                    configman_logger.warning (f"Modification of param <{edit_param}> failed - not found in config file.  Modification skipped.")
 
         if save:
+            if self._lazy_values is not None:
+                self._decode_all()                          # The mapped config_file is rewritten below
+            self.config_content = '\n'.join(line for line in lines if line is not None)
             if self.safe_mode:
-                self.config_content = run_with_timeout(self.config_full_path.write_text, self.config_content, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                run_with_timeout(_write_file, self.config_full_path, self.config_content, self.atomic_write, self.fsync, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
             else:
-                self.config_full_path.write_text(self.config_content)
-            self.config_content = ''
+                _write_file(self.config_full_path, self.config_content, self.atomic_write, self.fsync)
+            self.config_content =       ''
+            self._config_lines =        None
+            self._config_line_index =   None
+
+
+    def _append_config_line(self, line):
+        # Private class method
+        # Append a line to the modify_configfile() working content, and index it by param name
+        out = line_format_re.match(line)
+        if out:
+            self._config_line_index.setdefault(out.group(2), []).append(len(self._config_lines))
+        self._config_lines.append(line)
 
 
 #=====================================================================================
@@ -1017,34 +1856,73 @@ reload call to avoid multiple config reloads.
  are merged into the top-level.
         """
 
-        cfg_list = ''
-        for key in self.cfg:
-            if key not in self.sections_list:
-                if type(self.cfg[key]) is str  and  '#' in self.cfg[key]:
-                    cfg_list += f"{key:20} = '''{self.cfg[key]}'''\n"
+        self._write_text(self._config_text(), mungePath(savefile, core.tool.config_dir).full_path, self.atomic_write)
+
+
+    def _config_text(self):
+        # Private class method
+        # Returns the cfg content formatted as a config file
+        if self._lazy_values is not None:
+            self._decode_all()
+        lines = []
+        for key, value in self.cfg.items():
+            if key not in self._section_names:
+                if type(value) is str  and  '#' in value:
+                    lines.append(f"{key:20} = '''{value}'''\n")
                 else:
-                    cfg_list += f"{key:20} = {self.cfg[key]}\n"
-        cfg_list += '\n[DEFAULT]\n'
-        for key in self.defaults:
-            cfg_list += f"{key:20} = {self.defaults[key]}\n"
+                    lines.append(f"{key:20} = {value}\n")
+        lines.append('\n[DEFAULT]\n')
+        for key, value in self.defaults.items():
+            lines.append(f"{key:20} = {value}\n")
         for section in self.sections_list:
-            cfg_list += f'\n[{section}]\n'
-            for key in self.cfg[section]:
-                cfg_list += f"{key:20} = {self.cfg[section][key]}\n"
-        
-        outfile = mungePath(savefile, core.tool.config_dir).full_path
+            lines.append(f'\n[{section}]\n')
+            for key, value in self.cfg[section].items():
+                lines.append(f"{key:20} = {value}\n")
+        return ''.join(lines)
+
+
+    def _write_text(self, cfg_list, outfile, atomic):
+        # Private class method
+        # Writes the config text to outfile, per the safe_mode and fsync settings, and records the config file's new signature
 
         try:
             if self.safe_mode:
-                run_with_timeout(outfile.write_text, cfg_list, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                run_with_timeout(_write_file, outfile, cfg_list, atomic, self.fsync, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
                 stat = run_with_timeout(self.config_full_path.stat, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
             else:
-                outfile.write_text(cfg_list)
+                _write_file(outfile, cfg_list, atomic, self.fsync)
                 stat = self.config_full_path.stat()
         except Exception as e:
             raise ConfigError (f"Failed to write config {self.config_file} to file {outfile}\n  {type(e).__name__}: {e}")
 
         self.config_timestamp = int(stat.st_mtime)
+        self.config_signature = _change_signature(stat, self.change_detect)
+        if self.change_detect == 'digest'  and  outfile == self.config_full_path:
+            self.config_digest = hashlib.sha256(cfg_list.encode()).hexdigest()
+
+
+#=====================================================================================
+#=====================================================================================
+#  s t o p _ w a t c h
+#=====================================================================================
+#=====================================================================================
+
+    def stop_watch(self):
+        """
+## stop_watch () - Terminate the config file watcher thread
+
+***config_item() class member function***
+
+Following `stop_watch()`, calls to `loadconfig()` check the config file timestamp for changes, as when `watch=False`.
+The watcher is restarted by a following call to `loadconfig()` if `.watch` is set True.
+
+### Returns
+- None
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+        self.watch = False
 
 
 #=====================================================================================
@@ -1101,15 +1979,22 @@ output:
         if section == '':
             self.cfg.clear()
             self.sections_list = []
+            self._section_names = set()
+            self._snapshot = (self.cfg, self.defaults, self._section_names)
             self.defaults.clear()
             self.loaded = False
-        elif section in self.sections_list:
+            self._lazy_values = None
+        elif section in self._section_names:
             self.cfg.pop(section, None)
             self.sections_list.remove(section)
+            self._section_names.discard(section)
         elif section == 'DEFAULT':
             self.defaults.clear()
         else:
             raise ConfigError (f"Failed attempt to remove non-existing section <{section}> from config")
+        if self._lazy_values is not None:
+            self._lazy_values.discard_section(section)
+        self._content_changed()
 
 
 #=====================================================================================
@@ -1129,6 +2014,14 @@ output:
         stats += f".sections_list          :  {self.sections_list}\n"
         stats += f".force_str              :  {self.force_str}\n"
         stats += f".secondary_config       :  {self.secondary_config}\n"
+        stats += f".parse_cache            :  {self.parse_cache}\n"
+        stats += f".watch                  :  {self.watch}\n"
+        stats += f".change_detect          :  {self.change_detect}\n"
+        stats += f".import_workers         :  {self.import_workers}\n"
+        stats += f".atomic_reload          :  {self.atomic_reload}\n"
+        stats += f".atomic_write           :  {self.atomic_write}\n"
+        stats += f".fsync                  :  {self.fsync}\n"
+        stats += f".lazy_decode            :  {self.lazy_decode}\n"
         stats += f"core.tool.log_dir_base  :  {core.tool.log_dir_base}\n"
         return stats
 
@@ -1150,19 +2043,359 @@ output:
 - str type pretty formatted content of the cfg dictionary, along with any sections and defaults
         """
 
-        cfg_list = "***** Section [] *****\n"
-        for key in self.cfg:
-            if key not in self.sections_list:
-                cfg_list += f"{key:>20} = {self.cfg[key]}  {type(self.cfg[key])}\n"
+        if self._lazy_values is not None:
+            self._decode_all()
+        lines = ["***** Section [] *****"]
+        for key, value in self.cfg.items():
+            if key not in self._section_names:
+                lines.append(f"{key:>20} = {value}  {type(value)}")
+        for section in self.sections_list:
+            lines.append(f"***** Section [{section}] *****")
+            for key, value in self.cfg[section].items():
+                lines.append(f"{key:>20} = {value}  {type(value)}")
+        lines.append("***** Section [DEFAULT] *****")
+        for key, value in self.defaults.items():
+            lines.append(f"{key:>20} = {value}  {type(value)}")
+        return '\n'.join(lines)
+
+
+#=====================================================================================
+#=====================================================================================
+#  p u b l i s h _ s h a r e d
+#=====================================================================================
+#=====================================================================================
+
+    def publish_shared(self, name):
+        """
+## publish_shared (name) - Publish the config to a shared memory segment for shared_config() readers
+
+***config_item() class member function***
+
+The current content of the config (`cfg` and `defaults`) is written, along with a hash table index of the params,
+to a new POSIX shared memory segment, and the generation number of the published content is incremented.
+Other processes (eg, forked workers) attach to the published config by creating a `shared_config(name)` instance.
+
+### Args
+`name` (str)
+- The shared memory name for the published config, eg, the tool name.  A leading `/` is added if not present.
+
+### Returns
+- The generation number of the published content (1 for the first publish)
+- A ConfigError is raised if posix_ipc is not available (Linux only), or if a param name starts with `import`
+
+
+### Behaviors and rules
+- The published segment is named `<name>.<generation>`, and a small control segment named `<name>` holds the current
+generation number.  Each publish creates a new segment and then removes the prior generation's segment.  Processes that
+have the prior segment attached continue to see the prior content until their next `shared_config.loadconfig()` call.
+- Values are published as their `repr()`, so str, int, float, bool, None, list, tuple, dict, and set values are 
+reproduced exactly by `shared_config` readers.  Values of other types are loaded by readers as the str of their `repr()`.
+- Publish again after each reload or change of the config to be seen by readers, eg, after `loadconfig()` returns `1`.
+- The segments are created with mode 0o600 (accessible only to the current user).  Call `unpublish_shared()` to remove them.
+        """
+
+        if posix_ipc is None:
+            raise ConfigError ("publish_shared() requires the posix_ipc module (Linux only)")
+        name = _shared_name(name)
+        control = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, mode=0o0600, size=SHARED_CONTROL.size)
+        control_map = mmap.mmap(control.fd, SHARED_CONTROL.size)
+        control.close_fd()
+        with control_map:
+            magic, generation = SHARED_CONTROL.unpack_from(control_map)
+            generation = (generation if magic == SHARED_CONTROL_MAGIC else 0) + 1
+
+            content = self._shared_content().encode()
+            lazy_values, index_content = _lazy_values.build(content, (generation, len(content), 0), False)
+            if lazy_values is None:
+                raise ConfigError (f"Config <{self.config_file}> can't be published - param names can't start with 'import'")
+            header = SHARED_SEGMENT_HEADER.pack(SHARED_SEGMENT_MAGIC, generation, len(content), len(index_content))
+
+            segment_name = f"{name}.{generation}"
+            _unlink_shared(segment_name)                    # Left by an interrupted publish
+            segment = posix_ipc.SharedMemory(segment_name, flags=posix_ipc.O_CREX, mode=0o0600, 
+                                             size=len(header) + len(content) + len(index_content))
+            with mmap.mmap(segment.fd, segment.size) as segment_map:
+                segment_map[:] = header + content + index_content
+            segment.close_fd()
+
+            SHARED_CONTROL.pack_into(control_map, 0, SHARED_CONTROL_MAGIC, generation)   # Readers switch over to the new segment
+        _unlink_shared(f"{name}.{generation - 1}")
+        configman_logger.info (f"Config  <{self.config_file}>  published to shared memory <{name}> generation {generation}")
+        return generation
+
+
+    def unpublish_shared(self, name):
+        """
+## unpublish_shared (name) - Remove the shared memory segments of a published config
+
+***config_item() class member function***
+
+Removes the shared memory segments created by `publish_shared(name)`.  Processes that have the config attached continue
+to see the last published content.
+
+### Returns
+- None
+        """
+        if posix_ipc is None:
+            raise ConfigError ("unpublish_shared() requires the posix_ipc module (Linux only)")
+        name = _shared_name(name)
+        try:
+            control = posix_ipc.SharedMemory(name, flags=0, read_only=True)
+        except posix_ipc.ExistentialError:
+            return
+        with mmap.mmap(control.fd, SHARED_CONTROL.size, prot=mmap.PROT_READ) as control_map:
+            _, generation = SHARED_CONTROL.unpack_from(control_map)
+        control.close_fd()
+        _unlink_shared(f"{name}.{generation}")
+        _unlink_shared(name)
+
+
+    def _shared_content(self):
+        # Private class method
+        # Returns the cfg content formatted as config lines for publish_shared(), with repr() values
+        if self._lazy_values is not None:
+            self._decode_all()
+        cfg, defaults, section_names = self._snapshot
+        lines = []
+        for key, value in cfg.items():
+            if key not in section_names:
+                lines.append(f"{key} {value!r}\n")
+        lines.append('[DEFAULT]\n')
+        for key, value in defaults.items():
+            lines.append(f"{key} {value!r}\n")
         for section in self.sections_list:
-            cfg_list += f"***** Section [{section}] *****\n"
-            for key in self.cfg[section]:
-                cfg_list += f"{key:>20} = {self.cfg[section][key]}  {type(self.cfg[section][key])}\n"
-        cfg_list += f"***** Section [DEFAULT] *****\n"
-        for key in self.defaults:
-            cfg_list += f"{key:>20} = {self.defaults[key]}  {type(self.defaults[key])}\n"
-        return cfg_list[:-1]    # drop final '\n'
+            lines.append(f'[{section}]\n')
+            for key, value in cfg[section].items():
+                lines.append(f"{key} {value!r}\n")
+        return ''.join(lines)
+
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   _ b o u n d _ p a r a m
+#=====================================================================================
+#=====================================================================================
+
+class _bound_param():
+    # Private class
+    # Accessor handle returned by config_item.bind().  The resolved value is held in the value slot, so that reading 
+    # .value is a plain attribute access.  config_item._content_changed() empties the slot, and the next read of .value
+    # falls through to __getattr__(), which re-resolves the value via getcfg().
+
+    __slots__ = ('config', 'param', 'section', 'types', 'fallback', 'value', '__weakref__')
+
+    def __init__(self, config, param, section, types, fallback):
+        self.config =       config
+        self.param =        param
+        self.section =      section
+        self.types =        types
+        self.fallback =     fallback
+        self.value                                  # Resolve now so that errors are raised by bind()
+
+    def __getattr__(self, name):
+        if name != 'value':
+            raise AttributeError (name)
+        config = self.config
+        with config._bound_lock:
+            generation = config._generation
+            value = config.getcfg(self.param, fallback=self.fallback, types=self.types, section=self.section)
+            if config._generation == generation:    # Don't hold a value resolved across a concurrent content change
+                self.value = value
+        return value
+
+    def _invalidate(self):
+        try:
+            del self.value
+        except AttributeError:
+            pass
+
+    def __repr__(self):
+        return f"<bound param [{self.section}] {self.param} of config <{self.config.config_file}>>"
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   _ l a z y _ s t r i n g s
+#=====================================================================================
+#=====================================================================================
+
+class _lazy_strings():
+    # Private class
+    # The not yet decoded value_portions loaded by read_string() with lazy_decode, keyed by (section, param).
+    # Values are decoded into the cfg and defaults dictionaries that they were loaded for.
+
+    def __init__(self, cfg, defaults, force_str):
+        self.cfg =              cfg
+        self.defaults =         defaults
+        self.force_str =        force_str
+        self.value_portions =   {}
+
+    def add(self, section, param, value_portion):
+        self.value_portions[(section, param)] = value_portion
+
+    def lookup(self, section, param):
+        # Returns the decoded value of param in section, or _novalue if not in the lazy values
+        value_portion = self.value_portions.get((section, param))
+        if value_portion is None:
+            return _novalue
+        return _decode_value(value_portion, self.force_str)
+
+    def discard(self, section, param):
+        self.value_portions.pop((section, param), None)
+
+    def discard_section(self, section):
+        for key in [key for key in self.value_portions if key[0] == section]:
+            del self.value_portions[key]
+
+    def items(self):
+        # Yields (section, param, decoded value) for all not yet decoded params
+        for (section, param), value_portion in list(self.value_portions.items()):
+            yield section, param, _decode_value(value_portion, self.force_str)
+
+    def copy(self, cfg, defaults):
+        # Returns a copy for decoding into other cfg and defaults dictionaries
+        lazy_copy = _lazy_strings(cfg, defaults, self.force_str)
+        lazy_copy.value_portions = dict(self.value_portions)
+        return lazy_copy
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   _ c o n f i g _ w a t c h e r
+#=====================================================================================
+#=====================================================================================
+
+# inotify event masks (from sys/inotify.h)
+IN_ATTRIB =         0x00000004
+IN_CLOSE_WRITE =    0x00000008
+IN_MOVED_FROM =     0x00000040
+IN_MOVED_TO =       0x00000080
+IN_CREATE =         0x00000100
+IN_DELETE =         0x00000200
+IN_DELETE_SELF =    0x00000400
+IN_IGNORED =        0x00008000
+INOTIFY_WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+libc = None
+
+class _config_watcher():
+    # Private class
+    # Watches the config file and imported files for a config_item, setting the config_item's file_changed attribute
+    # and calling its watch_callback on any change.  The parent directories are watched with inotify, since editors
+    # commonly save by renaming a new file over the original.  Falls back to polling the files' stat if inotify
+    # is not available.
 
+    def __init__(self, owner, use_inotify=True):
+        global libc
+        self.owner =        owner
+        self.paths =        []
+        self.dir_watches =  {}              # inotify watch descriptor: [directory, set of watched file names]
+        self.lock =         Lock()
+        self.exit_event =   Event()
+        self.inotify_fd =   None
+
+        if use_inotify  and  sys.platform.startswith('linux'):
+            try:
+                if libc is None:
+                    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+                if fd < 0:
+                    raise OSError (ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+                self.inotify_fd = fd
+                self.wake_r, self.wake_w = os.pipe()
+            except Exception as e:
+                configman_logger.info (f"Config  <{owner.config_file}>  inotify not available, falling back to polling - {type(e).__name__}: {e}")
+
+        self.mode = 'inotify' if self.inotify_fd is not None else 'poll'
+        configman_logger.info (f"Config  <{owner.config_file}>  starting watcher ({self.mode})")
+        target = self._inotify_loop if self.mode == 'inotify' else self._poll_loop
+        self.thread = Thread(target=target, name=f'{owner.config_file} watcher', daemon=True)
+        self.thread.start()
+
+
+    def set_paths(self, paths):
+        with self.lock:
+            self.paths = [Path(path) for path in paths]
+            self.signatures = {path: _stat_signature(path) for path in self.paths}
+            if self.mode != 'inotify':
+                return
+
+            needed = {}
+            for path in self.paths:
+                needed.setdefault(str(path.parent), set()).add(path.name)
+            for wd in list(self.dir_watches):
+                if self.dir_watches[wd][0] not in needed:
+                    libc.inotify_rm_watch(self.inotify_fd, wd)
+                    del self.dir_watches[wd]
+            for directory in needed:
+                wd = libc.inotify_add_watch(self.inotify_fd, os.fsencode(directory), INOTIFY_WATCH_MASK)
+                if wd < 0:
+                    configman_logger.warning (f"Config  <{self.owner.config_file}>  could not watch <{directory}> - {os.strerror(ctypes.get_errno())}")
+                    continue
+                self.dir_watches[wd] = [directory, needed[directory]]
+
+
+    def stop(self):
+        self.exit_event.set()
+        if self.mode == 'inotify':
+            os.write(self.wake_w, b'x')
+        self.thread.join(timeout=2)
+        if self.mode == 'inotify':
+            for fd in (self.inotify_fd, self.wake_r, self.wake_w):
+                os.close(fd)
+        configman_logger.info (f"Config  <{self.owner.config_file}>  watcher stopped")
+
+
+    def _changed(self, name):
+        configman_logger.debug (f"Config  <{self.owner.config_file}>  watcher detected change to <{name}>")
+        self.owner.file_changed = True
+        if self.owner.watch_callback:
+            try:
+                self.owner.watch_callback()
+            except Exception as e:
+                configman_logger.warning (f"Config  <{self.owner.config_file}>  watch_callback raised {type(e).__name__}: {e}")
+
+
+    def _inotify_loop(self):
+        while not self.exit_event.is_set():
+            readable, _, _ = select.select([self.inotify_fd, self.wake_r], [], [])
+            if self.inotify_fd not in readable:
+                continue
+            try:
+                buf = os.read(self.inotify_fd, 64*1024)
+            except BlockingIOError:
+                continue
+            changed = []
+            offset = 0
+            with self.lock:
+                while offset < len(buf):
+                    wd, mask, _cookie, name_len = struct.unpack_from('iIII', buf, offset)
+                    name = os.fsdecode(buf[offset+16 : offset+16+name_len].rstrip(b'\0'))
+                    offset += 16 + name_len
+                    watch = self.dir_watches.get(wd)
+                    if watch is None:
+                        continue
+                    if mask & (IN_DELETE_SELF | IN_IGNORED):
+                        del self.dir_watches[wd]
+                        changed.append(watch[0])
+                    elif name in watch[1]:
+                        changed.append(name)
+            if changed:                                         # Callback outside of the lock since it may call loadconfig()
+                self._changed(', '.join(changed))
+
+
+    def _poll_loop(self):
+        while not self.exit_event.wait(WATCH_POLL_INTERVAL):
+            changed = []
+            with self.lock:
+                for path in self.paths:
+                    signature = _stat_signature(path)
+                    if signature != self.signatures[path]:
+                        self.signatures[path] = signature
+                        changed.append(path.name)
+            if changed:
+                self._changed(', '.join(changed))
 
 
 #=====================================================================================
@@ -1173,7 +2406,7 @@ output:
 
 class persistent_config (config_item):
     """
-## Class persistent_config (config_file, force_new=False, safe_mode=False, save_schedule=None) - Create (if not existing) and load a persistent_config data file
+## Class persistent_config (config_file, force_new=False, safe_mode=False, save_schedule=None, atomic_write=False, fsync='none', journal=False, journal_compact_size=65536, storage='text', lazy_load=False) - Create (if not existing) and load a persistent_config data file
 
 ***`persistent_config` is a derived class of `config_item`***
 
@@ -1207,8 +2440,31 @@ in `config_item` _Behaviors and rules_, above.
 - If an int or str, such as `7200` or `'2h'`, the value is interpreted as a timevalue between automatic saves
 - If a str clock time or a list of clock times, such as `'15:00'` or `['06:00', '18:00']` then automatic saves will be executed at these times
 - If None, no scheduled saves will be active
+- A scheduled save is skipped if no changes have been made since the last save.  See `.changed_keys`, below.
 - If `save_schedule` is used the tool script should exit with a call to `persist.save(exit=True)` to force a final save of the persistent data 
-and terminate the schedule save thread
+and end the instance's scheduled saves
+
+`atomic_write` (bool, default False), `fsync` (str, default 'none')
+- Control the safety and durability of `save()`.  See `config_item()` for details.
+- `atomic_write=True` ensures that the `config_file` is never left truncated by a crash during a save, and `fsync='file+dir'` 
+ensures that a completed save survives a power failure.
+
+`journal` (bool, default False)
+- If True, each change is appended as a small record to a journal file (`config_file` + `.journal`), and the journal is 
+compacted into the `config_file` by a save or in the background.
+- See Behavior note below.
+
+`journal_compact_size` (int, default 65536)
+- With `journal=True`, a background compaction is started when the journal grows beyond this size in bytes
+
+`storage` (str, default 'text')
+- `'text'` - The `config_file` is saved in the config file format, as by `config_item.write()`
+- `'json'` - The `config_file` is saved as JSON lines, with a version header line
+- See Behavior note below.
+
+`lazy_load` (bool, default False)
+- If True, the `config_file` is memory-mapped and indexed on load, and each param's value is decoded on its first access
+- See Behavior note below.
 
 
 ### Useful class attributes
@@ -1227,6 +2483,14 @@ The current values of all public class attributes may be printed using `print(pe
 - If `persist.save_schedule is not None`, then this is the datetime of the next scheduled save
 - `None` if `persist.save_schedule is None`
 
+`.journal` (bool), `.storage` (str), `.lazy_load` (bool)
+- The values passed in at instantiation
+
+`.changed_keys` (set)
+- The `(section, param)` tuples changed by `setcfg()`, `read_dict()`, `remove_param()`, and `mark_changed()` since 
+the last save, with `section = ''` for top-level params.  `clear()` adds `(section, None)`.
+- Emptied by each save.
+
 
 ### Returns
 - Handle to the `persistent_config()` instance
@@ -1241,17 +2505,70 @@ config data, e.g., `xx = persist.cfg['myvar']` and `persist.cfg['myvar'] = 5`
 1. If the `config_file` is not found then it will be created and the instance attribute `new` will be set to True.
 The path to the parent dir will also be created, as needed.
 1. The `save()` method must be called on controlled termination of your tool script in order to save the most recent data and to 
-terminate any schedule save thread.  Alternately (if not using scheduled saves), you may wish to 
+end any scheduled saves.  Alternately (if not using scheduled saves), you may wish to 
 save after critical data has been written to the config.
+1. **Scheduled saves** - The scheduled saves for all persistent_config instances in the process are run by one shared scheduler thread, 
+which sleeps until the next due save (with no periodic polling), and exits when no saves remain scheduled.  `save(exit=True)` 
+removes the instance from the schedule immediately (waiting only for any in-progress scheduled save of that instance) and then does
+the final save in the calling thread.  A scheduled save that fails is logged as a WARNING, and the instance remains scheduled.
+1. **Dirty tracking** - Changes made through `setcfg()`, `read_dict()`, `remove_param()`, and `clear()` are recorded in `.changed_keys`. 
+A `setcfg()` of a param's current value (same type and value) is not recorded as a change.  Scheduled saves are skipped if 
+`.changed_keys` is empty, avoiding the file rewrite.  Changes made by direct access to the cfg dictionary (eg, `persist.cfg['count'] += 1`) 
+are not tracked, and must be followed by a call to `persist.mark_changed('count')` to be included in the next scheduled save.
+Explicit `save()` calls (and the final `save(exit=True)`) always write the file.
+1. **Journal mode** - With `journal=True`, each `setcfg()`, `read_dict()`, `remove_param()`, `clear()`, and `mark_changed()` immediately 
+appends a one line record of the change to the journal file, so the change survives a tool script crash without rewriting the full 
+`config_file`.  The `fsync` setting is applied to each journal append.  Once the journal exceeds `journal_compact_size` bytes
+a background thread compacts it:  the current config data is written to the `config_file` (always as an atomic write), and
+the journal records that are now included are deleted.  `save()` does the same compaction in the calling thread.  On instantiation 
+(and on each reload by `loadconfig()`) any journal records are replayed over the loaded `config_file` content, recovering changes not yet 
+compacted when the tool script last exited.  Journaled values must be Python literals (str, int, float, bool, None, list, tuple, dict) - 
+a record that cannot be replayed (such as a partial last record after a crash) is logged as a WARNING and skipped.
+Direct changes to the cfg dictionary are journaled only if followed by `mark_changed()`, which journals the param's current value.
+1. **JSON storage** - With `storage='json'` the `config_file` is saved as a `#cjnfuncs persistent_config json 1` header line followed 
+by one JSON line per section (top-level, DEFAULT, then each section), each holding the section name and a JSON object of the section's params.
+Loading and saving large persistent_configs (eg, 100k params) is several times faster than with the config file format, since the content is 
+encoded and decoded by the json module rather than parsed line by line.  Values are saved as their JSON equivalents, so tuples are 
+loaded as lists and non-str dict keys are loaded as strs.  Saving a value that has no JSON equivalent (eg, a set) raises a ConfigError.
+The format of the `config_file` is detected on load, regardless of the `storage` setting, so changing `storage` converts an existing 
+`config_file` on the next save.  A `config_file` with an unsupported json format version raises a ConfigError.
+1. **Lazy loading** - For large, read-mostly persistent_configs, `lazy_load=True` memory-maps the `config_file` and locates each param's 
+line via a hash table index of line offsets.  A param's value is decoded (as for a normal load) on its first `getcfg()` access 
+(including by `bind()` handles), or when changed by `setcfg()` or other methods.  The index is saved in a `<config_file>.index` 
+file alongside the `config_file` on each save (or on the first load), and later loads of the unchanged `config_file` memory-map 
+the index file rather than scanning the `config_file`, so load time and memory use don't grow with the number of params.  
+An index file that doesn't match the `config_file` (by size, modification time, and inode) is rebuilt.  
+Operations on the full content - `save()`, `write()`, `dump()`, and `resolved()` - first decode all remaining values and release the mapped file.  
+Params not yet accessed are not in the cfg dictionary, so direct access (eg, `persist.cfg['count']`) must be preceded by a `getcfg()` for that param.  
+Lazy loading applies to `storage='text'` config files.  A json format `config_file`, or one with `import` or continuation lines, 
+is loaded normally.  While mapped, the `config_file` must only be replaced (eg, by an `atomic_write=True` save in another process), 
+not rewritten in place.  Also, on Windows a mapped file cannot be replaced.
 1. A persistent_config is considered a `config_item` secondary_config - loaded as an independent config, with no changes to the logging setup.
 
 """
-    def __init__(self, config_file, force_new=False, safe_mode=False, save_schedule=None):
+    def __init__(self, config_file, force_new=False, safe_mode=False, save_schedule=None, atomic_write=False, fsync='none', journal=False, journal_compact_size=JOURNAL_COMPACT_SIZE, storage='text', lazy_load=False):
+        if storage not in ('text', 'json'):
+            raise ConfigError (f"storage must be 'text' or 'json', received <{storage}>")
+
         self.safe_mode =        safe_mode
+        self.storage =          storage
+        self.lazy_load =        lazy_load
         self.save_schedule =    save_schedule
+        self.journal =          journal
+        self.journal_compact_size = journal_compact_size
+        self.changed_keys =     set()       # (section, param) changes since the last save
+        self._loading =         False       # loadconfig() in progress - its clear() is not a change
+        self._change_lock =     Lock()      # Serializes a change and its journal record, and journal compaction snapshots
+        self._compact_lock =    Lock()      # Serializes journal compactions
+        self._compacting =      False       # Background journal compaction running
+        self._journal_file =    None        # Open journal file, when not safe_mode
+        self._journal_size =    0
 
         conf_file_mp =          mungePath(config_file, core.tool.data_dir)
         self.config_full_path = conf_file_mp.full_path
+        self._journal_path =    conf_file_mp.full_path.with_name(conf_file_mp.full_path.name + '.journal')
+        self._compacting_path = conf_file_mp.full_path.with_name(conf_file_mp.full_path.name + '.journal.compacting')
+        self._index_path =      conf_file_mp.full_path.with_name(conf_file_mp.full_path.name + '.index')
 
         # Make the target directory
         if self.safe_mode:
@@ -1275,15 +2592,17 @@ save after critical data has been written to the config.
                 self.new =  True
 
         # Load the config
-        super().__init__(config_file=conf_file_mp.full_path, secondary_config=True, safe_mode=safe_mode, missing_ok=force_new)
+        super().__init__(config_file=conf_file_mp.full_path, secondary_config=True, safe_mode=safe_mode, missing_ok=force_new, atomic_write=atomic_write, fsync=fsync)
         configman_logger.debug (f"Loading <{self.config_file}> data")
-        super().loadconfig(force_reload=True, flush_on_reload=True)
+        self.loadconfig(force_reload=True, flush_on_reload=True)
 
         # Set up scheduled saves
         if self.save_schedule:
             self.periodic_save_exit = False
-            self.save_thread = Thread(target=self._scheduled_save, name=f'{config_file} scheduled save')
-            self.save_thread.start()
+            configman_logger.debug (f"Starting <{self.config_file}> scheduled saves")
+            self.next_save_dt = get_next_dt(self.save_schedule)
+            configman_logger.debug (f"Next save <{self.next_save_dt}>")
+            self.save_thread = _scheduler.add(self)
         else:
             self.next_save_dt = None
             self.save_thread = None
@@ -1297,34 +2616,156 @@ save after critical data has been written to the config.
 
     def save(self, exit=False):
         """
-## save (exit=False) - Force an explicit save to the config_file and terminate the scheduled save thread if running
+## save (exit=False) - Force an explicit save to the config_file and end scheduled saves if active
 
 ***persistent_config() class member function***
 
 
 ### Args
 `exit` (bool, default False)
-- If True, informs the scheduled save thread to do a final save and then terminate
-- If False, or no scheduled save thread is running, the persistent_config data is directly written to the `config_file`
+- If True, the instance's scheduled saves are ended, and then a final save is done
+- If False, or no scheduled saves are active, the persistent_config data is directly written to the `config_file`
 
 
 ### Returns
-- None on successful save and scheduled save thread exit (if enabled)
-- Raises ConfigError if the schedule save thread does not terminate within 5 seconds.  The config data has not been saved.
+- None on successful save and scheduled saves ended (if enabled)
+- Raises ConfigError if an in-progress scheduled save does not complete within 5 seconds.  The config data has not been saved.
 - Raises other exceptions, such as `PermissionError` and `OSError`, as appropriate
         """
         if exit  and  self.save_thread:
-            self.periodic_save_exit = True      # _scheduled_save saves on exit
-            self.save_thread.join(timeout=5)
-            if self.save_thread.is_alive():
-                raise ConfigError (f"Failed to save config {self.config_file} - save_thread did not terminate")
+            self.periodic_save_exit = True
+            if not _scheduler.remove(self, timeout=5):
+                raise ConfigError (f"Failed to save config {self.config_file} - scheduled save did not complete")
+            configman_logger.debug (f"Stopping <{self.config_file}> scheduled saves")
+            self.save()
             return
 
         configman_logger.info (f"Saving <{self.config_file}> data")
-        super().write(self.config_full_path)
+        if self.journal:
+            self._compact_journal()
+            return True
+
+        changed_keys =          self.changed_keys
+        self.changed_keys =     set()       # Changes made during the write are tracked for the next save
+        try:
+            super().write(self.config_full_path)
+        except:
+            self.changed_keys |= changed_keys
+            raise
         return True
 
 
+#=====================================================================================
+#=====================================================================================
+#   m a r k _ c h a n g e d
+#=====================================================================================
+#=====================================================================================
+
+    def mark_changed(self, param, section=''):
+        """
+## mark_changed (param, section='') - Record a change made by direct access to the cfg dictionary
+
+***persistent_config() class member function***
+
+Changes made via `setcfg()`, `read_dict()`, `remove_param()`, and `clear()` are tracked automatically.  Call 
+`mark_changed()` after changing the cfg dictionary directly, eg, `persist.cfg['count'] += 1`, so that the change is 
+saved by the next scheduled save.
+
+
+### Args
+`param` (str)
+- Name of the changed param
+
+`section` (str, default '' (top-level))
+- Section of the changed param
+
+
+### Returns
+- None
+        """
+        with self._change_lock:
+            self.changed_keys.add((section, param))
+            if self.journal:
+                self._decode_lazy(param, section)
+                params = self._section_params(section)
+                if param in params:
+                    self._journal_append(('set', section, param, params[param]))
+                else:
+                    self._journal_append(('remove', section, param))
+
+
+#=====================================================================================
+#=====================================================================================
+#   t r a c k e d   c h a n g e s
+#=====================================================================================
+#=====================================================================================
+
+    # Overrides of the config_item methods that change the cfg content, recording the changes in changed_keys, 
+    # and in the journal if enabled.  See config_item for the docs.
+
+    def setcfg(self, param, value=True, types=[], section=''):
+        with self._change_lock:
+            self._decode_lazy(param, section)
+            current = self._section_params(section).get(param, _novalue)
+            super().setcfg(param, value, types=types, section=section)
+            if not isinstance(value, _IMMUTABLE_SCALARS)  or  type(current) is not type(value)  or  current != value:
+                self.changed_keys.add((section, param))     # A container (or other mutable value) may have been changed in place before this setcfg
+                if self.journal:
+                    self._journal_append(('set', section, param, value))
+
+
+    def read_dict(self, param_dict, section=''):
+        with self._change_lock:
+            super().read_dict(param_dict, section=section)
+            self.changed_keys.update((section, key) for key in param_dict)
+            if self.journal:
+                for key in param_dict:
+                    self._journal_append(('set', section, key, param_dict[key]))
+
+
+    def remove_param(self, param, section='', missing_ok=True):
+        with self._change_lock:
+            self._decode_lazy(param, section)
+            existed = param in self._section_params(section)
+            super().remove_param(param, section=section, missing_ok=missing_ok)
+            if existed:
+                self.changed_keys.add((section, param))
+                if self.journal:
+                    self._journal_append(('remove', section, param))
+
+
+    def clear(self, section=''):
+        if self._loading:
+            super().clear(section=section)
+            return
+        with self._change_lock:
+            super().clear(section=section)
+            self.changed_keys.add((section, None))
+            if self.journal:
+                self._journal_append(('clear', section))
+
+
+    def loadconfig(self, *args, **kwargs):
+        self._loading = True
+        try:
+            reloaded = super().loadconfig(*args, **kwargs)
+            if reloaded  and  self.journal:
+                self._replay_journal()
+            return reloaded
+        finally:
+            self._loading = False
+
+
+    def _section_params(self, section):
+        # Private class method
+        # Returns the dictionary holding the section's params (empty if the section doesn't exist)
+        if section == '':
+            return self.cfg
+        if section == 'DEFAULT':
+            return self.defaults
+        return self.cfg.get(section, {})
+
+
 #=====================================================================================
 #=====================================================================================
 #   d e l _ p e r s i s t e n t _ f i l e
@@ -1350,10 +2791,245 @@ This method is normally not called from tool script code.  It is called during i
 - Raises other errors as appropriate
         """
         configman_logger.debug (f"Deleting <{self.config_full_path}> data file")
+        with self._change_lock:
+            self._close_journal()
+            for file_path in (self.config_full_path, self._journal_path, self._compacting_path, self._index_path):
+                if self.safe_mode:
+                    run_with_timeout(file_path.unlink, missing_ok=True, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                else:
+                    file_path.unlink(missing_ok=True)
+            self._journal_size = 0
+
+
+#=====================================================================================
+#=====================================================================================
+#   s t o r a g e   f o r m a t s
+#=====================================================================================
+#=====================================================================================
+
+    def read_string(self, str_blob, isimport=False):
+        # Override of config_item.read_string() that also loads the storage='json' format.  See config_item for the docs.
+        if not str_blob.startswith(JSON_STORAGE_HEADER):
+            return super().read_string(str_blob, isimport=isimport)
+
+        header, _, body = str_blob.partition('\n')
+        version = header[len(JSON_STORAGE_HEADER):].strip()
+        if version != str(JSON_STORAGE_VERSION):
+            raise ConfigError (f"Unsupported persistent_config json format version <{version}> in <{self.config_file}>")
+
+        for line_num, line in enumerate(body.splitlines(), start=2):
+            try:
+                section, params = json.loads(line)
+            except Exception as e:
+                raise ConfigError (f"Malformed json line {line_num} in <{self.config_file}>\n  {type(e).__name__}: {e}") from None
+            if section == '':
+                self.cfg.update(params)
+            elif section == 'DEFAULT':
+                self.defaults.update(params)
+            else:
+                if section not in self._section_names:
+                    self.cfg[section] = {}
+                    self.sections_list.append(section)
+                    self._section_names.add(section)
+                self.cfg[section].update(params)
+        self._content_changed()
+
+
+    def _config_text(self):
+        # Private class method
+        # Override of config_item._config_text() that also formats the storage='json' format
+        if self.storage == 'text':
+            return super()._config_text()
+
+        self._decode_all()
+        top_level = dict(self.cfg)
+        for section in self._section_names:
+            del top_level[section]
+        sections = [['', top_level], ['DEFAULT', self.defaults]]
+        sections.extend([section, self.cfg[section]] for section in self.sections_list)
+        try:
+            lines = [json.dumps(section, ensure_ascii=False) for section in sections]
+        except (TypeError, ValueError) as e:
+            raise ConfigError (f"Failed to save <{self.config_file}> as json\n  {type(e).__name__}: {e}") from None
+        return f"{JSON_STORAGE_HEADER} {JSON_STORAGE_VERSION}\n" + '\n'.join(lines) + '\n'
+
+
+    def _read_config_file(self, config_path):
+        # Private class method
+        # Override of config_item._read_config_file().  With lazy_load, sets up the lazy values of the memory-mapped 
+        # config_file and returns '' (nothing more to load), or returns the content if the file can't be lazy loaded.
+        if not self.lazy_load:
+            return super()._read_config_file(config_path)
+
+        self._decode_all()                                          # Values pending from a prior load of a replaced file
+        config_map, stamp = _map_file(config_path)
+        if config_map is None:
+            return ''
+        lazy_values = _lazy_values.load(config_map, stamp, self._index_path, self.force_str)
+        if lazy_values is None:
+            lazy_values = self._build_lazy_index(config_map, stamp)
+            if lazy_values is None:
+                configman_logger.debug (f"<{self.config_file}> can't be lazy loaded - loading normally")
+                return config_map[:].decode()
+        else:
+            configman_logger.debug (f"Using lazy_load index <{self._index_path}>")
+
+        for section_name in lazy_values.sections[2:]:
+            if section_name not in self._section_names:
+                self.cfg[section_name] = {}
+                self.sections_list.append(section_name)
+                self._section_names.add(section_name)
+        lazy_values.cfg =       self.cfg
+        lazy_values.defaults =  self.defaults
+        self._lazy_values =     lazy_values
+        return ''
+
+
+    def _write_text(self, cfg_list, outfile, atomic):
+        # Private class method
+        # Override of config_item._write_text() that also saves the lazy_load index for the new config_file content
+        super()._write_text(cfg_list, outfile, atomic)
+        if self.lazy_load  and  outfile == self.config_full_path:
+            config_map, stamp = _map_file(outfile)
+            if config_map is not None:
+                self._build_lazy_index(config_map, stamp)
+
+
+    def _build_lazy_index(self, config_map, stamp):
+        # Private class method
+        # Returns the _lazy_values for the config_file content, and saves the index file for use by later loads.
+        # Returns None if the content can't be lazy loaded.  Failures to save the index file are logged and otherwise ignored.
+        if config_map[:len(JSON_STORAGE_HEADER)] == JSON_STORAGE_HEADER.encode()  or  lazy_continuation_re.search(config_map):
+            return None
+        lazy_values, index_content = _lazy_values.build(config_map, stamp, self.force_str)
+        if lazy_values is not None:
+            try:
+                _write_file(self._index_path, index_content, atomic=True)
+                configman_logger.debug (f"Saved lazy_load index <{self._index_path}>")
+            except Exception as e:
+                configman_logger.info (f"Failed to save lazy_load index <{self._index_path}>\n  {type(e).__name__}: {e}")
+        return lazy_values
+
+
+#=====================================================================================
+#=====================================================================================
+#   j o u r n a l
+#=====================================================================================
+#=====================================================================================
+
+    def _journal_append(self, record):
+        # Private class method
+        # Appends a change record to the journal, and starts a background compaction if the journal is oversize.
+        # Called with _change_lock held.
+        line = repr(record) + '\n'
         if self.safe_mode:
-            run_with_timeout(self.config_full_path.unlink, missing_ok=True, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+            run_with_timeout(_append_file, self._journal_path, line, self.fsync, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
         else:
-            self.config_full_path.unlink(missing_ok=True)
+            if self._journal_file is None:
+                self._journal_file = open(self._journal_path, 'a')
+                if self.fsync == 'file+dir':
+                    _fsync_dir(self._journal_path.parent)
+            self._journal_file.write(line)
+            self._journal_file.flush()
+            if self.fsync != 'none':
+                os.fsync(self._journal_file.fileno())
+        self._journal_size += len(line)
+
+        if self._journal_size > self.journal_compact_size  and  not self._compacting:
+            self._compacting = True
+            Thread(target=self._background_compact, name=f'{self.config_file} journal compaction').start()
+
+
+    def _close_journal(self):
+        # Private class method
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+
+
+    def _compact_journal(self):
+        # Private class method
+        # Writes the current config data to the config_file and deletes the journal records that it includes.
+        # The journal is moved aside while the config_file is written, so changes made meanwhile go to a new journal.
+        # If the write fails (or the tool script crashes) the moved-aside journal is replayed on the next load, and 
+        # is merged with the new journal by the next compaction.
+        with self._compact_lock:
+            with self._change_lock:
+                self._close_journal()
+                if self.safe_mode:
+                    run_with_timeout(_rotate_journal, self._journal_path, self._compacting_path, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                else:
+                    _rotate_journal(self._journal_path, self._compacting_path)
+                self._journal_size =    0
+                cfg_list =              self._config_text()
+                changed_keys =          self.changed_keys
+                self.changed_keys =     set()
+            try:
+                self._write_text(cfg_list, self.config_full_path, atomic=True)
+            except:
+                with self._change_lock:
+                    self.changed_keys |= changed_keys
+                raise
+            if self.safe_mode:
+                run_with_timeout(self._compacting_path.unlink, missing_ok=True, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+            else:
+                self._compacting_path.unlink(missing_ok=True)
+            configman_logger.debug (f"Compacted <{self.config_file}> journal")
+
+
+    def _background_compact(self):
+        # Private class method
+        try:
+            self._compact_journal()
+        except Exception as e:
+            configman_logger.warning (f"Journal compaction of <{self.config_file}> failed - will retry at the next compaction\n  {type(e).__name__}: {e}")
+        finally:
+            self._compacting = False
+
+
+    def _replay_journal(self):
+        # Private class method
+        # Applies the journal records (including those of an incomplete compaction) to the loaded config data.
+        # Called by loadconfig() after a reload.
+        nrecords = 0
+        for file_path in (self._compacting_path, self._journal_path):
+            try:
+                if self.safe_mode:
+                    journal_text = run_with_timeout(_read_if_exists, file_path, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                else:
+                    journal_text = _read_if_exists(file_path)
+            except Exception as e:
+                raise ConfigError (f"Failed to read journal file {file_path}\n  {type(e).__name__}: {e}")
+            if file_path == self._journal_path:
+                self._journal_size = len(journal_text)
+            if journal_text  and  not journal_text.endswith('\n'):     # Terminate a partial last record, so that it isn't joined to the next append
+                if self.safe_mode:
+                    run_with_timeout(_append_file, file_path, '\n', self.fsync, rwt_ntries=RWT_NTRIES, rwt_timeout=RWT_TIMEOUT)
+                else:
+                    _append_file(file_path, '\n', self.fsync)
+
+            for line in journal_text.splitlines():
+                try:
+                    record = ast.literal_eval(line)
+                    op, section = record[0], record[1]
+                    if op == 'set':
+                        config_item.setcfg(self, record[2], record[3], section=section)
+                        self.changed_keys.add((section, record[2]))
+                    elif op == 'remove':
+                        config_item.remove_param(self, record[2], section=section)
+                        self.changed_keys.add((section, record[2]))
+                    elif op == 'clear':
+                        if section in ('', 'DEFAULT')  or  section in self._section_names:
+                            config_item.clear(self, section)
+                        self.changed_keys.add((section, None))
+                    else:
+                        raise ValueError (f"Unknown journal operation <{op}>")
+                    nrecords += 1
+                except Exception as e:
+                    configman_logger.warning (f"Skipped unreadable journal record in <{file_path}>:  <{line}>\n  {type(e).__name__}: {e}")
+
+        if nrecords:
+            configman_logger.info (f"Replayed {nrecords} journal records for <{self.config_file}>")
 
 
 #=====================================================================================
@@ -1364,26 +3040,18 @@ This method is normally not called from tool script code.  It is called during i
 
     def _scheduled_save(self):
         # Private class method
-        # loop time is 0.2s:  Longest time to respond to periodic_save_exit + any time required for the file write
+        # Called by the _scheduler thread when next_save_dt is reached.  Saves if changed, and sets the next_save_dt.
 
-        configman_logger.debug (f"Starting <{self.config_file}> scheduled save thread")
+        if self.changed_keys:
+            try:
+                self.save()
+            except Exception as e:
+                configman_logger.warning (f"Scheduled save of <{self.config_file}> failed - will retry at the next scheduled save\n  {type(e).__name__}: {e}")
+        else:
+            configman_logger.debug (f"No changes to <{self.config_file}> data - scheduled save skipped")
         self.next_save_dt = get_next_dt(self.save_schedule)
         configman_logger.debug (f"Next save <{self.next_save_dt}>")
 
-        while 1:
-            if self.periodic_save_exit:
-                configman_logger.debug (f"Stopping <{self.config_file}> scheduled save thread")
-                self.save()
-                # time.sleep(1)
-                sys.exit(0)         # Exit the scheduled save thread
-
-            if datetime.datetime.now() > self.next_save_dt:
-                self.save()
-                self.next_save_dt = get_next_dt(self.save_schedule)
-                configman_logger.debug (f"Next save <{self.next_save_dt}>")
-
-            time.sleep (0.2)
-
 
 #=====================================================================================
 #=====================================================================================
@@ -1395,9 +3063,395 @@ This method is normally not called from tool script code.  It is called during i
         repr_str  =     super().__repr__()
         repr_str +=     f".new                    :  {self.new}\n"
         repr_str +=     f".save_schedule          :  {self.save_schedule}\n"
+        repr_str +=     f".journal                :  {self.journal}\n"
+        repr_str +=     f".storage                :  {self.storage}\n"
+        repr_str +=     f".lazy_load              :  {self.lazy_load}\n"
+        repr_str +=     f".changed_keys           :  {sorted(self.changed_keys, key=str)}\n"
         if self.save_schedule:
             repr_str += f".save_thread            :  {self.save_thread}\n"
             repr_str += f".next_save_dt           :  {self.next_save_dt}\n"
             repr_str += f".periodic_save_exit     :  {self.periodic_save_exit}\n"
         return repr_str
-    
\ No newline at end of file
+    
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   s h a r e d _ c o n f i g
+#=====================================================================================
+#=====================================================================================
+
+class shared_config (config_item):
+    """
+## Class shared_config (name, tolerate_missing=False) - Attach to a config published to shared memory by publish_shared()
+
+***`shared_config` is a derived class of `config_item`***
+
+A process that loads a config once (eg, a parent process) publishes it with `my_config.publish_shared(name)`, and other 
+processes (eg, forked worker processes) attach to it with `shared_config(name)` rather than each parsing the config file.
+The published segment is memory-mapped read-only and shared by all attached processes.  A param's value is looked up 
+via the published hash table index and decoded on its first `getcfg()` access, and is then held in the process' `cfg` 
+dictionary.  Params that are never accessed cost nothing in the attached process.
+
+`shared_config` requires the `posix_ipc` module (Linux only).
+
+
+### Args
+`name` (str)
+- The shared memory name passed to `publish_shared()`
+
+`tolerate_missing` (bool, default False)
+- If True, a config not yet published is attached by a later `loadconfig()` call, rather than raising a ConfigError.
+
+
+### Useful class attributes
+Since `shared_config` is a derived class of `config_item`, all of `config_item`'s methods and instance attributes are also available.
+
+`.shared_name` (str)
+- The posix_ipc shared memory name, with a leading `/`
+
+`.generation` (int)
+- The generation number of the attached content (0 if not yet attached)
+
+
+### Returns
+- Handle to the `shared_config()` instance
+- A ConfigError is raised if the config has not been published (and `tolerate_missing=False`), or posix_ipc is not available
+
+
+### Behaviors and rules
+1. **Reloads** - Call `loadconfig()` (eg, on each pass of a service loop) to switch to the latest published content.  
+`loadconfig()` reads the generation number from the shared control segment, and returns `0` with no further work if it 
+is unchanged.  Otherwise the new generation's segment is attached and `1` is returned.  The switch-over is done as for 
+`config_item(atomic_reload=True)`, so threads calling `getcfg()` see either the prior or the new content.
+
+1. Changes made to a shared_config (`setcfg()`, `read_dict()`, etc.) are local to the process, and are discarded 
+when a new generation is attached.
+
+1. Params not yet accessed are not in the `cfg` dictionary, so direct access (eg, `shared.cfg['count']`) must be preceded 
+by a `getcfg()` for that param.  `resolved()` and `dump()` decode all params.
+
+1. See `tests/bench-configman.py` benchmark 12 for the attach time and memory use compared to each process loading the config file.
+    """
+
+    __slots__ = ('shared_name', 'generation', '_control_map')
+
+    def __init__(self, name, tolerate_missing=False):
+        if posix_ipc is None:
+            raise ConfigError ("shared_config requires the posix_ipc module (Linux only)")
+        super().__init__(secondary_config=True, remap_logdirbase=False)
+        self.shared_name =  _shared_name(name)
+        self.config_file =  self.shared_name
+        self.generation =   0
+        self._control_map = None
+        self.loadconfig(tolerate_missing=tolerate_missing)
+
+
+    def loadconfig(self, force_reload=False, tolerate_missing=False):
+        """
+## loadconfig (force_reload=False, tolerate_missing=False) - Attach to the latest published content
+
+***shared_config() class member function***
+
+### Args
+`force_reload` (bool, default False)
+- Reattach even if the generation number is unchanged, and reopen the control segment (eg, after the publisher 
+called `unpublish_shared()` and published again)
+
+`tolerate_missing` (bool, default False)
+- Return `-1` rather than raising a ConfigError if the config is not currently published
+
+
+### Returns
+- `1` if new content was attached
+- `0` if the published generation is unchanged
+- `-1` if the config is not published and `tolerate_missing=True`, else a ConfigError is raised
+        """
+
+        for _ in range(SHARED_ATTACH_TRIES):
+            if self._control_map is None  or  force_reload:
+                try:
+                    control = posix_ipc.SharedMemory(self.shared_name, flags=0, read_only=True)
+                except posix_ipc.ExistentialError:
+                    return self._not_published(tolerate_missing)
+                self._control_map = mmap.mmap(control.fd, SHARED_CONTROL.size, prot=mmap.PROT_READ)
+                control.close_fd()
+
+            magic, generation = SHARED_CONTROL.unpack_from(self._control_map)
+            if magic != SHARED_CONTROL_MAGIC:
+                return self._not_published(tolerate_missing)
+            if generation == self.generation  and  not force_reload:
+                return 0
+
+            try:
+                segment = posix_ipc.SharedMemory(f"{self.shared_name}.{generation}", flags=0, read_only=True)
+            except posix_ipc.ExistentialError:
+                force_reload = True                             # Replaced by a concurrent publish, or unpublished
+                continue
+            segment_map = mmap.mmap(segment.fd, segment.size, prot=mmap.PROT_READ)
+            segment.close_fd()
+            self._attach(segment_map, generation)
+            return 1
+        return self._not_published(tolerate_missing)
+
+
+    def _attach(self, segment_map, generation):
+        # Private class method
+        # Switch over to the content of a published segment, as for an atomic_reload
+        magic, segment_generation, content_length, index_length = SHARED_SEGMENT_HEADER.unpack_from(segment_map)
+        content_start = SHARED_SEGMENT_HEADER.size
+        index_start =   content_start + content_length
+        lazy_values = None
+        if magic == SHARED_SEGMENT_MAGIC  and  segment_generation == generation:
+            segment_view = memoryview(segment_map)
+            lazy_values = _lazy_values.from_index(segment_view[content_start:index_start], (generation, content_length, 0),
+                                                  segment_view[index_start:index_start + index_length], False)
+        if lazy_values is None:
+            raise ConfigError (f"Shared config <{self.shared_name}> generation {generation} segment is not valid")
+
+        staged = self._staging_item(copy_content=False)
+        for section_name in lazy_values.sections[2:]:
+            staged.cfg[section_name] = {}
+            staged.sections_list.append(section_name)
+            staged._section_names.add(section_name)
+        lazy_values.cfg =       staged.cfg
+        lazy_values.defaults =  staged.defaults
+        staged._lazy_values =   lazy_values
+        self._publish(staged)
+        self.generation =   generation
+        self.loaded =       True
+        configman_logger.info (f"Shared config  <{self.shared_name}>  generation {generation} attached")
+
+
+    def _not_published(self, tolerate_missing):
+        # Private class method
+        self._control_map = None
+        if tolerate_missing:
+            configman_logger.info (f"Shared config  <{self.shared_name}>  not currently published")
+            return -1
+        raise ConfigError (f"Shared config <{self.shared_name}> is not published")
+
+
+    def __repr__(self):
+        repr_str  =     super().__repr__()
+        repr_str +=     f".shared_name            :  {self.shared_name}\n"
+        repr_str +=     f".generation             :  {self.generation}\n"
+        return repr_str
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   _ l a z y _ v a l u e s
+#=====================================================================================
+#=====================================================================================
+
+LAZY_INDEX_MAGIC =  b'CJNLAZY1'
+LAZY_INDEX_HEADER = struct.Struct('<8sQQQQQ')   # magic, config file size, mtime_ns, and inode, table capacity, sections json length
+LAZY_INDEX_ENTRY =  struct.Struct('<IIQ')       # param name crc32 (seeded with the section number), section number, line offset + 1 (0 if empty)
+
+class _lazy_values():
+    # Private class
+    # The not yet decoded param values of a memory-mapped config file, for persistent_config lazy_load.  Param lines are
+    # found via an open addressing hash table of line offsets.  The table is saved in an index file alongside the config file,
+    # and is memory-mapped by later loads of the same config file content, so neither the load time nor the memory use
+    # grows with the number of params.  The section names are saved in the index file as a json list, with '' and 'DEFAULT' first.
+
+    def __init__(self, config_map, sections, table, table_offset, capacity, force_str):
+        self.config_map =       config_map
+        self.sections =         sections
+        self.section_numbers =  {name: number for number, name in enumerate(sections)}
+        self.table =            table
+        self.table_offset =     table_offset
+        self.capacity =         capacity
+        self.force_str =        force_str
+        self.cfg =              None        # The cfg and defaults dictionaries that values are decoded into, set by the owner
+        self.defaults =         None
+        self.discarded =        set()       # (section, param) decoded or changed since the load
+        self.discarded_sections = set()     # Sections cleared since the load
+
+    @classmethod
+    def load(cls, config_map, stamp, index_path, force_str):
+        # Returns the _lazy_values for the saved index file, or None if the index file is missing, unreadable, or
+        # was built for other config file content.
+        try:
+            with open(index_path, 'rb') as ifile:
+                index_map = mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            return None
+        return cls.from_index(config_map, stamp, index_map, force_str)
+
+    @classmethod
+    def from_index(cls, config_map, stamp, index_map, force_str):
+        # Returns the _lazy_values for the index content (a buffer, eg, an mmap), or None if the index content is not
+        # valid or was built for other config content.  The config_map and index_map buffers are used in place.
+        try:
+            magic, size, mtime_ns, inode, capacity, sections_length = LAZY_INDEX_HEADER.unpack_from(index_map)
+            if magic != LAZY_INDEX_MAGIC  or  (size, mtime_ns, inode) != stamp:
+                return None
+            table_offset = LAZY_INDEX_HEADER.size + sections_length
+            sections = json.loads(bytes(index_map[LAZY_INDEX_HEADER.size:table_offset]))
+            if len(index_map) != table_offset + capacity * LAZY_INDEX_ENTRY.size:
+                return None
+        except Exception:
+            return None
+        return cls(config_map, sections, index_map, table_offset, capacity, force_str)
+
+    @classmethod
+    def build(cls, config_map, stamp, force_str):
+        # Returns the _lazy_values for the config file content, and the index file content.
+        # Returns (None, None) if the content has import lines, which can't be lazy loaded.
+        sections =          ['', 'DEFAULT']
+        section_numbers =   {'': 0, 'DEFAULT': 1}
+        section_number =    0
+        lines =             []
+        for out in lazy_line_re.finditer(config_map):
+            param_name = out.group(1)
+            if param_name.startswith(b'['):                         # Section line
+                line = out.group(0).decode().strip()
+                section_out = section_name_re.match(line)
+                if not section_out:
+                    raise ConfigError (f"Malformed section line <{line}>")
+                section_name = section_out.group(1).strip()
+                section_number = section_numbers.get(section_name)
+                if section_number is None:
+                    section_number = section_numbers[section_name] = len(sections)
+                    sections.append(section_name)
+            elif param_name[:6].lower() == b'import':
+                return None, None
+            else:
+                lines.append((param_name, section_number, out.start()))
+
+        capacity = 8
+        while capacity < 2 * len(lines):
+            capacity *= 2
+        mask =      capacity - 1
+        table =     bytearray(capacity * LAZY_INDEX_ENTRY.size)
+        for param_name, section_number, line_offset in lines:
+            crc = zlib.crc32(param_name, section_number)
+            slot = crc & mask
+            while 1:
+                slot_crc, slot_section, slot_offset = LAZY_INDEX_ENTRY.unpack_from(table, slot * LAZY_INDEX_ENTRY.size)
+                if slot_offset == 0:
+                    break
+                if slot_crc == crc  and  slot_section == section_number  and  \
+                        lazy_line_re.match(config_map, slot_offset - 1).group(1) == param_name:
+                    break                                           # Repeated param - the later line wins, as for read_string()
+                slot = (slot + 1) & mask
+            LAZY_INDEX_ENTRY.pack_into(table, slot * LAZY_INDEX_ENTRY.size, crc, section_number, line_offset + 1)
+
+        sections_json = json.dumps(sections).encode()
+        header = LAZY_INDEX_HEADER.pack(LAZY_INDEX_MAGIC, *stamp, capacity, len(sections_json))
+        return cls(config_map, sections, table, 0, capacity, force_str), header + sections_json + table
+
+    def lookup(self, section, param):
+        # Returns the decoded value of param in section, or _novalue if not in the lazy values
+        section_number = self.section_numbers.get(section)
+        if section_number is None  or  (section, param) in self.discarded  or  section in self.discarded_sections:
+            return _novalue
+        param_name =    param.encode()
+        crc =           zlib.crc32(param_name, section_number)
+        mask =          self.capacity - 1
+        slot =          crc & mask
+        while 1:
+            slot_crc, slot_section, slot_offset = LAZY_INDEX_ENTRY.unpack_from(self.table, self.table_offset + slot * LAZY_INDEX_ENTRY.size)
+            if slot_offset == 0:
+                return _novalue
+            if slot_crc == crc  and  slot_section == section_number:
+                out = lazy_line_re.match(self.config_map, slot_offset - 1)
+                if out.group(1) == param_name:
+                    return self._decode(out.group(2))
+            slot = (slot + 1) & mask
+
+    def discard(self, section, param):
+        self.discarded.add((section, param))
+
+    def discard_section(self, section):
+        self.discarded_sections.add(section)
+
+    def items(self):
+        # Yields (section, param, decoded value) for all params not discarded
+        for slot in range(self.capacity):
+            _, section_number, slot_offset = LAZY_INDEX_ENTRY.unpack_from(self.table, self.table_offset + slot * LAZY_INDEX_ENTRY.size)
+            if slot_offset:
+                section = self.sections[section_number]
+                out =   lazy_line_re.match(self.config_map, slot_offset - 1)
+                param = out.group(1).decode()
+                if (section, param) not in self.discarded  and  section not in self.discarded_sections:
+                    yield section, param, self._decode(out.group(2))
+
+    def copy(self, cfg, defaults):
+        # Returns a copy for decoding into other cfg and defaults dictionaries.  The mapped file and index are shared.
+        lazy_copy = _lazy_values(self.config_map, self.sections, self.table, self.table_offset, self.capacity, self.force_str)
+        lazy_copy.cfg =                 cfg
+        lazy_copy.defaults =            defaults
+        lazy_copy.discarded =           set(self.discarded)
+        lazy_copy.discarded_sections =  set(self.discarded_sections)
+        return lazy_copy
+
+    def _decode(self, value_portion):
+        return _decode_value(_strip_comment(value_portion.decode().strip()), self.force_str)
+
+
+#=====================================================================================
+#=====================================================================================
+#   C l a s s   _ s a v e _ s c h e d u l e r
+#=====================================================================================
+#=====================================================================================
+
+class _save_scheduler():
+    # Private class
+    # Runs the scheduled saves of all persistent_config instances on one thread.  Instances are held in a heap
+    # ordered by next_save_dt.  The thread waits on the Condition until the earliest save is due (or an instance is
+    # added or removed), and exits when the heap is empty.
+
+    def __init__(self):
+        self.cond =         Condition()
+        self.heap =         []                  # (next_save_dt, sequence number, persistent_config instance)
+        self.sequence =     itertools.count()   # Orders instances with the same next_save_dt
+        self.thread =       None
+        self.saving =       None                # Instance being saved by the scheduler thread
+
+    def add(self, persist):
+        # Schedule persist at its next_save_dt.  Returns the scheduler thread.
+        with self.cond:
+            heapq.heappush(self.heap, (persist.next_save_dt, next(self.sequence), persist))
+            if self.thread is None:
+                self.thread = Thread(target=self._run, name='persistent_config scheduled saves')
+                self.thread.start()
+            self.cond.notify()
+            return self.thread
+
+    def remove(self, persist, timeout):
+        # Unschedule persist, waiting for any in-progress scheduled save of persist to complete.
+        # Returns False if the in-progress save did not complete within timeout seconds.
+        with self.cond:
+            self.heap = [entry for entry in self.heap if entry[2] is not persist]
+            heapq.heapify(self.heap)
+            self.cond.notify()
+            return self.cond.wait_for(lambda: self.saving is not persist, timeout=timeout)
+
+    def _run(self):
+        with self.cond:
+            while self.heap:
+                next_save_dt, _, persist = self.heap[0]
+                wait_time = (next_save_dt - datetime.datetime.now()).total_seconds()
+                if wait_time > 0:
+                    self.cond.wait(timeout=min(wait_time, SAVE_SCHEDULER_MAX_WAIT))
+                    continue
+
+                heapq.heappop(self.heap)
+                self.saving = persist
+                self.cond.release()         # Don't block add() and remove() calls during the save
+                try:
+                    persist._scheduled_save()
+                except Exception as e:
+                    configman_logger.warning (f"Scheduled save of <{persist.config_file}> failed\n  {type(e).__name__}: {e}")
+                finally:
+                    self.cond.acquire()
+                    self.saving = None
+                    self.cond.notify_all()
+                if not persist.periodic_save_exit:
+                    heapq.heappush(self.heap, (persist.next_save_dt, next(self.sequence), persist))
+            self.thread = None
+
+_scheduler = _save_scheduler()      # Shared by all persistent_config instances
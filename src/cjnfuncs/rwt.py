@@ -12,8 +12,14 @@ import time
 import os
 import sys
 import multiprocessing
+import multiprocessing.connection
+import pickle
 import subprocess
 import traceback
+import random
+import threading
+import queue
+import asyncio
 
 # Logging events within this module are at the DEBUG level.  With this module's child logger set to
 # a minimum of WARNING level by default, then logging from this module is effectively disabled.  To enable
@@ -22,11 +28,16 @@ import traceback
 rwt_logger = logging.getLogger('cjnfuncs.rwt')
 rwt_logger.setLevel(logging.WARNING)
 
+RWT_MODES =             ('process', 'pool', 'thread')
+RWT_POOL_MAX_IDLE =     4       # Idle rwt_mode='pool' workers retained for reuse.  Workers beyond this number are stopped when idle.
+RWT_THREAD_MAX =        8       # Max rwt_mode='thread' threads, including abandoned threads still running.
+RWT_MAP_NWORKERS =      16      # Default run_with_timeout_map() concurrent worker processes.
+
 
 def run_with_timeout(func, *args, **kwargs):
     pass
     """
-## run_with_timeout (func, *args, **kwargs, rwt_timeout=1.0, rwt_ntries=1, rwt_kill=True) - Run a function in a separate process with an enforced timeout.
+## run_with_timeout (func, *args, **kwargs, rwt_timeout=1.0, rwt_ntries=1, rwt_kill=True, rwt_mode='process', rwt_retry=None, rwt_breaker=None, rwt_breaker_key=None) - Run a function in a separate process with an enforced timeout.
 
 `run_with_timeout` uses the multiprocessing module, and works by running the specified `func` in a managed 
 external process that can be reliably killed on timeout.
@@ -52,17 +63,34 @@ On timeout, the process is killed (by default) and a TimeoutError exception is r
 
 `rwt_ntries` additional kwarg (int, default 1)
 - Number of attempts to run `func` if rwt_timeout is exceeded or `func` raises an exception
+- Retries are made immediately with the same `rwt_timeout`.  See `rwt_retry` for spaced retries with growing timeouts.
 
 `rwt_kill` additional kwarg (bool, default True)
 - If True, on timeout kill the process
 - If False, on timeout let the process continue to run.  It will be orphaned - see Behavior notes, below.
 
+`rwt_mode` additional kwarg (str, default 'process')
+- `'process'` - `func` is run in a new process for each call (and each try)
+- `'pool'` - `func` is run in a reused process from a pool of worker processes.  See Behavior notes, below.
+- `'thread'` - `func` is run on a thread in this process, which is abandoned on timeout.  See Behavior notes, below.
+
+`rwt_retry` additional kwarg (rwt_retry instance, default None)
+- Retry policy with backoff delays, growing timeouts, and a total deadline.  See `rwt_retry`, below.
+- May not be used with `rwt_ntries`
+
+`rwt_breaker` additional kwarg (rwt_breaker instance, default None)
+- Circuit breaker that short-circuits calls after repeated timeouts.  See `rwt_breaker`, below.
+
+`rwt_breaker_key` additional kwarg (hashable, default `func`'s qualified name)
+- The key tracked by `rwt_breaker`, eg, a network mount point
+
 
 ### Returns
 - With no timeout or exception, returns the value returned from `func`
 - Any exception raised by `func`
 - If rwt_timeout is exceeded, returns TimeoutError
-- Exceptions raised for invalid rwt_timeout, rwt_ntries, or rwt_kill values
+- CircuitOpenError (a subclass of TimeoutError) if the call was short-circuited by `rwt_breaker`
+- Exceptions raised for invalid rwt_timeout, rwt_ntries, rwt_kill, rwt_mode, rwt_retry, or rwt_breaker values
 
 
 ### Behaviors and rules
@@ -79,15 +107,700 @@ The pids of the orphaned processes are listed in the TimeoutError exception when
 be captured for explicitly killing of any unterminated orphaned processes before exiting the tool script, eg: 
 `os.kill (pid, signal.OSKILL)`.  See `rwt.md` for a working example.
 Note that if `rwt_ntries` is greater than 1 and `rwt_kill=False`, then potentially several processes may 
-be created and orphaned, all attempting to doing the same work.
+be created and orphaned, all attempting to doing the same work.  `rwt_retry` with a `deadline` and `rwt_breaker` limit this.
 - On Windows, debug logging messages from the run_with_timeout internal `worker()` function (which calls `func`) are 
 erratically produced, and not produced if `func` raises an exception.  Logging from within `func` can also be
 erratic.  Raised exceptions operate normally.
+- **Worker pool** - With `rwt_mode='pool'`, calls are run by worker processes that are started once and reused, avoiding the 
+process creation cost of each call (a fork on Linux, and a full interpreter spawn on Windows).  Only a worker that times out 
+is killed (or orphaned with `rwt_kill=False`), and it is replaced by a new worker for the following calls.  Up to 
+`RWT_POOL_MAX_IDLE` (4) idle workers are retained, and more are started as needed for concurrent calls from multiple threads.  
+Workers may be pre-started (eg, before the tool script starts other threads) with `rwt_pool_start()`, and are 
+stopped by `rwt_pool_stop()` or at exit.  Since `func`, its args, and its return value are passed to and from the
+worker by pickling, they must be picklable (eg, `func` can't be a lambda or a nested function), and `func` sees the module
+globals as of when the worker was started.  Pool workers are daemon processes, so `func` can't itself start processes 
+(including by a nested `run_with_timeout()` call).  See `tests/bench-rwt.py` benchmark 1 for the call rate with and without the pool.
+- **Thread mode** - With `rwt_mode='thread'`, `func` is run on a daemon thread from a pool of up to `RWT_THREAD_MAX` (8) threads 
+in the calling process, with no process creation or pickling.  This mode is intended for calls that block in the kernel, such 
+as `Path.exists()`, `is_file()`, or `os.stat()` on a possibly hung network mount, and adds only microseconds to a fast call.
+A thread can't be killed, so on timeout the thread is abandoned and continues to run `func` to completion (or forever).  `rwt_kill` 
+is ignored, and the TimeoutError message notes `(thread abandoned)`.  Abandoned threads count against `RWT_THREAD_MAX`, so 
+if enough calls hang, following calls wait for a free thread within their `rwt_timeout` and time out.  `rwt_thread_stats()` returns
+the abandoned thread counts.  Since `func` runs in the calling process, changes it makes to module state are retained, and exceptions 
+are raised as the original exception object.  Don't use this mode for CPU-bound calls, which hold the GIL.
 """
 
     #--------- Top_level ---------
 def run_with_timeout(func, *args, **kwargs):
 
+    _timeout, _ntries, _kill, _mode, _retry, _breaker, _key = _rwt_switches('run_with_timeout', RWT_MODES, func, args, kwargs)
+    pid_list = []
+
+    if _mode != 'thread':
+        kwargs['rwt_loglevel'] = rwt_logger.level
+        kwargs['root_loglevel'] = logging.getLogger().level
+
+    timeout = _retry.first_timeout(_timeout)
+    start = time.monotonic()
+    ntry = 0
+    while True:
+
+        if _ntries > 1:
+            rwt_logger.debug (f"T0  - Try {ntry}")
+        if _breaker:
+            _breaker.check(_key, func)
+
+        if _mode == 'thread':
+            status, payload = _threads.run(func, args, kwargs, timeout)
+            if status is None:
+                status = "timeout"
+        elif _mode == 'pool':
+            status, payload = _pool.run(func, args, kwargs, timeout)
+        else:
+            status, payload = _try_process(func, args, kwargs, timeout)
+        if status == "result":
+            if _breaker:
+                _breaker.success(_key)
+            return payload
+
+        exception = _failed_try(status, payload, func, timeout, _mode, _kill, pid_list, _breaker, _key)
+        plan = _retry.next_try(ntry, timeout, exception, time.monotonic() - start)
+        if status == "timeout"  and  _kill  and  _mode != 'thread':
+            _kill_worker(payload, plan is None)
+        if plan is None:
+            if exception is None:                           # Nothing returned from the last try
+                return None
+            raise exception
+
+        timeout, delay = plan
+        if delay > 0:
+            rwt_logger.debug (f"T8  - Retry in {delay:.3f} seconds, rwt_timeout {timeout}")
+            time.sleep(delay)
+        ntry += 1
+
+
+def _try_process(func, args, kwargs, timeout):
+    # Private module function
+    # Run one try of func in a new worker process.  Returns (status, payload):
+    #   ("result", value), ("exception", exception), ("timeout", worker_p), or (None, None) if nothing was returned.
+    rwt_logger.debug (f"T1  - Starting worker_p")
+    worker_to_toplevel_q = multiprocessing.get_context().Queue()
+    worker_p = multiprocessing.Process(target=worker, args=(worker_to_toplevel_q, func, args, kwargs), daemon=False, name=f'rwt_{func}')
+    worker_p.start()
+    worker_p.join(timeout=timeout)
+
+    if worker_p.is_alive():
+        return "timeout", worker_p
+    rwt_logger.debug (f"T2  - worker_p exited before rwt_timeout")
+    return _worker_result(worker_to_toplevel_q)
+
+
+def _worker_result(result_q):
+    # Private module function
+    # Get the returned result or exception from an exited worker_p
+    try:
+        status, payload = result_q.get(timeout=0.05)
+    except Exception as e:
+        rwt_logger.debug (f"T7  - Nothing returned from runner")
+        return None, None
+    rwt_logger.debug (f"T3  - <{status}> msg received from worker_p")
+    if status == "exception":
+        payload = _rebuild_exception(payload)
+    return status, payload
+
+
+def _failed_try(status, payload, func, timeout, mode, kill, pid_list, breaker, key):
+    # Private module function
+    # Returns the exception for a failed try, or None if nothing was returned.  Timeouts are recorded as breaker failures.
+    if status == "exception":
+        if breaker:
+            breaker.success(key)                            # func ran and responded
+        return payload
+    if status != "timeout":
+        return None
+
+    if breaker:
+        breaker.failure(key)
+    if mode == 'thread':
+        return TimeoutError (f"Function <{func.__name__}> timed out after {timeout} seconds (thread abandoned)")
+    if kill:
+        return TimeoutError (f"Function <{func.__name__}> timed out after {timeout} seconds (killed)")
+    pid_list.append(str(payload.pid))
+    return TimeoutError (f"Function <{func.__name__}> timed out after {timeout} seconds (not killed) orphaned pids: {' '.join(pid_list)}")
+
+
+async def run_with_timeout_async(func, *args, **kwargs):
+    """
+## run_with_timeout_async (func, *args, **kwargs, rwt_timeout=1.0, rwt_ntries=1, rwt_kill=True, rwt_retry=None, rwt_breaker=None, rwt_breaker_key=None) - Awaitable run_with_timeout() for asyncio applications
+
+`func` is run in a separate process, as with `run_with_timeout()`, but the wait for the process to exit is done 
+on the running event loop rather than blocking it.  Other coroutines continue to run, and many `run_with_timeout_async()`
+calls may be in flight at once (eg, via `asyncio.gather()`).
+
+### Args
+Same as `run_with_timeout()`.  `rwt_mode`, if given, must be `'process'`.
+
+### Returns
+- Same as `run_with_timeout()`
+
+### Behaviors and rules
+- On Linux the worker process exit is awaited via a pidfd (`os.pidfd_open()`, kernel 5.3+) registered with the event loop.
+On other POSIX platforms the multiprocessing process sentinel is used.  If the event loop doesn't support file descriptor
+readers (eg, the Windows ProactorEventLoop), the wait is run in the loop's default executor (one thread per call in flight).
+- Starting the worker process (a fork on Linux) is done synchronously, and takes a few milliseconds.
+- `func` is not run on the event loop, so `func` can't be a coroutine function.
+- Cancelling the awaiting task kills the worker process (regardless of `rwt_kill`), and the CancelledError is propagated.
+    """
+
+    _timeout, _ntries, _kill, _mode, _retry, _breaker, _key = _rwt_switches('run_with_timeout_async', ('process',), func, args, kwargs)
+    pid_list = []
+
+    kwargs['rwt_loglevel'] = rwt_logger.level
+    kwargs['root_loglevel'] = logging.getLogger().level
+
+    timeout = _retry.first_timeout(_timeout)
+    start = time.monotonic()
+    ntry = 0
+    while True:
+
+        if _ntries > 1:
+            rwt_logger.debug (f"T0  - Try {ntry}")
+        if _breaker:
+            _breaker.check(_key, func)
+
+        status, payload = await _try_process_async(func, args, kwargs, timeout)
+        if status == "result":
+            if _breaker:
+                _breaker.success(_key)
+            return payload
+
+        exception = _failed_try(status, payload, func, timeout, _mode, _kill, pid_list, _breaker, _key)
+        plan = _retry.next_try(ntry, timeout, exception, time.monotonic() - start)
+        if status == "timeout"  and  _kill:
+            await _kill_worker_async(payload, plan is None)
+        if plan is None:
+            if exception is None:
+                return None
+            raise exception
+
+        timeout, delay = plan
+        if delay > 0:
+            rwt_logger.debug (f"T8  - Retry in {delay:.3f} seconds, rwt_timeout {timeout}")
+            await asyncio.sleep(delay)
+        ntry += 1
+
+
+async def _try_process_async(func, args, kwargs, timeout):
+    # Private module function
+    # _try_process() equivalent, awaiting the worker_p exit
+    rwt_logger.debug (f"T1  - Starting worker_p")
+    worker_to_toplevel_q = multiprocessing.get_context().Queue()
+    worker_p = multiprocessing.Process(target=worker, args=(worker_to_toplevel_q, func, args, kwargs), daemon=False, name=f'rwt_{func}')
+    worker_p.start()
+    try:
+        exited = await _wait_exit(worker_p, timeout)
+    except asyncio.CancelledError:
+        await _kill_worker_async(worker_p, False)
+        raise
+
+    if not exited:
+        return "timeout", worker_p
+    rwt_logger.debug (f"T2  - worker_p exited before rwt_timeout")
+    return _worker_result(worker_to_toplevel_q)
+
+
+async def _wait_exit(worker_p, timeout):
+    # Private module function
+    # Wait up to timeout seconds for worker_p to exit, without blocking the event loop.  Returns True if exited.
+    loop =      asyncio.get_running_loop()
+    exited =    loop.create_future()
+    pidfd =     None
+    if hasattr(os, 'pidfd_open'):
+        try:
+            pidfd = os.pidfd_open(worker_p.pid)
+        except OSError:                                     # Kernel without pidfd support, or process already reaped
+            pass
+    watch_fd = pidfd if pidfd is not None else worker_p.sentinel
+
+    def on_exit():
+        if not exited.done():
+            exited.set_result(True)
+
+    try:
+        loop.add_reader(watch_fd, on_exit)
+    except (NotImplementedError, ValueError, OSError):     # No fd reader support (eg, Windows) - wait on a thread
+        if pidfd is not None:
+            os.close(pidfd)
+        await loop.run_in_executor(None, worker_p.join, timeout)
+        return not worker_p.is_alive()
+
+    try:
+        await asyncio.wait_for(exited, timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        loop.remove_reader(watch_fd)
+        if pidfd is not None:
+            os.close(pidfd)
+    return not worker_p.is_alive()                          # is_alive() also reaps the exited process
+
+
+async def _kill_worker_async(worker_p, raise_errors):
+    # Private module function
+    # _kill_worker() equivalent, awaiting the terminate
+    rwt_logger.debug (f"T4  - terminate worker_p")
+    worker_p.terminate()
+    if not await _wait_exit(worker_p, 1):
+        _force_kill(worker_p, raise_errors)
+
+
+def run_with_timeout_map(func, args_list, **kwargs):
+    """
+## run_with_timeout_map (func, args_list, **kwargs, rwt_timeout=1.0, rwt_deadline=None, rwt_kill=True, rwt_mode='process', rwt_nworkers=16) - Run a function over many argument sets in parallel, with per-item and overall timeouts
+
+`func` is called once for each entry in `args_list`, with up to `rwt_nworkers` calls running at once, each in
+a separate process as with `run_with_timeout()`.  The total run time is bounded by the slowest items (and `rwt_deadline`),
+rather than by the sum of all of the items.
+
+
+### Args
+
+`func` (callable)
+- The function to run, as for `run_with_timeout()`
+
+`args_list` (iterable)
+- One entry per call.  A tuple entry is passed as the positional args, and any other entry is passed as the single arg.
+
+`**kwargs` (0+)
+- keyword args passed to every `func` call
+
+`rwt_timeout` additional kwarg (int or float, default 1.0)
+- Per-item timeout, measured from the start of the item's call
+
+`rwt_deadline` additional kwarg (int, float, or None, default None)
+- Overall timeout for the whole map, measured from the `run_with_timeout_map()` call
+- Running items are killed (or abandoned) at the deadline, and items not yet started are not run
+
+`rwt_kill` additional kwarg (bool, default True)
+- As for `run_with_timeout()`.  Orphaned pids are listed in each item's TimeoutError message.
+
+`rwt_mode` additional kwarg (str, default 'process')
+- `'process'`, `'pool'`, or `'thread'`, as for `run_with_timeout()`
+- Process creation is done serially by the calling process, so for fast items `'process'` mode is no faster than a 
+`run_with_timeout()` loop, though hung items still overlap.  `'pool'` and `'thread'` modes avoid this cost.
+- In `'thread'` mode at most `RWT_THREAD_MAX` (8) items run at once, and as for `run_with_timeout()` each item's
+`rwt_timeout` is measured from the map call, including time spent waiting for a free thread.
+
+`rwt_nworkers` additional kwarg (int, default 16)
+- Max concurrent worker processes in `'process'` and `'pool'` modes.  Pool workers beyond `RWT_POOL_MAX_IDLE` are stopped when the map completes.
+
+
+### Returns
+- A list with one entry per `args_list` entry, in the same order.  Each entry is the value returned from `func`, or the
+exception raised by `func`, or a TimeoutError for an item that timed out or was not run before `rwt_deadline`, or a
+RuntimeError for an item whose worker process crashed or returned nothing.
+- Exceptions raised for invalid rwt_* values.  `rwt_ntries`, `rwt_retry`, and `rwt_breaker` are not supported.
+    """
+
+    _deadline = None
+    if 'rwt_deadline' in kwargs:
+        _deadline = kwargs['rwt_deadline']
+        del kwargs['rwt_deadline']
+        if _deadline is not None  and  not isinstance(_deadline, (int, float)):
+            raise ValueError (f"rwt_deadline must be type int, float, or None, received <{_deadline}>")
+
+    _nworkers = RWT_MAP_NWORKERS
+    if 'rwt_nworkers' in kwargs:
+        _nworkers = kwargs['rwt_nworkers']
+        del kwargs['rwt_nworkers']
+        if not isinstance(_nworkers, int)  or  _nworkers < 1:
+            raise ValueError (f"rwt_nworkers must be type int greater than 0, received <{_nworkers}>")
+
+    if 'rwt_retry' in kwargs  or  'rwt_breaker' in kwargs:
+        raise ValueError (f"rwt_retry and rwt_breaker are not supported by run_with_timeout_map")
+    _timeout, _ntries, _kill, _mode, _, _, _ = _rwt_switches('run_with_timeout_map', RWT_MODES, func, (), kwargs)
+    if _ntries != 1:
+        raise ValueError (f"rwt_ntries is not supported by run_with_timeout_map, received <{_ntries}>")
+
+    items = [args if isinstance(args, tuple) else (args,) for args in args_list]
+    deadline_at = time.monotonic() + _deadline  if _deadline is not None  else None
+    rwt_logger.debug (f"M0  - {len(items)} items, rwt_deadline {_deadline}, rwt_nworkers {_nworkers}")
+
+    if _mode == 'thread':
+        results = _map_threads(func, items, kwargs, _timeout, _deadline, deadline_at)
+    else:
+        results = _map_processes(func, items, kwargs, _timeout, _kill, _deadline, deadline_at, _nworkers, _mode == 'pool')
+
+    for index in range(len(results)):
+        if isinstance(results[index], _not_run):
+            results[index] = TimeoutError (f"Function <{func.__name__}> not run before rwt_deadline of {_deadline} seconds")
+    return results
+
+
+class _not_run():
+    # Private class
+    # Placeholder for map items not yet completed
+    pass
+
+
+def _map_processes(func, items, kwargs, timeout, kill, deadline, deadline_at, nworkers, use_pool):
+    # Private module function
+    # run_with_timeout_map() rwt_mode='process' and 'pool'.  For 'pool' the pool workers are held in idle between items,
+    # and a worker is waited on via its Connection, rather than the process sentinel.
+    kwargs['rwt_loglevel'] = rwt_logger.level
+    kwargs['root_loglevel'] = logging.getLogger().level
+
+    results =   [_not_run()] * len(items)
+    next_item = 0
+    running =   {}                                          # sentinel or conn: (index, worker_p, result_q or conn, due)
+    idle =      []
+
+    try:
+        while next_item < len(items)  or  running:
+            now = time.monotonic()
+            while next_item < len(items)  and  len(running) < nworkers  and  (deadline_at is None  or  now < deadline_at):
+                if use_pool:
+                    worker_p, conn = idle.pop() if idle else _pool.acquire()
+                    try:
+                        conn.send((func, items[next_item], kwargs))
+                    except (pickle.PicklingError, TypeError, AttributeError) as e:     # func or args not picklable - the worker is still usable
+                        idle.append((worker_p, conn))
+                        results[next_item] = e
+                        next_item += 1
+                        continue
+                    except OSError:                         # The worker died while idle - the item is sent to another worker
+                        rwt_logger.debug (f"M8  - Dead worker_p pid {worker_p.pid} discarded")
+                        conn.close()
+                        worker_p.join(timeout=1)
+                        continue
+                    running[conn] = (next_item, worker_p, conn, now + timeout)
+                else:
+                    result_q = multiprocessing.get_context().Queue()
+                    worker_p = multiprocessing.Process(target=worker, args=(result_q, func, items[next_item], kwargs), daemon=False, name=f'rwt_{func}')
+                    worker_p.start()
+                    running[worker_p.sentinel] = (next_item, worker_p, result_q, now + timeout)
+                rwt_logger.debug (f"M1  - Started item {next_item} on worker_p pid {worker_p.pid}")
+                next_item += 1
+            if not running:                                 # Deadline reached with items not started
+                break
+
+            wake_at = min(due for (_, _, _, due) in running.values())
+            if deadline_at is not None:
+                wake_at = min(wake_at, deadline_at)
+            for ready in multiprocessing.connection.wait(list(running), timeout=max(0, wake_at - time.monotonic())):
+                index, worker_p, channel, _ = running.pop(ready)
+                try:
+                    if use_pool:
+                        status, payload = channel.recv()
+                        idle.append((worker_p, channel))
+                    else:
+                        worker_p.join()
+                        status, payload = channel.get(timeout=0.05)
+                except Exception:
+                    rwt_logger.debug (f"M7  - Nothing returned from item {index}")
+                    if use_pool:                            # The pool worker died
+                        channel.close()
+                        worker_p.join(timeout=1)
+                    results[index] = RuntimeError (f"Function <{func.__name__}> returned nothing (worker_p exit code {worker_p.exitcode})")
+                    continue
+                rwt_logger.debug (f"M3  - <{status}> msg received for item {index}")
+                results[index] = payload if status == "result" else _rebuild_exception(payload)
+
+            now = time.monotonic()
+            expired = [ready for ready, (_, _, _, due) in running.items()  if now >= due  or  (deadline_at is not None  and  now >= deadline_at)]
+            if kill:
+                for ready in expired:
+                    running[ready][1].terminate()
+                kill_until = time.monotonic() + 1
+            for ready in expired:
+                index, worker_p, channel, due = running.pop(ready)
+                if use_pool:
+                    channel.close()
+                if now >= due:
+                    msg = f"Function <{func.__name__}> timed out after {timeout} seconds"
+                else:
+                    msg = f"Function <{func.__name__}> exceeded rwt_deadline of {deadline} seconds"
+                if kill:
+                    rwt_logger.debug (f"M4  - terminated worker_p for item {index}")
+                    worker_p.join(timeout=max(0, kill_until - time.monotonic()))
+                    if worker_p.is_alive():
+                        _force_kill(worker_p, False)
+                    results[index] = TimeoutError (f"{msg} (killed)")
+                else:
+                    results[index] = TimeoutError (f"{msg} (not killed) orphaned pid: {worker_p.pid}")
+    finally:
+        for worker_p, conn in idle:
+            _pool.release(worker_p, conn)
+
+    return results
+
+
+def _map_threads(func, items, kwargs, timeout, deadline, deadline_at):
+    # Private module function
+    # run_with_timeout_map() rwt_mode='thread'
+    results =   [_not_run()] * len(items)
+    notify =    threading.Event()
+    due =       time.monotonic() + timeout                  # Timed from submission, as for run_with_timeout(), so items waiting for a free thread time out
+    waiting =   {index: _threads.submit(func, args, kwargs, notify) for index, args in enumerate(items)}
+
+    while waiting:
+        notify.clear()
+        now = time.monotonic()
+        wake_at = due if deadline_at is None else min(due, deadline_at)
+        for index, request in list(waiting.items()):
+            if request.done.is_set():
+                results[index] = request.payload
+                del waiting[index]
+                continue
+            past_deadline = deadline_at is not None  and  now >= deadline_at
+            if now < due  and  not past_deadline:
+                continue
+            if not _threads.abandon(request):               # Completed just at the timeout
+                continue
+            del waiting[index]
+            if now >= due:
+                results[index] = TimeoutError (f"Function <{func.__name__}> timed out after {timeout} seconds (thread abandoned)")
+            elif request.started is not None:               # Not started before the deadline is left as _not_run
+                results[index] = TimeoutError (f"Function <{func.__name__}> exceeded rwt_deadline of {deadline} seconds (thread abandoned)")
+        if waiting:
+            notify.wait(max(0, wake_at - now))
+
+    return results
+
+
+class rwt_retry():
+    """
+## Class rwt_retry (ntries=3, backoff=0.5, backoff_factor=2.0, backoff_max=30.0, jitter=0.5, timeout_factor=1.0, timeout_max=None, deadline=None, retry_on=(TimeoutError,)) - Retry policy for run_with_timeout()
+
+Pass an `rwt_retry` instance as the `rwt_retry` kwarg to `run_with_timeout()` or `run_with_timeout_async()` in place 
+of `rwt_ntries`.  Rather than retrying immediately with the same timeout, the tries are spaced by growing delays, 
+the timeout may grow on each try, and the whole call may be bounded by a total deadline.  An instance holds no per-call 
+state, and may be shared by many calls.
+
+
+### Args
+`ntries` (int, default 3)
+- Max number of tries
+
+`backoff` (int or float, default 0.5)
+- Delay in seconds before the second try
+
+`backoff_factor` (int or float, default 2.0)
+- The delay is multiplied by this factor for each following try
+
+`backoff_max` (int or float, default 30.0)
+- Max delay in seconds (before jitter)
+
+`jitter` (float, default 0.5)
+- Each delay is randomly varied by +/- this fraction, so that calls that failed together (eg, on a flapping network mount) 
+don't all retry together
+
+`timeout_factor` (int or float, default 1.0)
+- The `rwt_timeout` is multiplied by this factor for each following try
+
+`timeout_max` (int, float, or None, default None)
+- Max try timeout in seconds
+
+`deadline` (int, float, or None, default None)
+- Max total time in seconds for all tries and delays.  The last try's timeout is reduced to fit within the deadline, 
+and no further try is made if the deadline would be exceeded.
+
+`retry_on` (tuple of exception classes, default (TimeoutError,))
+- A try is retried only if it failed with one of these exceptions.  Use `(Exception,)` to also retry on exceptions 
+raised by `func` (as `rwt_ntries` does).
+
+
+### Returns
+- Handle to the `rwt_retry()` instance
+- ValueError is raised for invalid args
+
+
+### Behaviors and rules
+- Custom policies may be implemented by subclassing `rwt_retry` and overriding `next_try()` (and `first_timeout()`).
+`next_try(ntry, timeout, exception, elapsed)` is called after each failed try, with the zero-based try number, the try's 
+timeout, the exception from the try (None if the worker returned nothing), and the seconds elapsed since the call started.  
+It returns `(timeout, delay)` for the next try, or None to end the call by raising the exception.
+    """
+
+    def __init__(self, ntries=3, backoff=0.5, backoff_factor=2.0, backoff_max=30.0, jitter=0.5, 
+                 timeout_factor=1.0, timeout_max=None, deadline=None, retry_on=(TimeoutError,)):
+        if not isinstance(ntries, int)  or  ntries < 1:
+            raise ValueError (f"ntries must be type int greater than 0, received <{ntries}>")
+        for name, value in (('backoff', backoff), ('backoff_factor', backoff_factor), ('backoff_max', backoff_max), 
+                            ('jitter', jitter), ('timeout_factor', timeout_factor)):
+            if not isinstance(value, (int, float))  or  value < 0:
+                raise ValueError (f"{name} must be type int or float, 0 or greater, received <{value}>")
+        for name, value in (('timeout_max', timeout_max), ('deadline', deadline)):
+            if value is not None  and  (not isinstance(value, (int, float))  or  value <= 0):
+                raise ValueError (f"{name} must be type int or float greater than 0, or None, received <{value}>")
+
+        self.ntries =           ntries
+        self.backoff =          backoff
+        self.backoff_factor =   backoff_factor
+        self.backoff_max =      backoff_max
+        self.jitter =           jitter
+        self.timeout_factor =   timeout_factor
+        self.timeout_max =      timeout_max
+        self.deadline =         deadline
+        self.retry_on =         tuple(retry_on)
+
+    def first_timeout(self, timeout):
+        if self.deadline is not None:
+            timeout = min(timeout, self.deadline)
+        return timeout
+
+    def next_try(self, ntry, timeout, exception, elapsed):
+        if ntry + 1 >= self.ntries:
+            return None
+        if exception is not None  and  not isinstance(exception, self.retry_on):
+            return None
+
+        delay = min(self.backoff * self.backoff_factor ** ntry, self.backoff_max)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        timeout = timeout * self.timeout_factor
+        if self.timeout_max is not None:
+            timeout = min(timeout, self.timeout_max)
+        if self.deadline is not None:
+            remaining = round(self.deadline - elapsed - delay, 3)
+            if remaining <= 0:
+                return None
+            timeout = min(timeout, remaining)
+        return timeout, delay
+
+    def __repr__(self):
+        return (f"rwt_retry(ntries={self.ntries}, backoff={self.backoff}, backoff_factor={self.backoff_factor}, backoff_max={self.backoff_max}, "
+                f"jitter={self.jitter}, timeout_factor={self.timeout_factor}, timeout_max={self.timeout_max}, deadline={self.deadline}, "
+                f"retry_on=({''.join(ex.__name__ + ',' for ex in self.retry_on)}))")
+
+
+class CircuitOpenError(TimeoutError):
+    """Raised by run_with_timeout() calls short-circuited by an open rwt_breaker."""
+    pass
+
+
+class rwt_breaker():
+    """
+## Class rwt_breaker (threshold=3, reset_after=30.0) - Circuit breaker for run_with_timeout()
+
+Pass an `rwt_breaker` instance as the `rwt_breaker` kwarg to `run_with_timeout()` or `run_with_timeout_async()`.
+After `threshold` consecutive timed out tries for a key the circuit opens, and following calls with that key raise
+`CircuitOpenError` immediately, without starting a worker.  After `reset_after` seconds one trial call is let through 
+(half-open).  If it succeeds the circuit closes, and if it times out the circuit reopens for another `reset_after` seconds.
+
+The key is the `rwt_breaker_key` kwarg, defaulting to `func`'s qualified name (eg, `'Path.exists'`).  Since one 
+function is often called on many targets, specify the target as the key, eg, the network mount point.  One `rwt_breaker` 
+instance may track any number of keys, and is thread-safe.
+
+
+### Args
+`threshold` (int, default 3)
+- Number of consecutive timed out tries that opens the circuit
+
+`reset_after` (int or float, default 30.0)
+- Seconds the circuit stays open before a trial call is let through
+
+
+### Returns
+- Handle to the `rwt_breaker()` instance
+- ValueError is raised for invalid args
+
+
+### Behaviors and rules
+- Only timeouts count as failures.  An exception raised by `func` shows that the target responded, and is counted as a success.
+- `CircuitOpenError` is a subclass of `TimeoutError`, so existing `except TimeoutError` handling also catches short-circuited calls.
+- With `rwt_retry`, each timed out try is counted, so the remaining tries of a call are short-circuited once the circuit opens.
+    """
+
+    def __init__(self, threshold=3, reset_after=30.0):
+        if not isinstance(threshold, int)  or  threshold < 1:
+            raise ValueError (f"threshold must be type int greater than 0, received <{threshold}>")
+        if not isinstance(reset_after, (int, float))  or  reset_after < 0:
+            raise ValueError (f"reset_after must be type int or float, 0 or greater, received <{reset_after}>")
+        self.threshold =    threshold
+        self.reset_after =  reset_after
+        self._keys =        {}                              # key: [consecutive failures, opened at time or None]
+        self._lock =        threading.Lock()
+
+
+    def state(self, key):
+        """
+## state (key) - Return the circuit state for key
+
+### Returns
+- `'closed'`, `'open'`, or `'half-open'` (reset_after has expired, and the next call is let through as a trial)
+        """
+        with self._lock:
+            nfailures, opened_at = self._keys.get(key, (0, None))
+        if opened_at is None:
+            return 'closed'
+        if time.monotonic() - opened_at < self.reset_after:
+            return 'open'
+        return 'half-open'
+
+
+    def reset(self, key=None):
+        """
+## reset (key=None) - Close the circuit for key, or for all keys
+
+### Returns
+- None
+        """
+        with self._lock:
+            if key is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(key, None)
+
+
+    def check(self, key, func):
+        # Raise CircuitOpenError if the circuit for key is open.  A half-open circuit lets this call through as the
+        # trial, and holds the circuit open for following calls until the trial completes (or reset_after expires again).
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None  or  entry[1] is None:
+                return
+            waited = time.monotonic() - entry[1]
+            if waited >= self.reset_after:
+                entry[1] = time.monotonic()
+                rwt_logger.debug (f"B1  - Circuit half-open for key <{key}>, trial call")
+                return
+            nfailures = entry[0]
+        raise CircuitOpenError (f"Function <{func.__name__}> short-circuited, circuit open for key <{key}> after {nfailures} consecutive timeouts, retry in {self.reset_after - waited:.1f} seconds")
+
+    def success(self, key):
+        with self._lock:
+            if key in self._keys:
+                del self._keys[key]
+
+    def failure(self, key):
+        with self._lock:
+            entry = self._keys.setdefault(key, [0, None])
+            entry[0] += 1
+            if entry[0] >= self.threshold:
+                if entry[1] is None:
+                    rwt_logger.debug (f"B2  - Circuit opened for key <{key}>")
+                entry[1] = time.monotonic()
+
+    def __repr__(self):
+        return f"rwt_breaker(threshold={self.threshold}, reset_after={self.reset_after})"
+
+
+def _rebuild_exception(payload):
+    # Private module function
+    # Rebuild a worker() exception payload as an exception instance
+    ex_type, ex_msg, ex_trace = payload
+    try:
+        return ex_type(f"{ex_msg}")
+    except Exception:                                       # ex_type requires other args
+        return RuntimeError (f"{ex_type.__name__}: {ex_msg}")
+
+
+def _rwt_switches(caller, modes, func, args, kwargs):
+    # Private module function
+    # Remove and check the rwt_* switches from kwargs, and debug log them.  Returns (timeout, ntries, kill, mode, retry,
+    # breaker, breaker_key).  With no rwt_retry, retry is an rwt_retry equivalent of rwt_ntries.
+
     _timeout = 1.0
     if 'rwt_timeout' in kwargs:
         _timeout = kwargs['rwt_timeout']
@@ -108,74 +821,86 @@ def run_with_timeout(func, *args, **kwargs):
         del kwargs['rwt_kill']
         if not isinstance(_kill, bool):
             raise ValueError (f"rwt_kill must be type bool, received <{_kill}>")
-    if _kill == False:
-        pid_list = []
 
-    xx =  f"\nrun_with_timeout switches:\n  rwt_timeout:  {_timeout}\n  rwt_ntries:   {_ntries}\n  rwt_kill:     {_kill}"
-    xx += f"\n  Function:     {func}\n  args:         {args}\n  kwargs:       {kwargs}"
-    rwt_logger.debug (xx)
+    _mode = 'process'
+    if 'rwt_mode' in kwargs:
+        _mode = kwargs['rwt_mode']
+        del kwargs['rwt_mode']
+        if _mode not in modes:
+            raise ValueError (f"rwt_mode must be {_or_list(modes)}, received <{_mode}>")
 
+    _retry = None
+    if 'rwt_retry' in kwargs:
+        _retry = kwargs['rwt_retry']
+        del kwargs['rwt_retry']
+        if not (hasattr(_retry, 'first_timeout')  and  hasattr(_retry, 'next_try')):
+            raise ValueError (f"rwt_retry must be an rwt_retry instance, received <{_retry}>")
+        if _ntries != 1:
+            raise ValueError (f"rwt_ntries and rwt_retry may not both be specified")
 
-    kwargs['rwt_loglevel'] = rwt_logger.level
-    kwargs['root_loglevel'] = logging.getLogger().level
+    _breaker = None
+    if 'rwt_breaker' in kwargs:
+        _breaker = kwargs['rwt_breaker']
+        del kwargs['rwt_breaker']
+        if not isinstance(_breaker, rwt_breaker):
+            raise ValueError (f"rwt_breaker must be an rwt_breaker instance, received <{_breaker}>")
 
-    for ntry in range(_ntries):
+    _key = getattr(func, '__qualname__', None)  or  repr(func)
+    if 'rwt_breaker_key' in kwargs:
+        _key = kwargs['rwt_breaker_key']
+        del kwargs['rwt_breaker_key']
 
-        if _ntries > 1:
-            rwt_logger.debug (f"T0  - Try {ntry}")
+    if rwt_logger.isEnabledFor(logging.DEBUG):              # Skip formatting args/kwargs for fast thread/pool mode calls
+        xx =  f"\n{caller} switches:\n  rwt_timeout:  {_timeout}\n  rwt_ntries:   {_ntries}\n  rwt_kill:     {_kill}\n  rwt_mode:     {_mode}"
+        if _retry is not None:
+            xx += f"\n  rwt_retry:    {_retry}"
+        if _breaker is not None:
+            xx += f"\n  rwt_breaker:  {_breaker}, key <{_key}>"
+        xx += f"\n  Function:     {func}\n  args:         {args}\n  kwargs:       {kwargs}"
+        rwt_logger.debug (xx)
 
-        # Run it
-        rwt_logger.debug (f"T1  - Starting worker_p")
-        worker_to_toplevel_q = multiprocessing.get_context().Queue()
-        worker_p = multiprocessing.Process(target=worker, args=(worker_to_toplevel_q, func, args, kwargs), daemon=False, name=f'rwt_{func}')
-        worker_p.start()
-        worker_p.join(timeout=_timeout)
-        status=None
-
-        # Kill it if it did not exit normally
-        if worker_p.is_alive():
-            if _kill:                                       # worker_p is alive.  Kill it.
-                rwt_logger.debug (f"T4  - terminate worker_p")
-                worker_p.terminate()
-                worker_p.join(timeout=1) #0.2)
-                if worker_p.is_alive():
-                    try:
-                        if sys.platform.startswith("win"):
-                            rwt_logger.debug (f"T5  - taskkill worker_p pid {worker_p.pid}")
-                            subprocess.run(["taskkill", "/PID", str(worker_p.pid), "/F"])
-                        else:   # Linux
-                            rwt_logger.debug (f"T5  - SIGKILL worker_p pid {worker_p.pid}")
-                            os.kill(worker_p.pid, signal.SIGKILL)
-                    except Exception as e:
-                        if 'No such process' in str(e):     # Corner case of worker_p either ended normally, or the terminate finally happened
-                            pass
-                        else:
-                            if ntry == _ntries-1:
-                                raise
-                if ntry == _ntries-1:
-                    raise TimeoutError (f"Function <{func.__name__}> timed out after {_timeout} seconds (killed)")
-            else:                                           # worker_p is alive, and DON'T kill it
-                pid_list.append(str(worker_p.pid))
-                if ntry == _ntries-1:
-                    raise TimeoutError (f"Function <{func.__name__}> timed out after {_timeout} seconds (not killed) orphaned pids: {' '.join(pid_list)}")
-        else:
-            rwt_logger.debug (f"T2  - worker_p exited before rwt_timeout")
+    if _retry is None:
+        _retry = rwt_retry(ntries=_ntries, backoff=0, jitter=0, retry_on=(Exception,))
+    else:
+        _ntries = getattr(_retry, 'ntries', 2)              # Enables the T0 try number debug logging
+    return _timeout, _ntries, _kill, _mode, _retry, _breaker, _key
 
-            # Get returned result or exception
-            try:
-                status, payload = worker_to_toplevel_q.get(timeout=0.05)
-            except Exception as e:
-                rwt_logger.debug (f"T7  - Nothing returned from runner")
-                status = None
 
-        if status:
-            rwt_logger.debug (f"T3  - <{status}> msg received from worker_p")
-            if status == "result":
-                return payload
-            elif status == "exception":
-                if ntry == _ntries-1:
-                    ex_type, ex_msg, ex_trace = payload     # ex_trace retained for possible future debug/use
-                    raise ex_type(f"{ex_msg}")
+def _or_list(items):
+    # Private module function
+    # ('a', 'b', 'c') -> "'a', 'b', or 'c'"
+    quoted = [f"'{item}'" for item in items]
+    if len(quoted) <= 2:
+        return ' or '.join(quoted)
+    return ', '.join(quoted[:-1]) + ', or ' + quoted[-1]
+
+
+def _kill_worker(worker_p, raise_errors):
+    # Private module function
+    # Terminate worker_p, and force kill it if it doesn't exit.  Errors other than the process
+    # having already ended are raised if raise_errors.
+    rwt_logger.debug (f"T4  - terminate worker_p")
+    worker_p.terminate()
+    worker_p.join(timeout=1) #0.2)
+    if worker_p.is_alive():
+        _force_kill(worker_p, raise_errors)
+
+
+def _force_kill(worker_p, raise_errors):
+    # Private module function
+    # SIGKILL worker_p (taskkill on Windows)
+    try:
+        if sys.platform.startswith("win"):
+            rwt_logger.debug (f"T5  - taskkill worker_p pid {worker_p.pid}")
+            subprocess.run(["taskkill", "/PID", str(worker_p.pid), "/F"])
+        else:   # Linux
+            rwt_logger.debug (f"T5  - SIGKILL worker_p pid {worker_p.pid}")
+            os.kill(worker_p.pid, signal.SIGKILL)
+    except Exception as e:
+        if 'No such process' in str(e):                     # Corner case of worker_p either ended normally, or the terminate finally happened
+            pass
+        elif raise_errors:
+            raise
 
 
 def worker(result_q, func, args, kwargs):
@@ -201,3 +926,270 @@ def worker(result_q, func, args, kwargs):
         result_q.put(("result", result))
     except Exception as e:
         result_q.put(("exception", (e.__class__, str(e), traceback.format_exc())))
+
+
+def pool_worker(conn):
+    # rwt_mode='pool' worker process.  Runs requests received on conn until conn is closed or None is received.
+
+    def worker_int_handler(sig, frame):
+        rwt_logger.debug(f"WH1 - Signal {sig} received")
+        time.sleep(0.01)                                    # allow time for logging before terminating
+        sys.exit()
+    signal.signal(signal.SIGTERM, worker_int_handler)       # kill (15)
+
+    rwt_logger = logging.getLogger('cjnfuncs.rwt')
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        func, args, kwargs = request
+        logging.getLogger().setLevel(kwargs['root_loglevel'])
+        del kwargs['root_loglevel']
+        rwt_logger.setLevel(kwargs['rwt_loglevel'])
+        del kwargs['rwt_loglevel']
+        rwt_logger.debug(f"W1  - pool worker pid {os.getpid()}")
+
+        try:
+            reply = ("result", func(*args, **kwargs))
+        except Exception as e:
+            reply = ("exception", (e.__class__, str(e), traceback.format_exc()))
+        try:
+            try:
+                conn.send(reply)
+            except Exception as e:                          # Result not picklable
+                conn.send(("exception", (e.__class__, str(e), traceback.format_exc())))
+        except (EOFError, OSError):                         # Caller gave up on this worker (rwt_kill=False timeout)
+            return
+
+
+class _rwt_pool():
+    # Private class
+    # The rwt_mode='pool' worker processes.  A worker is a (Process, Connection) pair.  Idle workers are held in a list,
+    # and a worker is owned by one run() call at a time.
+
+    def __init__(self):
+        self.idle =     []
+        self.lock =     threading.Lock()
+
+    def start(self, nworkers):
+        # Start workers until nworkers are idle
+        with self.lock:
+            while len(self.idle) < nworkers:
+                self.idle.append(self._new_worker())
+
+    def stop(self):
+        # Stop all idle workers
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for worker_p, conn in idle:
+            try:
+                conn.send(None)
+            except (EOFError, OSError):
+                pass
+            conn.close()
+            worker_p.join(timeout=1)
+            if worker_p.is_alive():
+                _kill_worker(worker_p, False)
+
+    def run(self, func, args, kwargs, timeout):
+        # Run one try of func on a pool worker.  Returns (status, payload) as for _try_process().  A timed out
+        # worker is removed from the pool and replaced, and the caller kills (or orphans) it.
+        worker_p, conn = self.acquire()
+        rwt_logger.debug (f"T1  - Running on pool worker pid {worker_p.pid}")
+        try:
+            conn.send((func, args, kwargs))
+        except Exception:                                   # func or args not picklable - the worker is still usable
+            self.release(worker_p, conn)
+            raise
+
+        if conn.poll(timeout):
+            try:
+                status, payload = conn.recv()
+            except (EOFError, OSError):
+                rwt_logger.debug (f"T7  - Nothing returned from pool worker")
+                conn.close()
+                worker_p.join(timeout=1)
+                return None, None
+            rwt_logger.debug (f"T2  - pool worker returned before rwt_timeout")
+            self.release(worker_p, conn)
+            rwt_logger.debug (f"T3  - <{status}> msg received from pool worker")
+            if status == "exception":
+                payload = _rebuild_exception(payload)
+            return status, payload
+
+        conn.close()
+        self.start(1)                                       # Replace the timed out worker for following calls
+        return "timeout", worker_p
+
+    def acquire(self):
+        with self.lock:
+            while self.idle:
+                worker_p, conn = self.idle.pop()
+                if worker_p.is_alive():
+                    return worker_p, conn
+                conn.close()
+        return self._new_worker()
+
+    def release(self, worker_p, conn):
+        with self.lock:
+            if len(self.idle) < RWT_POOL_MAX_IDLE:
+                self.idle.append((worker_p, conn))
+                return
+        conn.close()                                        # Worker exits on the closed connection
+
+    def _new_worker(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        worker_p = multiprocessing.Process(target=pool_worker, args=(child_conn,), daemon=True, name='rwt_pool_worker')
+        worker_p.start()
+        child_conn.close()
+        return worker_p, parent_conn
+
+_pool = _rwt_pool()
+
+
+def rwt_pool_start(nworkers=1):
+    """
+## rwt_pool_start (nworkers=1) - Pre-start rwt_mode='pool' worker processes
+
+Starts worker processes for `run_with_timeout(..., rwt_mode='pool')` calls, up to `nworkers` idle workers.
+Without this call, workers are started as needed by the first pool mode calls.
+
+Starting the workers early, before the tool script has started other threads or built up large data structures, 
+keeps the workers small and avoids forking a multithreaded process.
+
+### Returns
+- None
+    """
+    _pool.start(min(nworkers, RWT_POOL_MAX_IDLE))
+
+
+def rwt_pool_stop():
+    """
+## rwt_pool_stop () - Stop the idle rwt_mode='pool' worker processes
+
+Idle pool workers are daemon processes and are terminated at tool script exit, so this call is optional.  
+Following calls with `rwt_mode='pool'` start new workers.
+
+### Returns
+- None
+    """
+    _pool.stop()
+
+
+class _rwt_threads():
+    # Private class
+    # The rwt_mode='thread' daemon threads.  A request is a _thread_request posted to the queue.  Threads are started
+    # as needed, up to RWT_THREAD_MAX, and are never stopped.  A request that times out is marked abandoned, and is
+    # counted in nabandoned until its thread completes it (or is skipped if no thread has started it yet).
+
+    def __init__(self):
+        self.requests =         queue.SimpleQueue()
+        self.lock =             threading.Lock()
+        self.nthreads =         0
+        self.nidle =            0
+        self.npending =         0
+        self.nabandoned =       0
+        self.abandoned_total =  0
+
+    def run(self, func, args, kwargs, timeout):
+        # Run one try of func on a thread.  Returns (status, payload), or (None, None) on timeout.
+        request = self.submit(func, args, kwargs)
+
+        if request.done.wait(timeout):
+            rwt_logger.debug (f"T3  - <{request.status}> received from thread")
+            return request.status, request.payload
+
+        if self.abandon(request):
+            return None, None
+        return request.status, request.payload          # Completed just at the timeout
+
+    def submit(self, func, args, kwargs, notify=None):
+        # Post a request to the thread pool.  notify (a threading.Event), if given, is set when the request is
+        # started and when it is done.
+        request = _thread_request(func, args, kwargs, notify)
+        with self.lock:
+            self.npending += 1
+            if self.npending > self.nidle  and  self.nthreads < RWT_THREAD_MAX:
+                self.nthreads += 1
+                self.nidle += 1
+                threading.Thread(target=self._thread_loop, daemon=True, name=f'rwt_thread_{self.nthreads}').start()
+        rwt_logger.debug (f"T1  - Posting to thread pool")
+        self.requests.put(request)
+        return request
+
+    def abandon(self, request):
+        # Abandon a timed out request.  Returns False if the request completed before it could be abandoned.
+        with self.lock:
+            if request.done.is_set():
+                return False
+            request.abandoned = True
+            self.nabandoned += 1
+            self.abandoned_total += 1
+        rwt_logger.debug (f"T6  - Thread abandoned")
+        return True
+
+    def _thread_loop(self):
+        while True:
+            request = self.requests.get()
+            with self.lock:
+                self.npending -= 1
+                if request.abandoned:                       # Timed out while waiting for a free thread
+                    self.nabandoned -= 1
+                    continue
+                self.nidle -= 1
+                request.started = time.monotonic()
+            if request.notify:
+                request.notify.set()
+            rwt_logger.debug (f"W1  - Running on pool thread")
+            try:
+                request.status, request.payload = "result", request.func(*request.args, **request.kwargs)
+            except BaseException as e:                      # SystemExit and KeyboardInterrupt are raised in the caller, not this thread
+                request.status, request.payload = "exception", e
+            with self.lock:
+                self.nidle += 1
+                if request.abandoned:
+                    self.nabandoned -= 1
+                request.done.set()
+            if request.notify:
+                request.notify.set()
+
+    def stats(self):
+        with self.lock:
+            return {'threads': self.nthreads, 'idle': self.nidle, 'abandoned': self.nabandoned,
+                    'abandoned_total': self.abandoned_total, 'max_threads': RWT_THREAD_MAX}
+
+_threads = _rwt_threads()
+
+
+class _thread_request():
+    # Private class
+    __slots__ = ('func', 'args', 'kwargs', 'notify', 'done', 'started', 'status', 'payload', 'abandoned')
+
+    def __init__(self, func, args, kwargs, notify=None):
+        self.func =         func
+        self.args =         args
+        self.kwargs =       kwargs
+        self.notify =       notify
+        self.done =         threading.Event()
+        self.started =      None
+        self.status =       None
+        self.payload =      None
+        self.abandoned =    False
+
+
+def rwt_thread_stats():
+    """
+## rwt_thread_stats () - Return rwt_mode='thread' thread pool counts
+
+### Returns
+- dict with keys:
+  - `threads` - Number of threads started (threads are reused, and are never stopped)
+  - `idle` - Number of threads waiting for a call
+  - `abandoned` - Number of timed out calls still running on (or waiting for) a thread
+  - `abandoned_total` - Total number of timed out calls since the tool script started
+  - `max_threads` - `RWT_THREAD_MAX`
+    """
+    return _threads.stats()
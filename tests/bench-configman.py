@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""Benchmarks for cjnfuncs configman performance features
+
+Timing results vary by machine.  There is no golden file.
+    ./bench-configman.py -t 0
+    ./bench-configman.py -t 1 --lines 20000
+    ./bench-configman.py --cleanup
+"""
+
+#==========================================================
+#
+#  Chris Nelson, 2026
+#
+#==========================================================
+
+__version__ = "3.3"
+TOOLNAME    = "cjnfuncs_benchcfg"
+
+import argparse
+import ast
+import re
+import os.path
+import shutil
+import sys
+import threading
+import time
+import weakref
+
+from cjnfuncs.core      import set_toolname, logging, ConfigError, set_logging_level
+from cjnfuncs.configman import config_item, persistent_config, shared_config
+import cjnfuncs.core as core
+
+configman_logger = logging.getLogger('cjnfuncs.configman')
+
+parser = argparse.ArgumentParser(description=__doc__ + __version__, formatter_class=argparse.RawTextHelpFormatter)
+parser.add_argument('-t', '--test', default='0',
+                    help="Test number to run (default 0).  0 runs all benchmarks")
+parser.add_argument('--lines', type=int, default=10000,
+                    help="Number of param lines in the generated config (default 10000)")
+parser.add_argument('--cleanup', action='store_true',
+                    help="Remove test dirs/files.")
+args = parser.parse_args()
+
+set_toolname(TOOLNAME)
+
+
+if args.cleanup:
+    for _dir in [core.tool.config_dir, core.tool.data_dir, core.tool.cache_dir]:
+        if os.path.exists(_dir):
+            print (f"Removing  {_dir}")
+            shutil.rmtree(_dir)
+    sys.exit()
+
+
+# --------------------------------------------------------------------
+
+tnum_parse = re.compile(r"([\d]+)([\w]*)")
+def check_tnum(tnum_in, include0='0'):
+    global tnum
+    tnum = tnum_in
+    if args.test == include0  or  args.test == tnum_in:  return True
+    try:
+        if int(args.test) == int(tnum_parse.match(tnum_in).group(1)):  return True
+    except:  pass
+    return False
+
+
+def print_test_header(header):
+    global tnum
+    print ("\n======================================================================================================")
+    print (f"***** Benchmark number {tnum}: {header} *****")
+    print ("======================================================================================================\n")
+
+
+def timeit(func, *args, min_time=1.0, **kwargs):
+    """Run func repeatedly for at least min_time seconds.  Returns (calls per second, last result)."""
+    ncalls = 0
+    start = time.perf_counter()
+    while 1:
+        result = func(*args, **kwargs)
+        ncalls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return ncalls / elapsed, result
+
+
+def make_config_blob(nlines, nsections=10):
+    """Build a representative config blob:  scalars, quoted strings, comments, containers, and sections."""
+    value_forms = [
+        "{n}",
+        "{n}.25",
+        "-{n}e-3",
+        "True",
+        "false",
+        "None",
+        "Some bare string {n}",
+        "'quoted {n}'",
+        '"hash # in quotes {n}"   # trailing comment',
+        "[{n}, 2.5, 'x']",
+        "{{'a': {n}, 'b': (1, 2)}}",
+        "value_{n}      # comment after value",
+        ]
+    lines = ['# Generated benchmark config', '']
+    per_section = max(1, nlines // (nsections + 1))
+    section = 0
+    for n in range(nlines):
+        if n  and  n % per_section == 0  and  section < nsections:
+            section += 1
+            lines.append(f'\n[Section {section}]')
+        lines.append(f"param_{n:<8} = " + value_forms[n % len(value_forms)].format(n=n))
+    return '\n'.join(lines)
+
+
+def legacy_read_string(config, str_blob):
+    """The pre-3.3 read_string() parse loop (imports not supported), for comparison."""
+    continuation_line = False
+    split_line_re =     re.compile(r'([^\s=:#]+)[\s=:]*(.*)')
+    xx = fr"""
+        ('''|\""")
+        (?:\\.|(?!\1).)*?\1
+        |
+        (["'])(?:\\.|(?!\2).)*?\2
+        |
+        (\#)
+    """
+    find_comment_re =   re.compile(xx, re.VERBOSE)
+    section_name_re =   re.compile(r'\[([^\]]*)\]')
+
+    for line in str_blob.split('\n'):
+        if line.strip().startswith('['):
+            out = section_name_re.match(line.strip())
+            section_name = out.group(1).strip()
+            if section_name != ''  and  section_name not in config.sections_list  and  section_name != 'DEFAULT':
+                config.cfg[section_name] = {}
+                config.sections_list.append(section_name)
+            config.current_section_name = section_name
+            continue
+
+        if not continuation_line:
+            param_name = value_portion = ''
+            out = split_line_re.match(line.strip())
+            if out:
+                param_name =        out.group(1)
+                value_portion =     out.group(2)
+        else:
+            value_portion +=        ' ' + line.strip()
+            continuation_line =     False
+
+        if value_portion != '':
+            for match in find_comment_re.finditer(value_portion):
+                if match.group(3):
+                    value_portion = value_portion[:match.start(3)].strip()
+                    break
+
+        if value_portion.endswith('\\'):
+            value_portion =         value_portion[:-1].strip()
+            continuation_line =     True
+            continue
+
+        if param_name != '':
+            if value_portion.lower() == 'true':
+                value_portion = 'True'
+            if value_portion.lower() == 'false':
+                value_portion = 'False'
+            if value_portion == '':
+                value_portion = 'True'
+            try:
+                value_portion = ast.literal_eval(value_portion)
+            except:
+                pass
+            config._add_key(param_name, value_portion, config.current_section_name)
+            configman_logger.debug (f"Loaded {param_name} = <{value_portion}>  ({type(value_portion)})")
+
+
+class legacy_layout_item():
+    """A config_item stand-in with the pre-3.3 storage layout, for memory comparison:  attributes in a per-instance
+    __dict__, a bind() WeakSet created at instantiation, and param names not interned.  Loaded by legacy_read_string()."""
+    _add_key = config_item._add_key
+
+    def __init__(self):
+        self.force_str =            False
+        self.secondary_config =     False
+        self.safe_mode =            False
+        self.parse_cache =          False
+        self.watch =                False
+        self.watch_callback =       None
+        self.watcher =              None
+        self.file_changed =         False
+        self.change_detect =        'mtime'
+        self.import_workers =       0
+        self.atomic_reload =        False
+        self.atomic_write =         False
+        self.fsync =                'none'
+        self.lazy_decode =          False
+        self.config_signature =     None
+        self.config_digest =        None
+        self.loaded =               False
+        self.cfg =                  {}
+        self.current_section_name = ''
+        self.sections_list =        []
+        self._section_names =       set()
+        self.defaults =             {}
+        self._generation =          0
+        self._resolved =            {}
+        self._resolved_generation = -1
+        self._bound_params =        weakref.WeakSet()
+        self._bound_lock =          threading.Lock()
+        self._snapshot =            (self.cfg, self.defaults, self._section_names)
+        self.imported_files =       []
+        self._config_lines =        None
+        self._config_line_index =   None
+        self._import_records =      {}
+        self._import_signatures =   {}
+        self._lazy_values =         None
+        self._lazy_lock =           threading.Lock()
+        self.config_file =          None
+        self.config_dir =           None
+        self.config_full_path =     None
+        self.config_timestamp =     0
+        self.config_content =       ''
+
+
+def legacy_getcfg(config, param, fallback='_nofallback', types=[], section=''):
+    """The pre-3.3 getcfg() lookup, for comparison."""
+    _value = '__nonevalue__'
+    if section == '':
+        if param in config.cfg:
+            _value = config.cfg[param]
+        elif param in config.defaults:
+            _value = config.defaults[param]
+    else:
+        if section in config.sections_list:
+            if param in config.cfg[section]:
+                _value = config.cfg[section][param]
+            elif param in config.defaults:
+                _value = config.defaults[param]
+        else:
+            if param in config.defaults:
+                _value = config.defaults[param]
+
+    if _value == '__nonevalue__':
+        if fallback != '_nofallback':
+            return fallback
+        else:
+            raise ConfigError (f"Param <[{section}] {param}> not in <{config.config_file}> and no default or fallback.")
+    else:
+        if isinstance(types, type):
+            types = [types]
+        if types == []:
+                return _value
+        else:
+            if type(_value) in types:
+                return _value
+            else:
+                raise ConfigError (f"Config parameter <[{section}] {param}> value <{_value}> type {type(_value)} not of expected type(s): {types}")
+
+
+def legacy_modify_content(config_content, param='', value='', remove=False, add_if_not_existing=False):
+    """The pre-3.3 modify_configfile() edit loop (string concatenation, one param per pass), for comparison."""
+    line_format_re = re.compile(r'(\s*)([^\s=:]+)([\s=:]+)([^#]+)(.*)')
+    found_param = False
+    updated_content = ''
+    value = str(value)
+    for line in config_content.split('\n'):
+        out = line_format_re.match(line)
+        if out:
+            if out.group(2) != param:
+                updated_content += line + '\n'
+            else:
+                found_param = True
+                if remove == True:
+                    continue
+                len_current_whitespace = len(out.group(4)) - len(out.group(4).strip())
+                len_new_whitespace = len_current_whitespace - (len(value) - len(out.group(4).strip()))
+                if len_new_whitespace < 1:
+                    len_new_whitespace = 1
+                if len_current_whitespace == 0:
+                    len_new_whitespace = 0
+                updated_content += out.group(1) + out.group(2) + out.group(3) + value + ' '*len_new_whitespace + out.group(5) + '\n'
+        else:
+            updated_content += line + '\n'
+    if found_param == False  and  add_if_not_existing == True:
+        updated_content += f"{param}    {value}\n"
+    return updated_content[:-1]
+
+
+def legacy_write_content(config):
+    """The pre-3.3 write() content build, for comparison."""
+    cfg_list = ''
+    for key in config.cfg:
+        if key not in config.sections_list:
+            if type(config.cfg[key]) is str  and  '#' in config.cfg[key]:
+                cfg_list += f"{key:20} = '''{config.cfg[key]}'''\n"
+            else:
+                cfg_list += f"{key:20} = {config.cfg[key]}\n"
+    cfg_list += '\n[DEFAULT]\n'
+    for key in config.defaults:
+        cfg_list += f"{key:20} = {config.defaults[key]}\n"
+    for section in config.sections_list:
+        cfg_list += f'\n[{section}]\n'
+        for key in config.cfg[section]:
+            cfg_list += f"{key:20} = {config.cfg[section][key]}\n"
+    return cfg_list
+
+
+def legacy_dump(config):
+    """The pre-3.3 dump(), for comparison."""
+    cfg_list = "***** Section [] *****\n"
+    for key in config.cfg:
+        if key not in config.sections_list:
+            cfg_list += f"{key:>20} = {config.cfg[key]}  {type(config.cfg[key])}\n"
+    for section in config.sections_list:
+        cfg_list += f"***** Section [{section}] *****\n"
+        for key in config.cfg[section]:
+            cfg_list += f"{key:>20} = {config.cfg[section][key]}  {type(config.cfg[section][key])}\n"
+    cfg_list += f"***** Section [DEFAULT] *****\n"
+    for key in config.defaults:
+        cfg_list += f"{key:>20} = {config.defaults[key]}  {type(config.defaults[key])}\n"
+    return cfg_list[:-1]
+
+
+#===============================================================================================
+
+if __name__ == '__main__':
+
+    set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+    blob = make_config_blob(args.lines)
+    nlines = len(blob.split('\n'))
+
+    #-------------------------------------------------------------------------
+    if check_tnum('1'):
+        print_test_header (f"read_string() parse rate, {nlines} line config")
+
+        def legacy_parse():
+            xx = config_item()
+            legacy_read_string(xx, blob)
+            return xx
+
+        def current_parse():
+            xx = config_item()
+            xx.read_string(blob)
+            return xx
+
+        legacy_rate,  legacy_cfg =  timeit(legacy_parse)
+        current_rate, current_cfg = timeit(current_parse)
+        print (f"Legacy parser:   {legacy_rate*nlines:12,.0f} lines/sec")
+        print (f"Current parser:  {current_rate*nlines:12,.0f} lines/sec   ({current_rate/legacy_rate:.1f}x)")
+        print (f"Loaded content identical:  {legacy_cfg.dump() == current_cfg.dump()}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('2'):
+        print_test_header ("getcfg() lookup rate")
+        nsections = 50
+        xx = config_item()
+        xx.read_string(make_config_blob(args.lines, nsections=nsections) + "\n[DEFAULT]\ndefault_param  5\n")
+        last_section = f"Section {nsections}"
+        last_param = list(xx.cfg[last_section])[-1]
+        ncalls = 1000
+        cases = [
+            ("Top-level param",                      'param_0',       '',           []),
+            ("Top-level param, types=int",           'param_0',       '',           int),
+            ("Section param (last section)",         last_param,      last_section, []),
+            ("Section param, 4 types",               last_param,      last_section, [int, float, str, bool]),
+            ("DEFAULT fallthrough from section",     'default_param', last_section, []),
+            ]
+
+        for desc, param, section, types in cases:
+            def legacy_loop():
+                for _ in range(ncalls):
+                    legacy_getcfg(xx, param, types=types, section=section)
+            def current_loop():
+                for _ in range(ncalls):
+                    xx.getcfg(param, types=types, section=section)
+            def resolved_loop():
+                for _ in range(ncalls):
+                    xx.resolved(section)[param]
+            legacy_rate,   _ = timeit(legacy_loop)
+            current_rate,  _ = timeit(current_loop)
+            resolved_rate, _ = timeit(resolved_loop)
+            print (f"{desc}:")
+            print (f"   Legacy getcfg():      {legacy_rate*ncalls:12,.0f} calls/sec")
+            print (f"   Current getcfg():     {current_rate*ncalls:12,.0f} calls/sec   ({current_rate/legacy_rate:.1f}x)")
+            print (f"   resolved()[param]:    {resolved_rate*ncalls:12,.0f} calls/sec   ({resolved_rate/legacy_rate:.1f}x)")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('3'):
+        print_test_header ("bind() handle access rate")
+        xx = config_item()
+        xx.read_string(make_config_blob(args.lines, nsections=50) + "\n[DEFAULT]\ndefault_param  5\n")
+        ncalls = 1000
+        bound = xx.bind('default_param', section='Section 50', types=[int, float])
+
+        def getcfg_loop():
+            for _ in range(ncalls):
+                xx.getcfg('default_param', types=[int, float], section='Section 50')
+        def bound_loop():
+            for _ in range(ncalls):
+                bound.value
+        def attribute_loop():
+            for _ in range(ncalls):
+                xx.force_str
+        getcfg_rate,    _ = timeit(getcfg_loop)
+        bound_rate,     _ = timeit(bound_loop)
+        attribute_rate, _ = timeit(attribute_loop)
+        print (f"getcfg() with types, DEFAULT fallthrough:  {getcfg_rate*ncalls:12,.0f} calls/sec")
+        print (f"Bound handle .value:                       {bound_rate*ncalls:12,.0f} calls/sec   ({bound_rate/getcfg_rate:.1f}x)")
+        print (f"Plain attribute read (reference):          {attribute_rate*ncalls:12,.0f} calls/sec")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('4'):
+        nlines_4 = max(args.lines, 50000)
+        print_test_header (f"modify_configfile(), write(), and dump() on a {nlines_4} line config")
+        blob_4 = make_config_blob(nlines_4)
+        config_path = os.path.join(core.tool.config_dir, 'bench_modify.cfg')
+        os.makedirs(core.tool.config_dir, exist_ok=True)
+        with open(config_path, 'w') as ofile:
+            ofile.write(blob_4)
+        xx = config_item(config_path, secondary_config=True)
+        xx.loadconfig()
+        nedits = 20
+        edits = {f"param_{n:<8}".strip(): f"new value {n}" for n in range(0, nlines_4, nlines_4 // nedits)}
+
+        def legacy_edits():
+            content = blob_4
+            for param, value in edits.items():
+                content = legacy_modify_content(content, param, value)
+            with open(config_path, 'w') as ofile:
+                ofile.write(content)
+        def current_edits():
+            xx.config_content = blob_4
+            for param, value in edits.items():
+                xx.modify_configfile(param, value)
+            xx.modify_configfile(save=True)
+        def current_batch():
+            xx.config_content = blob_4
+            xx.modify_configfile(edits=edits, save=True)
+
+        def file_content():
+            with open(config_path) as ifile:
+                return ifile.read()
+        legacy_rate,  _ = timeit(legacy_edits)
+        legacy_content =  file_content()
+        current_rate, _ = timeit(current_edits)
+        current_content = file_content()
+        batch_rate,   _ = timeit(current_batch)
+        batch_content =   file_content()
+        print (f"{nedits} edits and save, legacy per-param calls:   {1000/legacy_rate:8.1f} ms")
+        print (f"{nedits} edits and save, current per-param calls:  {1000/current_rate:8.1f} ms   ({current_rate/legacy_rate:.1f}x)")
+        print (f"{nedits} edits and save, current single batch:     {1000/batch_rate:8.1f} ms   ({batch_rate/legacy_rate:.1f}x)")
+        print (f"Edited content identical:  {legacy_content == current_content == batch_content}")
+
+        legacy_rate,  _ = timeit(legacy_write_content, xx)
+        current_rate, _ = timeit(xx.write, os.path.join(core.tool.config_dir, 'bench_write.cfg'))
+        print (f"\nwrite() legacy content build only:     {1000/legacy_rate:8.1f} ms")
+        print (f"write() current, including file write:  {1000/current_rate:8.1f} ms   ({current_rate/legacy_rate:.1f}x)")
+
+        legacy_rate,  legacy_content =  timeit(legacy_dump, xx)
+        current_rate, current_content = timeit(xx.dump)
+        print (f"\ndump() legacy:                          {1000/legacy_rate:8.1f} ms")
+        print (f"dump() current:                         {1000/current_rate:8.1f} ms   ({current_rate/legacy_rate:.1f}x)")
+        print (f"dump() content identical:  {legacy_content == current_content}")
+
+
+    #===============================================================================================
+    if check_tnum('5'):
+        print_test_header ("persistent_config save() latency by atomic_write and fsync policy")
+        nparams = 100
+        print (f"persistent_config with {nparams} params, saved to <{core.tool.data_dir}>\n")
+        for atomic_write in [False, True]:
+            for fsync in ['none', 'file', 'file+dir']:
+                persist = persistent_config ('bench_persist', force_new=True, atomic_write=atomic_write, fsync=fsync)
+                for num in range(nparams):
+                    persist.setcfg (f'param_{num}', num)
+                def save_loop():
+                    persist.cfg['param_0'] += 1
+                    persist.save()
+                save_rate, _ = timeit(save_loop)
+                print (f"atomic_write={str(atomic_write):5}  fsync={fsync:8}   save():  {1000/save_rate:8.3f} ms")
+
+
+    #===============================================================================================
+    if check_tnum('6'):
+        print_test_header ("Idle CPU time of persistent_config scheduled saves")
+        import threading
+        npersists = 50
+        idle_time = 2.0
+        persists = [persistent_config (f'bench_sched_{num}', force_new=True, save_schedule='1h') for num in range(npersists)]
+        cpu_start = time.process_time()
+        time.sleep(idle_time)
+        cpu_used = time.process_time() - cpu_start
+        print (f"{npersists} instances with save_schedule='1h', threads:  {threading.active_count()}")
+        print (f"Process CPU time while idle for {idle_time}s:  {1000*cpu_used:.2f} ms")
+        print (f"(Prior per-instance threads polling each 0.2s:  {npersists} threads, {int(npersists*idle_time/0.2)} wakeups)")
+        start = time.perf_counter()
+        for persist in persists:
+            persist.save(exit=True)
+        print (f"save(exit=True) for all {npersists} instances:  {1000*(time.perf_counter() - start):.1f} ms")
+
+
+    #===============================================================================================
+    if check_tnum('7'):
+        print_test_header ("persistent_config one-param change:  save() vs journal mode")
+        nparams = 1000
+        print (f"persistent_config with {nparams} params\n")
+        for fsync in ['none', 'file']:
+            persist = persistent_config ('bench_persist', force_new=True, fsync=fsync)
+            for num in range(nparams):
+                persist.setcfg (f'param_{num}', num)
+            def save_loop():
+                persist.setcfg ('param_0', persist.cfg['param_0'] + 1)
+                persist.save()
+            save_rate, _ = timeit(save_loop)
+
+            persist = persistent_config ('bench_persist', force_new=True, fsync=fsync, journal=True)
+            for num in range(nparams):
+                persist.setcfg (f'param_{num}', num)
+            persist.save()
+            def journal_loop():
+                persist.setcfg ('param_0', persist.cfg['param_0'] + 1)
+            journal_rate, _ = timeit(journal_loop)
+            persist.save()
+            print (f"fsync={fsync:5}  setcfg() + save():       {1000000/save_rate:8.1f} us")
+            print (f"fsync={fsync:5}  journal=True setcfg():   {1000000/journal_rate:8.1f} us   ({journal_rate/save_rate:.1f}x)")
+
+
+    #===============================================================================================
+    if check_tnum('8'):
+        print_test_header ("persistent_config load and save:  storage='text' vs 'json'")
+        nparams = 100000
+        print (f"persistent_config with {nparams} params\n")
+        rates = {}
+        for storage in ['text', 'json']:
+            persist = persistent_config ('bench_storage', force_new=True, storage=storage)
+            for num in range(nparams):
+                persist.cfg[f'param_{num}'] = [num, num * 1.5, f'str {num}', True, None][num % 5]
+            persist.cfg['a section'] = {f'param_{num}': num for num in range(100)}
+            persist.sections_list.append('a section')
+            persist._section_names.add('a section')
+            save_rate, _ = timeit(persist.save)
+            def load():
+                return persistent_config ('bench_storage', storage=storage)
+            load_rate, loaded = timeit(load)
+            rates[storage] = (save_rate, load_rate)
+            print (f"storage={storage:5}  save():  {1000/save_rate:8.1f} ms    load:  {1000/load_rate:8.1f} ms    file size:  {loaded.config_full_path.stat().st_size:9} bytes    content identical:  {loaded.cfg == persist.cfg}")
+        print (f"\njson vs text:  save {rates['json'][0]/rates['text'][0]:.1f}x, load {rates['json'][1]/rates['text'][1]:.1f}x")
+
+
+    #===============================================================================================
+    if check_tnum('9'):
+        print_test_header ("persistent_config lazy_load:  load time and memory")
+        import tracemalloc
+        nparams = 100000
+        print (f"persistent_config with {nparams} params\n")
+        persist = persistent_config ('bench_lazy', force_new=True)
+        for num in range(nparams):
+            persist.cfg[f'param_{num}'] = [num, num * 1.5, f'str {num}', [num, 'x'], None][num % 5]
+        persist.save()
+        del persist
+
+        results = {}
+        for lazy_load in [False, True]:
+            def load():
+                return persistent_config ('bench_lazy', lazy_load=lazy_load)
+            load_rate, _ = timeit(load)
+            tracemalloc.start()
+            persist = load()
+            loaded_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            for num in range(0, nparams, 100):
+                persist.getcfg(f'param_{num}')
+            access_time = time.perf_counter() - start
+            results[lazy_load] = (load_rate, loaded_memory)
+            print (f"lazy_load={str(lazy_load):5}  load:  {1000/load_rate:8.1f} ms    memory after load:  {loaded_memory/1e6:6.1f} MB    first getcfg() of {nparams//100} params:  {1000*access_time:6.2f} ms")
+            del persist
+        print (f"\nlazy_load vs normal:  load {results[True][0]/results[False][0]:.1f}x faster, {results[False][1]/results[True][1]:.1f}x less memory")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('10'):
+        print_test_header ("lazy_decode:  read_string() of a config with large embedded tables")
+        ntables = 200
+        table_lines = []
+        for num in range(ntables):
+            table = [[row, f'name {row}', row * 0.5, {'flag': row % 2 == 0}] for row in range(50)]
+            table_lines.append(f"table_{num}  {table}")
+        table_blob = '\n'.join(table_lines) + '\n' + make_config_blob(args.lines)
+        print (f"{ntables} tables of 50 rows, plus {args.lines} scalar param lines\n")
+
+        results = {}
+        for lazy_decode in [False, True]:
+            def parse():
+                xx = config_item(lazy_decode=lazy_decode)
+                xx.read_string(table_blob)
+                return xx
+            parse_rate, xx = timeit(parse)
+            start = time.perf_counter()
+            for num in range(0, ntables, 10):
+                xx.getcfg(f'table_{num}')
+            access_time = time.perf_counter() - start
+            results[lazy_decode] = (parse_rate, xx)
+            print (f"lazy_decode={str(lazy_decode):5}  read_string():  {1000/parse_rate:8.1f} ms    first getcfg() of {ntables//10} tables:  {1000*access_time:6.2f} ms")
+        print (f"\nlazy_decode vs normal:  read_string() {results[True][0]/results[False][0]:.1f}x faster")
+        print (f"Loaded content identical:  {results[False][1].resolved() == results[True][1].resolved()}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('11'):
+        print_test_header ("Memory use of many small configs")
+        import tracemalloc
+        nconfigs = 500
+        small_blob = "LogLevel  20\nPollInterval  10\nName  server_1\nRetries  3\nEnabled  True\n" + \
+            ''.join(f"[Sect {num}]\nhost  host_{num}\nport  {8000 + num}\ntimeout  2.5\nenabled  True\n" for num in range(3))
+        nparams = 17
+        print (f"{nconfigs} configs of {nparams} params (3 sections), loaded by read_string()\n")
+
+        def measure(make_item, load):
+            tracemalloc.start()
+            items = [make_item() for _ in range(nconfigs)]
+            empty_memory = tracemalloc.get_traced_memory()[0]
+            for item in items:
+                load(item)
+            loaded_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return empty_memory / nconfigs, (loaded_memory - empty_memory) / (nconfigs * nparams), loaded_memory / nconfigs
+
+        results = {}
+        results['legacy'] =  measure(legacy_layout_item, lambda item: legacy_read_string(item, small_blob))
+        results['current'] = measure(config_item,        lambda item: item.read_string(small_blob))
+        for layout, (per_config, per_param, total) in results.items():
+            print (f"{layout:7} layout:  empty config {per_config:6.0f} bytes,  per param {per_param:5.0f} bytes,  loaded config total {total:6.0f} bytes")
+        print (f"\nCurrent vs legacy:  {results['legacy'][1]/results['current'][1]:.1f}x fewer bytes per param, {results['legacy'][2]/results['current'][2]:.1f}x less memory per loaded config")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('12'):
+        print_test_header (f"shared_config:  worker attach vs loadconfig(), {nlines} line config")
+        import tracemalloc
+        config_path = os.path.join(core.tool.config_dir, 'bench_shared.cfg')
+        os.makedirs(core.tool.config_dir, exist_ok=True)
+        with open(config_path, 'w') as ofile:
+            ofile.write(blob)
+        publisher = config_item(config_path, secondary_config=True)
+        publisher.loadconfig()
+        publisher.publish_shared('cjnfuncs_bench12')
+        params = [param for param in publisher.cfg if param not in publisher.sections_list][::50]
+
+        cases = [
+            ("loadconfig()",  lambda: config_item(config_path, secondary_config=True).loadconfig()),
+            ("shared_config", lambda: shared_config('cjnfuncs_bench12')),
+            ]
+        results = {}
+        for desc, setup in cases:
+            setup_rate, _ = timeit(setup)
+            tracemalloc.start()
+            if desc == "loadconfig()":
+                worker_config = config_item(config_path, secondary_config=True)
+                worker_config.loadconfig()
+            else:
+                worker_config = shared_config('cjnfuncs_bench12')
+            ready_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            for param in params:
+                worker_config.getcfg(param)
+            access_time = time.perf_counter() - start
+            results[desc] = (setup_rate, ready_memory)
+            print (f"{desc:14} worker ready:  {1000/setup_rate:8.2f} ms    memory:  {ready_memory/1e3:8.1f} kB    first getcfg() of {len(params)} params:  {1000*access_time:6.2f} ms")
+        print (f"\nshared_config vs loadconfig():  {results['shared_config'][0]/results['loadconfig()'][0]:.0f}x faster worker setup, " + \
+               f"{results['loadconfig()'][1]/results['shared_config'][1]:.0f}x less memory per worker")
+        publisher.unpublish_shared('cjnfuncs_bench12')
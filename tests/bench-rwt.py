@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Benchmarks for cjnfuncs.rwt run_with_timeout() performance features
+
+Timing results vary by machine.  There is no golden file.
+    ./bench-rwt.py -t 0
+    ./bench-rwt.py -t 1
+"""
+
+#==========================================================
+#
+#  Chris Nelson, 2026
+#
+#==========================================================
+
+__version__ = "3.3"
+TOOLNAME    = "cjnfuncs_benchrwt"
+
+import argparse
+import asyncio
+import re
+import os.path
+import tempfile
+import time
+
+from cjnfuncs.core      import set_toolname
+from cjnfuncs.rwt       import run_with_timeout, run_with_timeout_async, run_with_timeout_map, rwt_pool_start, rwt_pool_stop, rwt_thread_stats
+from cjnfuncs.rwt       import rwt_retry, rwt_breaker, CircuitOpenError
+
+parser = argparse.ArgumentParser(description=__doc__ + __version__, formatter_class=argparse.RawTextHelpFormatter)
+parser.add_argument('-t', '--test', default='0',
+                    help="Test number to run (default 0).  0 runs all benchmarks")
+args = parser.parse_args()
+
+set_toolname(TOOLNAME)
+
+
+# --------------------------------------------------------------------
+
+tnum_parse = re.compile(r"([\d]+)([\w]*)")
+def check_tnum(tnum_in, include0='0'):
+    global tnum
+    tnum = tnum_in
+    if args.test == include0  or  args.test == tnum_in:  return True
+    try:
+        if int(args.test) == int(tnum_parse.match(tnum_in).group(1)):  return True
+    except:  pass
+    return False
+
+
+def print_test_header(header):
+    global tnum
+    print ("\n======================================================================================================")
+    print (f"***** Benchmark number {tnum}: {header} *****")
+    print ("======================================================================================================\n")
+
+
+def timeit(func, *args, min_time=1.0, **kwargs):
+    """Run func repeatedly for at least min_time seconds.  Returns (calls per second, last result)."""
+    ncalls = 0
+    start = time.perf_counter()
+    while 1:
+        result = func(*args, **kwargs)
+        ncalls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return ncalls / elapsed, result
+
+
+#===============================================================================================
+
+if __name__ == "__main__":
+
+    #-------------------------------------------------------------------------
+    if check_tnum('1'):
+        print_test_header ("run_with_timeout() call rate, rwt_mode='process' vs 'pool'")
+        target = tempfile.gettempdir()
+
+        direct_rate,  _ =               timeit(os.path.exists, target)
+        process_rate, process_result =  timeit(run_with_timeout, os.path.exists, target)
+        rwt_pool_start()
+        pool_rate,    pool_result =     timeit(run_with_timeout, os.path.exists, target, rwt_mode='pool')
+
+        try:
+            run_with_timeout(time.sleep, 2, rwt_timeout=0.2, rwt_mode='pool')
+        except TimeoutError:
+            pass
+        replaced_rate, _ =              timeit(run_with_timeout, os.path.exists, target, rwt_mode='pool')
+        rwt_pool_stop()
+
+        print (f"Direct os.path.exists():                 {direct_rate:12,.0f} calls/sec")
+        print (f"rwt_mode='process':                      {process_rate:12,.0f} calls/sec")
+        print (f"rwt_mode='pool':                         {pool_rate:12,.0f} calls/sec   ({pool_rate/process_rate:.1f}x)")
+        print (f"rwt_mode='pool', after worker timeout:   {replaced_rate:12,.0f} calls/sec")
+        print (f"Results identical:  {process_result == pool_result}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('2'):
+        print_test_header ("run_with_timeout() latency, rwt_mode='thread'")
+        target = tempfile.gettempdir()
+
+        direct_rate,  _ =               timeit(os.path.exists, target)
+        process_rate, _ =               timeit(run_with_timeout, os.path.exists, target)
+        thread_rate,  thread_result =   timeit(run_with_timeout, os.path.exists, target, rwt_mode='thread')
+
+        for _ in range(2):
+            try:
+                run_with_timeout(time.sleep, 0.5, rwt_timeout=0.1, rwt_mode='thread')
+            except TimeoutError:
+                pass
+        abandoned_rate, _ =             timeit(run_with_timeout, os.path.exists, target, rwt_mode='thread')
+
+        print (f"Direct os.path.exists():                 {1e6/direct_rate:12,.1f} us/call")
+        print (f"rwt_mode='process':                      {1e6/process_rate:12,.1f} us/call")
+        print (f"rwt_mode='thread':                       {1e6/thread_rate:12,.1f} us/call   ({thread_rate/process_rate:.0f}x faster)")
+        print (f"rwt_mode='thread', 2 threads abandoned:  {1e6/abandoned_rate:12,.1f} us/call")
+        print (f"Result:  {thread_result}")
+        print (f"rwt_thread_stats():  {rwt_thread_stats()}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('3'):
+        ncalls = 20
+        print_test_header (f"{ncalls} calls of time.sleep(0.2), run_with_timeout() vs run_with_timeout_async()")
+
+        start = time.perf_counter()
+        for _ in range(ncalls):
+            run_with_timeout(time.sleep, 0.2)
+        sync_time = time.perf_counter() - start
+
+        async def gather_calls():
+            ticks = 0
+            async def ticker():                 # Confirms the event loop is not blocked
+                nonlocal ticks
+                while 1:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+            tick_task = asyncio.ensure_future(ticker())
+            results = await asyncio.gather(*[run_with_timeout_async(time.sleep, 0.2) for _ in range(ncalls)])
+            tick_task.cancel()
+            return results, ticks
+
+        start = time.perf_counter()
+        results, ticks = asyncio.run(gather_calls())
+        async_time = time.perf_counter() - start
+
+        print (f"run_with_timeout(), sequential:          {sync_time:8.3f} sec")
+        print (f"run_with_timeout_async(), gathered:      {async_time:8.3f} sec   ({sync_time/async_time:.1f}x)")
+        print (f"Event loop 10ms ticks during gather:     {ticks:8}   (~{async_time*100:.0f} if never blocked)")
+        print (f"All returned None:  {results == [None]*ncalls}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('4'):
+        nitems = 200
+        print_test_header (f"os.path.exists over {nitems} paths, run_with_timeout() loop vs run_with_timeout_map()")
+        paths = [os.path.join(tempfile.gettempdir(), f"bench_{n}") for n in range(nitems)]
+        paths[::10] = [tempfile.gettempdir()] * len(paths[::10])
+        expected = [os.path.exists(path) for path in paths]
+
+        start = time.perf_counter()
+        loop_results = [run_with_timeout(os.path.exists, path) for path in paths]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        map_results = run_with_timeout_map(os.path.exists, paths)
+        map_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pool_results = run_with_timeout_map(os.path.exists, paths, rwt_mode='pool')
+        pool_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        thread_results = run_with_timeout_map(os.path.exists, paths, rwt_mode='thread')
+        thread_time = time.perf_counter() - start
+
+        print (f"run_with_timeout() loop:                 {loop_time:8.3f} sec")
+        print (f"run_with_timeout_map():                  {map_time:8.3f} sec   ({loop_time/map_time:.1f}x)")
+        print (f"run_with_timeout_map(), rwt_mode='pool':   {pool_time:6.3f} sec   ({loop_time/pool_time:.0f}x)")
+        print (f"run_with_timeout_map(), rwt_mode='thread': {thread_time:6.3f} sec   ({loop_time/thread_time:.0f}x)")
+        print (f"Results identical:  {loop_results == map_results == pool_results == thread_results == expected}")
+
+        print ("\nWith 3 hung items (time.sleep(5), rwt_timeout=1) among 50 fast items:")
+        start = time.perf_counter()
+        results = run_with_timeout_map(time.sleep, [0.01]*25 + [5]*3 + [0.01]*25, rwt_timeout=1)
+        print (f"run_with_timeout_map():                  {time.perf_counter() - start:8.3f} sec   (a loop would take > 3 sec)")
+        print (f"TimeoutErrors:  {sum(isinstance(result, TimeoutError) for result in results)}")
+
+
+    #-------------------------------------------------------------------------
+    if check_tnum('5'):
+        ncalls = 10
+        print_test_header (f"{ncalls} calls to a hung target (time.sleep(10), rwt_timeout=0.2), rwt_ntries vs rwt_retry vs rwt_breaker")
+
+        def hung_calls(**rwt_kwargs):
+            nshort = 0
+            start = time.perf_counter()
+            for _ in range(ncalls):
+                try:
+                    run_with_timeout(time.sleep, 10, rwt_timeout=0.2, **rwt_kwargs)
+                except CircuitOpenError:
+                    nshort += 1
+                except TimeoutError:
+                    pass
+            return time.perf_counter() - start, nshort
+
+        ntries_time, _ =        hung_calls(rwt_ntries=3)
+        retry_time, _ =         hung_calls(rwt_retry=rwt_retry(ntries=3, backoff=0.05, timeout_factor=0.5, deadline=0.4))
+        breaker_time, nshort =  hung_calls(rwt_ntries=3, rwt_breaker=rwt_breaker(threshold=3, reset_after=60), rwt_breaker_key='/mnt/hung')
+
+        print (f"rwt_ntries=3:                            {ntries_time:8.3f} sec")
+        print (f"rwt_retry(ntries=3, deadline=0.4):       {retry_time:8.3f} sec")
+        print (f"rwt_ntries=3, rwt_breaker(threshold=3):  {breaker_time:8.3f} sec   ({nshort} of {ncalls} calls short-circuited)")
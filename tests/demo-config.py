@@ -30,7 +30,7 @@ import time
 
 from cjnfuncs.core     import set_toolname, setuplogging, logging, ConfigError, set_logging_level
 from cjnfuncs.deployfiles import deploy_files
-from cjnfuncs.configman import config_item, persistent_config
+from cjnfuncs.configman import config_item, persistent_config, shared_config
 from cjnfuncs.timevalue import timevalue, retime
 from cjnfuncs.mungePath import mungePath
 import cjnfuncs.core as core
@@ -59,6 +59,10 @@ if args.cleanup:
         print (f"Removing 1  {core.tool.data_dir}")
         shutil.rmtree(core.tool.data_dir)
 
+    if os.path.exists(core.tool.cache_dir):
+        print (f"Removing 1  {core.tool.cache_dir}")
+        shutil.rmtree(core.tool.cache_dir)
+
     sys.exit()
 
 
@@ -606,6 +610,53 @@ if __name__ == '__main__':
         dump_file(config.config_full_path)
 
 
+    #===============================================================================================
+    if check_tnum('14b'):
+        print_test_header ("Test modify_configfile batch edits")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        do_base_setup()
+        batch_cfg_path = mungePath("demo_config_T14b.cfg", core.tool.config_dir).full_path
+        batch_cfg_path.write_text(config.config_full_path.read_text())
+        config_T14b = config_item(batch_cfg_path, secondary_config=True)
+
+        modifications = {
+            "x_shorter":        "12345",
+            "x_longer":         "123456789 123456789",
+            "x_float":          6.5,
+            "x_list":           ["hello", 3.14, {"abc":42}],
+            "a":                "Modify all occurrences",
+            }
+        removals =  {"x_removed": None, "x_removeX": None}
+        additions = {"George": "was here", "Bjorn": "was here too   # With a comment"}
+
+        print (f"\n----- T14b.1:  Individual modify_configfile() calls")
+        for param, value in modifications.items():
+            config.modify_configfile(param, value)
+        for param in removals:
+            config.modify_configfile(param, remove=True)
+        for param, value in additions.items():
+            config.modify_configfile(param, value, add_if_not_existing=True)
+        config.modify_configfile(save=True)
+
+        print (f"\n----- T14b.2:  Batched modify_configfile() calls")
+        config_T14b.modify_configfile(edits=modifications)
+        config_T14b.modify_configfile(edits=removals, remove=True)
+        config_T14b.modify_configfile(edits=additions, add_if_not_existing=True, save=True)
+
+        print (f"\nFile content identical:  {config.config_full_path.read_text() == batch_cfg_path.read_text()}")
+
+        print (f"\n----- T14b.3:  Edits across calls before saving - add, modify the added param, remove and re-add")
+        config_T14b.modify_configfile("Added_param", "first value", add_if_not_existing=True)
+        config_T14b.modify_configfile(edits={"Added_param": "second value", "x_int": 42})
+        config_T14b.modify_configfile("x_float", remove=True)
+        config_T14b.modify_configfile("x_float", 7.5, add_if_not_existing=True)
+        config_T14b.modify_configfile("x_float", 8.5)
+        config_T14b.modify_configfile("x_int", remove=True, save=True)
+        for line in batch_cfg_path.read_text().split('\n'):
+            if line.startswith(('Added_param', 'x_int', 'x_float')):
+                print (line)
+
+
     #===============================================================================================
     if check_tnum('15'):
         print_test_header ("Access list, tuple, and dictionary params")
@@ -682,6 +733,80 @@ if __name__ == '__main__':
         dump('e', section='Test section 1', desc='Not in [Test section 1] or [DEFAULT] and [] not considered')
 
 
+    #===============================================================================================
+    if check_tnum('18b'):
+        print_test_header ("Resolved section views")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        do_base_setup()
+
+        print (f"\n----- T18b.1:  Views match getcfg() for each section")
+        for section in ['', 'Test section 1', 'No such section']:
+            view = config.resolved(section)
+            matches = all(view[param] == config.getcfg(param, section=section) for param in view)
+            print (f"[{section}]  {len(view)} params, all match getcfg():  {matches}")
+        view = config.resolved('Test section 1')
+        print (f"[Test section 1]:  <a> {view['a']},  <c> {view['c']},  <e> {view.get('e', 'NOT DEFINED')}")
+
+        print (f"\n----- T18b.2:  Views are read-only")
+        try:
+            view['a'] = 6
+        except TypeError as e:
+            print (f"{type(e).__name__}: {e}")
+
+        print (f"\n----- T18b.3:  Changes via setcfg() produce a new view")
+        print (f"Same view object on repeat call:  {config.resolved('Test section 1') is view}")
+        config.setcfg('c', 43, section='DEFAULT')
+        print (f"Prior view <c>:  {view['c']},  new view <c>:  {config.resolved('Test section 1')['c']}")
+
+
+    #===============================================================================================
+    if check_tnum('18c'):
+        print_test_header ("Bound param handles")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        do_base_setup()
+
+        print (f"\n----- T18c.1:  Bind params")
+        bound_a =       config.bind('a', section='Test section 1', types=int)
+        bound_c =       config.bind('c', section='Test section 1')
+        bound_missing = config.bind('no_such_param', fallback='fallback value')
+        print (f"{bound_a}:  <{bound_a.value}>")
+        print (f"{bound_c}:  <{bound_c.value}>  (from DEFAULT)")
+        print (f"{bound_missing}:  <{bound_missing.value}>")
+
+        print (f"\n----- T18c.2:  Changes via setcfg(), read_dict(), and remove_param() are seen")
+        config.setcfg('a', 6, section='Test section 1')
+        print (f"After setcfg():        <a> {bound_a.value}")
+        config.read_dict({'c': 'from read_dict'}, section='Test section 1')
+        print (f"After read_dict():     <c> {bound_c.value}")
+        config.remove_param('c', section='Test section 1')
+        print (f"After remove_param():  <c> {bound_c.value}  (from DEFAULT)")
+        config.read_dict({'no_such_param': 'now defined'})
+        print (f"After read_dict():     <no_such_param> {bound_missing.value}")
+
+        print (f"\n----- T18c.3:  Changes via loadconfig() are seen")
+        bind_cfg_path = mungePath("bind_T18c.cfg", core.tool.config_dir).full_path
+        bind_cfg_path.write_text("[DEFAULT]\nc  42\n[Test section 1]\na  5\n")
+        config_T18c = config_item(bind_cfg_path, secondary_config=True, change_detect='stat')
+        config_T18c.loadconfig()
+        bound_T18c_a = config_T18c.bind('a', section='Test section 1')
+        bound_T18c_c = config_T18c.bind('c', section='Test section 1')
+        print (f"Initial load:  <a> {bound_T18c_a.value}  <c> {bound_T18c_c.value}")
+        bind_cfg_path.write_text("[DEFAULT]\nc  44\n[Test section 1]\na  7\n")
+        config_T18c.loadconfig(flush_on_reload=True)
+        print (f"After reload:  <a> {bound_T18c_a.value}  <c> {bound_T18c_c.value}")
+
+        print (f"\n----- T18c.4:  Type mismatch is raised by bind() and by .value >>>>  Exceptions")
+        try:
+            config.bind('b', types=str)
+        except ConfigError as e:
+            print (f"bind():  {type(e).__name__}: {e}")
+        config.setcfg('a', 'not an int', section='Test section 1')
+        try:
+            bound_a.value
+        except ConfigError as e:
+            print (f".value:  {type(e).__name__}: {e}")
+
+
     #===============================================================================================
     if check_tnum('19'):
         print_test_header ("Imports within Sections and DEFAULT")
@@ -890,6 +1015,339 @@ e 20
             print ("They match!")
 
 
+    #===============================================================================================
+    if check_tnum('26'):
+        print_test_header ("Parse cache")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        do_base_setup()
+        cache_dir = mungePath('configman_cache', core.tool.cache_dir).full_path
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+        set_logging_level (logging.INFO, 'cjnfuncs.configman')
+
+        print (f"\n----- T26.1:  Initial load - not in the cache, then saved to the cache")
+        config_T26 = config_item(CONFIG_FILE, parse_cache=True)
+        config_T26.loadconfig()
+        print (f"Matches parsed config:  {config_T26.dump() == config.dump()}")
+
+        print (f"\n----- T26.2:  Forced reload of unchanged file - loaded from the cache")
+        config_T26.loadconfig(force_reload=True, flush_on_reload=True)
+        print (f"Matches parsed config:  {config_T26.dump() == config.dump()}")
+
+        print (f"\n----- T26.3:  Changed file is parsed, and reverted file is loaded from the cache")
+        original_content = config_T26.config_full_path.read_text()
+        config_T26.modify_configfile('a', 'changed', save=True)
+        config_T26.loadconfig(force_reload=True, flush_on_reload=True)
+        print (f"Param <a> after change:  <{config_T26.getcfg('a')}>")
+        config_T26.config_full_path.write_text(original_content)
+        config_T26.loadconfig(force_reload=True, flush_on_reload=True)
+        print (f"Param <a> after revert:  <{config_T26.getcfg('a')}>")
+        print (f"Matches parsed config:  {config_T26.dump() == config.dump()}")
+
+        print (f"\n----- T26.4:  Changed imported file invalidates the cache entry")
+        creds_path = mungePath('creds_SMTP', core.tool.config_dir).full_path
+        creds_path.write_text(creds_path.read_text() + '\nAddedParam  42\n')
+        config_T26.loadconfig(force_reload=True, flush_on_reload=True)
+        print (f"Param <AddedParam> from changed import:  <{config_T26.getcfg('AddedParam', section='SMTP')}>")
+        print (f"Number of cache files:  {len(list(cache_dir.iterdir()))}")
+
+
+    #===============================================================================================
+    if check_tnum('27'):
+        print_test_header ("Watch for config file changes")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        do_base_setup()
+        creds_path = mungePath('creds_SMTP', core.tool.config_dir).full_path
+
+        def watch_callback():
+            print ("watch_callback called")
+
+        for watch_mode in [True, 'poll']:
+            print (f"\n----- T27.1:  Initial load, watch={watch_mode}")
+            set_logging_level (logging.INFO, 'cjnfuncs.configman')
+            config_T27 = config_item(CONFIG_FILE, watch=watch_mode, watch_callback=watch_callback)
+            print (f"loadconfig() returned {config_T27.loadconfig()}")
+            print (f"Watched files:  {[str(path.name) for path in config_T27.watcher.paths]}")
+            print (f"loadconfig() returned {config_T27.loadconfig()}  (no change)")
+
+            print (f"\n----- T27.2:  Change to config file (within the same second)")
+            config_T27.modify_configfile('a', 'changed', save=True)
+            time.sleep(0.1 if watch_mode is True else 1.5)
+            print (f"file_changed:  {config_T27.file_changed}")
+            print (f"loadconfig() returned {config_T27.loadconfig()}")
+            print (f"Param <a>:  <{config_T27.getcfg('a')}>")
+            print (f"loadconfig() returned {config_T27.loadconfig()}  (no change)")
+
+            print (f"\n----- T27.3:  Change to imported file")
+            creds_path.write_text(creds_path.read_text() + f'\nWatchParam  {watch_mode}\n')
+            time.sleep(0.1 if watch_mode is True else 1.5)
+            print (f"loadconfig() returned {config_T27.loadconfig()}")
+            print (f"Param <WatchParam>:  <{config_T27.getcfg('WatchParam', section='SMTP')}>")
+
+            print (f"\n----- T27.4:  stop_watch, then timestamp change checking")
+            config_T27.stop_watch()
+            print (f"loadconfig() returned {config_T27.loadconfig()}  (no change)")
+            set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+            do_base_setup()
+
+
+    #===============================================================================================
+    if check_tnum('28'):
+        print_test_header ("Change detection modes")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+
+        for change_detect in ['mtime', 'stat', 'digest']:
+            do_base_setup()
+            print (f"\n----- T28.1:  change_detect={change_detect} - Change within the same second")
+            config_T28 = config_item(CONFIG_FILE, change_detect=change_detect)
+            config_T28.loadconfig()
+            set_logging_level (logging.INFO, 'cjnfuncs.configman')
+            config_T28.modify_configfile('a', f'changed with {change_detect}', save=True)
+            os.utime(config_T28.config_full_path, ns=(config_T28.config_signature[0] if change_detect != 'mtime' else config_T28.config_timestamp * 10**9,)*2)     # Same mtime as the load
+            print (f"loadconfig() returned {config_T28.loadconfig()}")
+            print (f"Param <a>:  <{config_T28.getcfg('a')}>")
+
+            print (f"\n----- T28.2:  change_detect={change_detect} - File touched, content unchanged")
+            time.sleep(0.01)
+            config_T28.config_full_path.touch()
+            print (f"loadconfig() returned {config_T28.loadconfig()}")
+            print (f"loadconfig() returned {config_T28.loadconfig()}")
+            set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+
+        print (f"\n----- T28.3:  Invalid change_detect")
+        try:
+            config_item(CONFIG_FILE, change_detect='size')
+        except ConfigError as e:
+            print (f"{type(e).__name__}: {e}")
+
+
+    #===============================================================================================
+    if check_tnum('29'):
+        print_test_header ("Imported files change tracking")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        deploy_files([
+            { "source": "import_nest_top.cfg",  "target_dir": "USER_CONFIG_DIR"},
+            { "source": "import_nest_1.cfg",    "target_dir": "USER_CONFIG_DIR"},
+            { "source": "import_nest_2.cfg",    "target_dir": "USER_CONFIG_DIR"},
+            ], overwrite=True )
+        nest_cfg = mungePath("import_nest_top.cfg", core.tool.config_dir).full_path
+        config_T29 = config_item(nest_cfg, change_detect='stat')
+        config_T29.loadconfig()
+        print (f"Imported files:  {[import_path.name for import_path in config_T29.imported_files]}")
+
+        print (f"\n----- T29.1:  No changes")
+        set_logging_level (logging.DEBUG, 'cjnfuncs.configman')
+        print (f"loadconfig() returned {config_T29.loadconfig()}")
+
+        print (f"\n----- T29.2:  Change to nested imported file <import_nest_2.cfg> - it and <import_nest_1.cfg> are reloaded, once each")
+        mungePath("import_nest_2.cfg", core.tool.config_dir).full_path.write_text("nest_2   22\n")
+        print (f"loadconfig() returned {config_T29.loadconfig()}")
+        print (f"Param <nest_2>:  <{config_T29.getcfg('nest_2')}>  in [sect 1]:  <{config_T29.getcfg('nest_2', section='sect 1')}>")
+        print (f"loadconfig() returned {config_T29.loadconfig()}")
+
+        print (f"\n----- T29.3:  Change to top level config file only - imported files are not reloaded")
+        nest_cfg.write_text(nest_cfg.read_text().replace("nest_top_b   0", "nest_top_b   3"))
+        print (f"loadconfig() returned {config_T29.loadconfig()}")
+        print (f"Param <nest_top_b>:  <{config_T29.getcfg('nest_top_b')}>")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+
+
+    #===============================================================================================
+    if check_tnum('29b'):
+        print_test_header ("Parallel loading of imported files")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        parallel_cfg = mungePath("parallel_top.cfg", core.tool.config_dir).full_path
+        top_lines = ["top_param   0"]
+        for num in range(8):
+            mungePath(f"parallel_{num}.cfg", core.tool.config_dir).full_path.write_text(f"common   {num}\nfrag_{num}   '{num}'\n")
+            top_lines.append(f"import parallel_{num}.cfg")
+        top_lines.append("[sect 1]\nimport parallel_3.cfg\nimport parallel_1.cfg      # Overrides <common> from parallel_3")
+        parallel_cfg.write_text('\n'.join(top_lines) + '\n')
+
+        print (f"\n----- T29b.1:  Sequential vs. import_workers=4 loads")
+        config_seq = config_item(parallel_cfg)
+        config_seq.loadconfig()
+        config_par = config_item(parallel_cfg, import_workers=4, change_detect='stat')
+        config_par.loadconfig()
+        print (config_par.dump())
+        print (f"Loaded content identical:  {config_seq.dump() == config_par.dump()}")
+        print (f"Imported files:  {[import_path.name for import_path in config_par.imported_files]}")
+
+        print (f"\n----- T29b.2:  Change to one imported file")
+        mungePath("parallel_5.cfg", core.tool.config_dir).full_path.write_text("common   55\nfrag_5   'changed'\n")
+        set_logging_level (logging.INFO, 'cjnfuncs.configman')
+        print (f"loadconfig() returned {config_par.loadconfig()}")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        print (f"Param <common>:  <{config_par.getcfg('common')}>  <frag_5>:  <{config_par.getcfg('frag_5')}>  [sect 1] <common>:  <{config_par.getcfg('common', section='sect 1')}>")
+
+        print (f"\n----- T29b.3:  Missing imported file >>>>  Exception raised")
+        remove_file(mungePath("parallel_2.cfg", core.tool.config_dir).full_path)
+        try:
+            config_par.loadconfig()
+        except ConfigError as e:
+            print (f"{type(e).__name__}: {e}")
+
+
+    #===============================================================================================
+    if check_tnum('29c'):
+        print_test_header ("Atomic reloads with a concurrent reader thread")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        import threading
+        atomic_cfg = mungePath("atomic_T29c.cfg", core.tool.config_dir).full_path
+        def write_atomic_cfg(gen):
+            atomic_cfg.write_text(f"gen  {gen}\n[DEFAULT]\nd_gen  {gen}\n[Sect]\ns_gen  {gen}\n" + f"[Sect {gen}]\nx  {gen}\n")
+        write_atomic_cfg(0)
+        config_T29c = config_item(atomic_cfg, secondary_config=True, change_detect='stat', atomic_reload=True)
+        config_T29c.loadconfig()
+        bound_gen = config_T29c.bind('s_gen', section='Sect')
+
+        print (f"\n----- T29c.1:  200 flushed reloads while a thread reads the config")
+        reader_stop = threading.Event()
+        reader_errors = {'missing': 0, 'inconsistent': 0, 'reads': 0}
+        def reader():
+            while not reader_stop.is_set():
+                try:
+                    config_T29c.getcfg('gen')
+                    config_T29c.getcfg('d_gen', section='Sect')
+                    bound_gen.value
+                    view = config_T29c.resolved('Sect')
+                    if view['s_gen'] != view['d_gen']:
+                        reader_errors['inconsistent'] += 1
+                except (ConfigError, KeyError):
+                    reader_errors['missing'] += 1
+                reader_errors['reads'] += 1
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+        for gen in range(1, 201):
+            write_atomic_cfg(gen)
+            config_T29c.loadconfig(flush_on_reload=True)
+        reader_stop.set()
+        reader_thread.join()
+        print (f"Reads done:  {reader_errors['reads'] > 0}")
+        print (f"Reads with missing params:  {reader_errors['missing']}")
+        print (f"Inconsistent resolved views:  {reader_errors['inconsistent']}")
+        print (f"Final:  <gen> {config_T29c.getcfg('gen')},  bound <s_gen> {bound_gen.value},  sections {config_T29c.sections_list}")
+
+        print (f"\n----- T29c.2:  Failed reload leaves the prior config in place")
+        atomic_cfg.write_text("gen  999\nimport no_such_file.cfg\n")
+        try:
+            config_T29c.loadconfig(flush_on_reload=True)
+        except ConfigError as e:
+            print (f"{type(e).__name__}: {e}")
+        print (f"<gen> {config_T29c.getcfg('gen')},  sections {config_T29c.sections_list}")
+
+
+    #===============================================================================================
+    if check_tnum('29d'):
+        print_test_header ("Lazy value decoding")
+        lazy_cfg = mungePath("lazy_T29d.cfg", core.tool.config_dir).full_path
+        lazy_import = mungePath("lazy_T29d_import.cfg", core.tool.config_dir).full_path
+        lazy_import.write_text("from_import  [1, 2]\n")
+        lazy_cfg.write_text("""
+count       5
+table       [[1, 'one'], [2, 'two'], [3, 'three']]
+repeated    1
+repeated    2                   # Later line wins
+from_import 'overridden by import'
+import      lazy_T29d_import.cfg
+[DEFAULT]
+timeout     2.5
+[Sect]
+mapping     {'a': 1, 'b': (2, 3)}
+""")
+        config_T29d = config_item(lazy_cfg, secondary_config=True, lazy_decode=True)
+        config_T29d.loadconfig()
+        print (config_T29d)
+
+        print (f"\n----- T29d.1:  Values decoded on first access")
+        print (f"cfg before any access:      {config_T29d.cfg}")
+        print (f"getcfg('table'):            {config_T29d.getcfg('table')}")
+        print (f"getcfg('repeated'):         {config_T29d.getcfg('repeated')}")
+        print (f"getcfg('from_import'):      {config_T29d.getcfg('from_import')}")
+        print (f"getcfg('timeout', section='Sect'):  {config_T29d.getcfg('timeout', section='Sect')}")
+        print (f"getcfg('mapping', types=dict, section='Sect'):  {config_T29d.getcfg('mapping', types=dict, section='Sect')}")
+        print (f"cfg after accesses:         {config_T29d.cfg}")
+        print (f"Memoized:  {config_T29d.getcfg('table') is config_T29d.getcfg('table')}")
+
+        print (f"\n----- T29d.2:  Changes to not yet decoded params")
+        config_T29d.setcfg('count', 6)
+        config_T29d.remove_param('mapping', section='Sect')
+        print (config_T29d.dump())
+
+        print (f"\n----- T29d.3:  Reload of a changed file, not flushed")
+        lazy_cfg.write_text("count  7\nnew_param  (1, 2)\n")
+        config_T29d.loadconfig(force_reload=True)
+        print (f"getcfg('count'):      {config_T29d.getcfg('count')}")
+        print (f"getcfg('new_param'):  {config_T29d.getcfg('new_param')}")
+        print (f"resolved():           {config_T29d.resolved()}")
+
+        print (f"\n----- T29d.4:  With force_str and atomic_reload")
+        config_T29d = config_item(lazy_cfg, secondary_config=True, lazy_decode=True, force_str=True, atomic_reload=True)
+        config_T29d.loadconfig()
+        lazy_cfg.write_text("count  8\n")
+        config_T29d.loadconfig(force_reload=True)
+        print (f"getcfg('count'):      {config_T29d.getcfg('count')!r}")
+        print (f"getcfg('new_param'):  {config_T29d.getcfg('new_param')!r}")
+
+
+    #===============================================================================================
+    if check_tnum('29e'):
+        print_test_header ("Shared config published to shared memory")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        import multiprocessing
+        config_T29e = config_item()
+        config_T29e.read_string("""
+count       5
+table       [[1, 'one'], [2, 'two']]
+as_str      '42'
+text        'Hello # there'
+[DEFAULT]
+timeout     2.5
+[Sect]
+mapping     {'a': 1, 'b': (2, 3)}
+""")
+        config_T29e.unpublish_shared('cjnfuncs_T29e')
+
+        print (f"\n----- T29e.1:  Publish and attach")
+        print (f"Published generation:  {config_T29e.publish_shared('cjnfuncs_T29e')}")
+        shared_T29e = shared_config('cjnfuncs_T29e')
+        print (shared_T29e)
+        print (f"cfg before any access:      {shared_T29e.cfg}")
+        print (f"getcfg('table'):            {shared_T29e.getcfg('table')}")
+        print (f"getcfg('as_str'):           {shared_T29e.getcfg('as_str')!r}")
+        print (f"getcfg('text'):             {shared_T29e.getcfg('text')}")
+        print (f"getcfg('timeout', section='Sect'):  {shared_T29e.getcfg('timeout', section='Sect')}")
+        print (f"getcfg('mapping', section='Sect'):  {shared_T29e.getcfg('mapping', section='Sect')}")
+        print (f"loadconfig() with no new generation:  {shared_T29e.loadconfig()}")
+
+        print (f"\n----- T29e.2:  Attach from a forked worker process")
+        def worker(queue):
+            worker_config = shared_config('cjnfuncs_T29e')
+            queue.put((worker_config.generation, worker_config.getcfg('count'), worker_config.getcfg('mapping', section='Sect')))
+        queue = multiprocessing.get_context('fork').Queue()
+        worker_process = multiprocessing.get_context('fork').Process(target=worker, args=(queue,))
+        worker_process.start()
+        print (f"Worker (generation, count, mapping):  {queue.get(timeout=10)}")
+        worker_process.join()
+
+        print (f"\n----- T29e.3:  Republish after a change")
+        config_T29e.setcfg('count', 6)
+        config_T29e.remove_param('timeout', section='DEFAULT')
+        print (f"Published generation:  {config_T29e.publish_shared('cjnfuncs_T29e')}")
+        print (f"loadconfig():  {shared_T29e.loadconfig()}")
+        print (f"generation {shared_T29e.generation},  getcfg('count'):  {shared_T29e.getcfg('count')}")
+        print (f"getcfg('timeout', section='Sect', fallback=None):  {shared_T29e.getcfg('timeout', section='Sect', fallback=None)}")
+
+        print (f"\n----- T29e.4:  Unpublished")
+        config_T29e.unpublish_shared('cjnfuncs_T29e')
+        print (f"Attached content retained - getcfg('count'):  {shared_T29e.getcfg('count')}")
+        print (f"loadconfig(force_reload=True, tolerate_missing=True):  {shared_T29e.loadconfig(force_reload=True, tolerate_missing=True)}")
+        try:
+            shared_config('cjnfuncs_T29e')
+        except ConfigError as e:
+            print (f"{type(e).__name__}: {e}")
+
+
     #===============================================================================================
     if check_tnum('30a'):
         print_test_header ("persistent_config create from scratch")
@@ -983,6 +1441,7 @@ e 20
 
         for cnt in range (6):
             persist.cfg['count'] += 1
+            persist.mark_changed('count')
             dump_file (persist.config_full_path, f'cnt {cnt}')
             time.sleep (0.5)
 
@@ -1008,6 +1467,277 @@ e 20
 
 
 
+    #===============================================================================================
+    if check_tnum('30f'):
+        print_test_header ("persistent_config atomic_write and fsync saves")
+        set_logging_level (logging.DEBUG, 'cjnfuncs.configman')
+
+        persist = persistent_config ('persist', force_new=True, atomic_write=True, fsync='file+dir')
+        persist.setcfg ('count', 1)
+        persist.setcfg ('total', 2, section='a section')
+        persist.config_full_path.chmod(0o640)
+        inode_before = persist.config_full_path.stat().st_ino
+        persist.save()
+        dump_file (persist.config_full_path, 'after atomic save')
+        print (f"File replaced (new inode):  {persist.config_full_path.stat().st_ino != inode_before}")
+        print (f"File permissions retained:  {oct(persist.config_full_path.stat().st_mode & 0o777)}")
+        print (f"Temp files left behind:     {[x.name for x in persist.config_dir.iterdir() if x.name.endswith('.tmp')]}")
+        print (f"loadconfig() returned {persist.loadconfig()}")
+
+        print ("\n\n********  modify_configfile() with atomic_write and fsync")
+        persist.modify_configfile ('count', 3, save=True)
+        dump_file (persist.config_full_path, 'after modify_configfile')
+        persist.config_full_path.chmod(0o644)
+
+        print ("\n\n********  Invalid fsync policy")
+        try:
+            persistent_config ('persist', fsync='always')
+        except ConfigError as e:
+            print (f"ConfigError:  {e}")
+
+
+    #===============================================================================================
+    if check_tnum('30g'):
+        print_test_header ("persistent_config dirty tracking")
+        set_logging_level (logging.DEBUG, 'cjnfuncs.configman')
+
+        persist = persistent_config ('persist', force_new=True)
+        print (f"changed_keys after load:              {persist.changed_keys}")
+        persist.setcfg ('count', 0)
+        persist.setcfg ('count', 0, section='a section')
+        persist.read_dict ({'x': 1, 'y': 2}, section='DEFAULT')
+        print (f"changed_keys after setcfg/read_dict:  {sorted(persist.changed_keys)}")
+        persist.save()
+        print (f"changed_keys after save:              {persist.changed_keys}")
+
+        persist.setcfg ('count', 0)
+        persist.remove_param ('no_such_param')
+        print (f"changed_keys after same-value setcfg and missing remove_param:  {persist.changed_keys}")
+        persist.setcfg ('count', 0.0)
+        persist.remove_param ('x', section='DEFAULT')
+        persist.clear ('a section')
+        print (f"changed_keys after type change, remove_param, and clear:  {sorted(persist.changed_keys, key=str)}")
+        persist.save()
+
+        persist.setcfg ('lst', [1])
+        persist.save()
+        lst = persist.getcfg ('lst')
+        lst.append(2)
+        persist.setcfg ('lst', lst)
+        print (f"changed_keys after setcfg of an in-place changed list:  {persist.changed_keys}")
+        persist.save()
+
+        print ("\n\n********  Scheduled saves skipped when unchanged")
+        persist = persistent_config ('persist', save_schedule='1s')
+        print (f"changed_keys after reload:  {persist.changed_keys}")
+        time.sleep(1.5)
+        persist.setcfg ('count', 1)
+        time.sleep(1.2)
+        dump_file (persist.config_full_path, 'after scheduled save')
+        persist.save(exit=True)
+
+
+    #===============================================================================================
+    if check_tnum('30h'):
+        print_test_header ("persistent_config shared save scheduler")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        import threading
+
+        persists = [persistent_config (f'persist_{num}', force_new=True, save_schedule=schedule) for num, schedule in enumerate(['1h', '0.5s', '03:00'])]
+        for persist in persists:
+            persist.setcfg ('count', 0)
+        scheduler_threads = [thread for thread in threading.enumerate() if thread.name == 'persistent_config scheduled saves']
+        print (f"Scheduler threads for {len(persists)} instances:  {len(scheduler_threads)}")
+        print (f"All instances share the thread:      {all(persist.save_thread is scheduler_threads[0] for persist in persists)}")
+
+        time.sleep(0.8)
+        for num, persist in enumerate(persists):
+            print (f"persist_{num} changed_keys after 0.8s:  {persist.changed_keys}")
+
+        start = time.perf_counter()
+        for persist in persists:
+            persist.save(exit=True)
+        print (f"save(exit=True) for all instances within 0.1s:  {time.perf_counter() - start < 0.1}")
+        scheduler_threads[0].join(timeout=1)
+        print (f"Scheduler thread exited:  {not scheduler_threads[0].is_alive()}")
+        for num, persist in enumerate(persists):
+            dump_file (persist.config_full_path, f'persist_{num} final')
+
+
+    #===============================================================================================
+    if check_tnum('30i'):
+        print_test_header ("persistent_config journal mode")
+        set_logging_level (logging.INFO, 'cjnfuncs.configman')
+
+        def dump_journal(persist, comment=''):
+            for file_path in [persist._journal_path, persist._compacting_path]:
+                if file_path.exists():
+                    dump_file (file_path, comment)
+                else:
+                    print (f"\n==== File <{file_path}> does not exist")
+
+        print ("\n\n********  Changes are appended to the journal, not written to the config_file")
+        persist = persistent_config ('persist', force_new=True, journal=True)
+        persist.setcfg ('count', 0)
+        persist.setcfg ('count', 1)
+        persist.setcfg ('count', 1)
+        persist.setcfg ('text', 'Hello # there', section='a section')
+        persist.read_dict ({'x': [1, 2.5, None], 'y': {'a': True}}, section='DEFAULT')
+        persist.remove_param ('x', section='DEFAULT')
+        persist.setcfg ('gone', 0, section='b section')
+        persist.clear ('b section')
+        persist.cfg['count'] += 10
+        persist.mark_changed ('count')
+        persist.setcfg ('lst', [1])
+        lst = persist.getcfg ('lst')
+        lst.append(2)
+        persist.setcfg ('lst', lst)
+        dump_file (persist.config_full_path, 'after changes')
+        dump_journal (persist, 'after changes')
+
+        print ("\n\n********  Journal replayed on load (no save, as after a crash), with a partial last record")
+        with persist._journal_path.open('a') as ofile:
+            ofile.write("('set', '', 'partial")
+        persist = persistent_config ('persist', journal=True)
+        print (f"==== Content of persist config in memory after replay:\n{persist.dump()}")
+        persist.setcfg ('after_partial', True)
+        dump_journal (persist, 'after replay and a change')
+        print (f"changed_keys after replay:  {sorted(persist.changed_keys, key=str)}")
+
+        print ("\n\n********  save() compacts the journal into the config_file")
+        persist.save()
+        dump_file (persist.config_full_path, 'after save')
+        dump_journal (persist, 'after save')
+
+        print ("\n\n********  Background compaction at journal_compact_size")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+        persist = persistent_config ('persist', journal=True, journal_compact_size=200)
+        for cnt in range(20):
+            persist.setcfg ('count', cnt)
+        time.sleep(0.5)
+        journal_size = persist._journal_path.stat().st_size  if persist._journal_path.exists()  else 0
+        print (f"Journal compacted to less than 200 bytes after 20 changes:  {journal_size < 200}")
+        persist = persistent_config ('persist', journal=True)
+        print (f"count after reload:  {persist.getcfg('count')}")
+        persist.save()
+
+
+    #===============================================================================================
+    if check_tnum('30j'):
+        print_test_header ("persistent_config json storage")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+
+        print ("\n\n********  Save and reload with storage='json'")
+        persist = persistent_config ('persist', force_new=True, storage='json')
+        persist.setcfg ('count', 5)
+        persist.setcfg ('pi', 3.14)
+        persist.setcfg ('text', 'Hello # there "quoted"')
+        persist.setcfg ('nothing', None, section='a section')
+        persist.setcfg ('items', [1, 'two', {'three': True}], section='a section')
+        persist.setcfg ('a_tuple', (1, 2), section='DEFAULT')
+        persist.setcfg ('empty_section_param', 0, section='empty section')
+        persist.remove_param ('empty_section_param', section='empty section')
+        persist.save()
+        print (persist)
+        dump_file (persist.config_full_path, 'storage=json')
+        persist = persistent_config ('persist', storage='json')
+        print (f"==== Content of persist config in memory after reload:\n{persist.dump()}")
+
+        print ("\n\n********  Format auto-detected on load - storage='text' loads json, and converts on save")
+        persist = persistent_config ('persist')
+        print (f"text from json:  {persist.getcfg('text')!r}")
+        persist.save()
+        dump_file (persist.config_full_path, 'converted to storage=text')
+        persist = persistent_config ('persist', storage='json')
+        print (f"Sections after text to json load:  {persist.sections_list}")
+
+        print ("\n\n********  Error cases")
+        persist.setcfg ('a_set', {1, 2})
+        try:
+            persist.save()
+        except ConfigError as e:
+            print (f"ConfigError:  {e}")
+        persist.remove_param ('a_set')
+        persist.save()
+
+        persist.config_full_path.write_text(f"#cjnfuncs persistent_config json 99\n")
+        try:
+            persistent_config ('persist', storage='json')
+        except ConfigError as e:
+            print (f"ConfigError:  {e}")
+
+        try:
+            persistent_config ('persist', storage='marshal')
+        except ConfigError as e:
+            print (f"ConfigError:  {e}")
+
+
+    #===============================================================================================
+    if check_tnum('30k'):
+        print_test_header ("persistent_config lazy_load")
+        set_logging_level (logging.WARNING, 'cjnfuncs.configman')
+
+        persist = persistent_config ('persist', force_new=True)
+        persist.setcfg ('count', 5)
+        persist.setcfg ('text', 'Hello # there')
+        persist.setcfg ('flag', True, section='a section')
+        persist.setcfg ('items', [1, 2, 3], section='a section')
+        persist.setcfg ('flag', False, section='DEFAULT')
+        persist.setcfg ('shared', 'from DEFAULT', section='DEFAULT')
+        persist.save()
+
+        print ("\n\n********  Values decoded on first access")
+        persist = persistent_config ('persist', lazy_load=True)
+        print (persist)
+        print (f"cfg before any access:      {persist.cfg}")
+        print (f"getcfg('count'):            {persist.getcfg('count')}")
+        print (f"getcfg('text'):             {persist.getcfg('text')}")
+        print (f"getcfg('flag', section='a section'):    {persist.getcfg('flag', section='a section')}")
+        print (f"getcfg('shared', section='a section'):  {persist.getcfg('shared', section='a section')}")
+        print (f"getcfg('missing', fallback=None):       {persist.getcfg('missing', fallback=None)}")
+        print (f"cfg after accesses:         {persist.cfg}")
+        print (f"defaults after accesses:    {persist.defaults}")
+
+        print ("\n\n********  Changes to not yet decoded params")
+        persist.setcfg ('count', 6)
+        persist.remove_param ('items', section='a section')
+        print (f"changed_keys:  {sorted(persist.changed_keys)}")
+        print (f"==== Content of persist config in memory (all decoded by dump()):\n{persist.dump()}")
+        print (f"Mapped file released:  {persist._lazy_values is None}")
+        persist.save()
+        dump_file (persist.config_full_path, 'after lazy load, changes, and save')
+
+        print ("\n\n********  Journal replayed over a lazy load")
+        persist = persistent_config ('persist', journal=True, lazy_load=True)
+        persist.setcfg ('count', 7)
+        persist = persistent_config ('persist', journal=True, lazy_load=True)
+        print (f"getcfg('count'):  {persist.getcfg('count')}")
+        persist.save()
+
+        print ("\n\n********  Index file saved with the config file and mapped by later loads")
+        print (f"Index file exists:  {persist._index_path.exists()}")
+        persist = persistent_config ('persist', lazy_load=True)
+        print (f"Index table mapped from the index file:  {type(persist._lazy_values.table).__name__}")
+        print (f"getcfg('count'):  {persist.getcfg('count')}")
+        persist.config_full_path.write_text("count = 8\n")
+        persist = persistent_config ('persist', lazy_load=True)
+        print (f"Stale index rebuilt for an edited file - getcfg('count'):  {persist.getcfg('count')}")
+
+        print ("\n\n********  modify_configfile save over a lazy load")
+        persist.config_full_path.write_text("count = 12345678\ntext = Hello\n")
+        persist = persistent_config ('persist', lazy_load=True)
+        persist.modify_configfile ('count', 9, save=True)
+        print (f"Mapped file released:  {persist._lazy_values is None}")
+        print (f"getcfg('text'):  {persist.getcfg('text')}")
+        dump_file (persist.config_full_path, 'after modify_configfile save')
+
+        print ("\n\n********  Files with continuation lines are loaded normally")
+        persist.config_full_path.write_text("count = 1\nitems = [1, \\\n    2]\n")
+        persist = persistent_config ('persist', lazy_load=True)
+        print (f"Lazy loaded:  {persist._lazy_values is not None}")
+        print (f"==== Content of persist config in memory:\n{persist.dump()}")
+
+
     #===============================================================================================
     if check_tnum('50', include0=False):
         print_test_header ("development")
@@ -30,10 +30,12 @@ import re
 import subprocess
 import time
 import signal
+import asyncio
 from pathlib import Path
 
 from cjnfuncs.core      import set_toolname, setuplogging, logging, set_logging_level
-from cjnfuncs.rwt       import run_with_timeout
+from cjnfuncs.rwt       import run_with_timeout, run_with_timeout_async, run_with_timeout_map, rwt_pool_start, rwt_pool_stop, rwt_thread_stats
+from cjnfuncs.rwt       import rwt_retry, rwt_breaker, CircuitOpenError
 
 set_toolname(TOOLNAME)
 setuplogging(ConsoleLogFormat="{module:>22}.{funcName:20} {levelname:>8}:  {message}")      # No timestamps for cleaner compares
@@ -80,6 +82,50 @@ def dotest (desc, expect, func, *args, **kwargs):
         return e
 
 tnum_parse = re.compile(r"([\d]+)([\w]*)")
+def adotest (desc, expect, coro):      # dotest() equivalent for run_with_timeout_async()
+    logging.warning (f"\n\n==============================================================================================\n" +
+                     f"Test {tnum} - {desc}\n" +
+                     f"  EXPECT: {expect}")
+    try:
+        result = asyncio.run(coro)
+        logging.warning (f"  RETURNED:\n{result}")
+        return result
+    except Exception as e:
+        if cli_args.expand_exception:
+            logging.exception (f"\n  RAISED:     {type(e).__name__}: {e}")
+        else:
+            logging.error (f"\n  RAISED:     {type(e).__name__}: {e}")
+        return e
+
+
+def mdotest (desc, expect, func, args_list, **kwargs):      # dotest() equivalent for run_with_timeout_map()
+    logging.warning (f"\n\n==============================================================================================\n" +
+                     f"Test {tnum} - {desc}\n" +
+                     f"  EXPECT: {expect}")
+    try:
+        result = run_with_timeout_map(func, args_list, **kwargs)
+        logging.warning (f"  RETURNED:\n" + '\n'.join(repr(item) for item in result))
+        return result
+    except Exception as e:
+        if cli_args.expand_exception:
+            logging.exception (f"\n  RAISED:     {type(e).__name__}: {e}")
+        else:
+            logging.error (f"\n  RAISED:     {type(e).__name__}: {e}")
+        return e
+
+
+async def gather_20c():             # Used in test 20c
+    start = time.time()
+    results = await asyncio.gather(
+        run_with_timeout_async(time.sleep, 0.5, rwt_timeout=1),
+        run_with_timeout_async(time.sleep, 0.5, rwt_timeout=1),
+        run_with_timeout_async(time.sleep, 0.5, rwt_timeout=1),
+        run_with_timeout_async(time.sleep, 2, rwt_timeout=0.5),
+        run_with_timeout_async(Path(f'{test_dir}//nosuchfile').unlink),
+        return_exceptions=True)
+    return f"Elapsed time less than 1s:  {time.time() - start < 1}\n" + '\n'.join(repr(result) for result in results)
+
+
 def check_tnum(tnum_in, include0='0'):
     global tnum
     tnum = tnum_in
@@ -198,6 +244,10 @@ if __name__ == "__main__":
         dotest("Invalid rwt_kill", "Raise ValueError",
                test_shell_1, 2, tnum, f'{test_dir}/FileTouched_9c', rwt_kill='abc')
 
+    if check_tnum('9d'):
+        dotest("Invalid rwt_mode", "Raise ValueError",
+               test_shell_1, 2, tnum, f'{test_dir}/FileTouched_9d', rwt_mode='abc')
+
 
     #-------------------------------------------------------------------------
     if check_tnum('11'):
@@ -357,6 +407,188 @@ if __name__ == "__main__":
         set_logging_level(logging.DEBUG, 'cjnfuncs.rwt')
 
 
+    #-------------------------------------------------------------------------
+    # Test 18 series - rwt_mode='pool'
+    if check_tnum('18a'):
+        set_logging_level(logging.WARNING)
+        rwt_pool_start()
+        t18a = test_dir / 't18a'
+        t18a.touch()
+        dotest("rwt_mode='pool', shutil.copy", "Pass, run on the pre-started pool worker",
+               shutil.copy, t18a, test_dir / 't18b', rwt_mode='pool')
+
+    if check_tnum('18b'):
+        nosuchfile = Path(f'{test_dir}//nosuchfile')
+        dotest("rwt_mode='pool', Delete non-existing file", "Raise FileNotFoundError from function runtime",
+               nosuchfile.unlink, rwt_mode='pool')
+
+    if check_tnum('18c'):
+        dotest("rwt_mode='pool', time.sleep greater than rwt_timeout, rwt_ntries=2", "Raise TimeoutError (killed), worker replaced",
+               time.sleep, 0.5, rwt_timeout=0.4, rwt_ntries=2, rwt_mode='pool')
+
+    if check_tnum('18d'):
+        dotest("rwt_mode='pool', Function wont_terminate, requires SIGKILL on Linux", "Raise TimeoutError (killed), worker replaced",
+               wont_terminate, rwt_timeout=0.5, rwt_mode='pool')
+
+    if check_tnum('18e'):
+        xx = dotest("rwt_mode='pool', Function wont_terminate, not killed, rwt_ntries=2", "Raise TimeoutError, pids listed",
+               wont_terminate, rwt_timeout=0.5, rwt_ntries=2, rwt_kill=False, rwt_mode='pool')
+        kill_pids(str(xx).split('orphaned pids: ')[1])
+
+    if check_tnum('18f'):
+        dotest("rwt_mode='pool', func not picklable", "Raise PicklingError",
+               lambda: 42, rwt_mode='pool')
+
+    if check_tnum('18g'):
+        dotest("rwt_mode='pool', after prior timeouts", "Pass, return True",
+               os.path.exists, test_dir, rwt_mode='pool')
+        rwt_pool_stop()
+        set_logging_level(logging.DEBUG)
+
+
+    #-------------------------------------------------------------------------
+    # Test 19 series - rwt_mode='thread'
+    if check_tnum('19a'):
+        dotest("rwt_mode='thread', os.path.exists", "Pass, return True",
+               os.path.exists, test_dir, rwt_mode='thread')
+
+    if check_tnum('19b'):
+        nosuchfile = Path(f'{test_dir}//nosuchfile')
+        dotest("rwt_mode='thread', Delete non-existing file", "Raise FileNotFoundError from function runtime",
+               nosuchfile.unlink, rwt_mode='thread')
+
+    if check_tnum('19c'):
+        dotest("rwt_mode='thread', time.sleep greater than rwt_timeout, rwt_ntries=2", "Raise TimeoutError (thread abandoned), 2 threads abandoned",
+               time.sleep, 0.5, rwt_timeout=0.2, rwt_ntries=2, rwt_mode='thread')
+        logging.warning (f"rwt_thread_stats:  {rwt_thread_stats()}")
+
+    if check_tnum('19d'):
+        time.sleep(0.6)
+        dotest("rwt_mode='thread', after abandoned threads completed", "Pass, return True, threads reused, 0 abandoned",
+               os.path.exists, test_dir, rwt_mode='thread')
+        logging.warning (f"rwt_thread_stats:  {rwt_thread_stats()}")
+
+    if check_tnum('19e'):
+        try:
+            dotest("rwt_mode='thread', sys.exit", "Raise SystemExit in the caller, pool thread kept and idle",
+                   sys.exit, 3, rwt_mode='thread')
+        except SystemExit as e:
+            logging.error (f"\n  RAISED:     {type(e).__name__}: {e}")
+        logging.warning (f"rwt_thread_stats:  {rwt_thread_stats()}")
+
+
+    #-------------------------------------------------------------------------
+    # Test 20 series - run_with_timeout_async()
+    if check_tnum('20a'):
+        set_logging_level(logging.WARNING)
+        adotest("run_with_timeout_async, shutil.copy", "Pass",
+                run_with_timeout_async(shutil.copy, test_dir / 't18a', test_dir / 't20a'))
+
+    if check_tnum('20b'):
+        adotest("run_with_timeout_async, Function wont_terminate, requires SIGKILL on Linux, rwt_ntries=2", "Raise TimeoutError (killed)",
+                run_with_timeout_async(wont_terminate, rwt_timeout=0.5, rwt_ntries=2))
+
+    if check_tnum('20c'):
+        set_logging_level(logging.WARNING, 'cjnfuncs.rwt')
+        adotest("run_with_timeout_async, 5 concurrent calls, No rwt logging", "Elapsed True, 3 None, TimeoutError, FileNotFoundError",
+                gather_20c())
+        set_logging_level(logging.DEBUG, 'cjnfuncs.rwt')
+
+    if check_tnum('20d'):
+        adotest("run_with_timeout_async, Invalid rwt_mode", "Raise ValueError",
+                run_with_timeout_async(time.sleep, 0.1, rwt_mode='pool'))
+
+
+    #-------------------------------------------------------------------------
+    # Test 21 series - run_with_timeout_map()
+    if check_tnum('21a'):
+        set_logging_level(logging.WARNING)
+        set_logging_level(logging.WARNING, 'cjnfuncs.rwt')
+        t21 = [test_dir / 't18a', test_dir / 'nosuchfile', (test_dir,)]
+        xx = mdotest("run_with_timeout_map os.path.exists", "Pass, return [True, False, True]",
+               os.path.exists, t21)
+
+    if check_tnum('21b'):
+        start = time.time()
+        xx = mdotest("run_with_timeout_map time.sleep, per-item rwt_timeout, No rwt logging", "Pass, return [None, ValueError, TimeoutError (killed), None, TypeError]",
+               time.sleep, [0.1, -1, 2, (0.5,), 'abc'], rwt_timeout=1)
+        logging.warning (f"Elapsed time less than 1.5s:  {time.time() - start < 1.5}")
+
+    if check_tnum('21c'):
+        start = time.time()
+        xx = mdotest("run_with_timeout_map time.sleep, rwt_deadline, rwt_nworkers=2", "Pass, return [TimeoutError (exceeded rwt_deadline) x2, TimeoutError (not run) x2]",
+               time.sleep, [2, 2, 0.1, 0.1], rwt_timeout=3, rwt_deadline=0.5, rwt_nworkers=2)
+        logging.warning (f"Elapsed time less than 1s:  {time.time() - start < 1}")
+
+    if check_tnum('21d'):
+        xx = mdotest("run_with_timeout_map time.sleep, rwt_mode='thread'", "Pass, return [None, ValueError, TimeoutError (thread abandoned), None]",
+               time.sleep, [0.1, -1, 2, 0.1], rwt_timeout=0.5, rwt_deadline=0.7, rwt_mode='thread')
+
+    if check_tnum('21e'):
+        xx = mdotest("run_with_timeout_map time.sleep, rwt_mode='pool', rwt_nworkers=2", "Pass, return [None, ValueError, TimeoutError (killed), None]",
+               time.sleep, [0.1, -1, 2, 0.1], rwt_timeout=0.5, rwt_mode='pool', rwt_nworkers=2)
+
+    if check_tnum('21f'):
+        xx = mdotest("run_with_timeout_map time.sleep, not killed", "Pass, return [None, TimeoutError (not killed)]",
+               time.sleep, [0.1, 1], rwt_timeout=0.5, rwt_kill=False)
+        kill_pids(str(xx[1]).split('orphaned pid: ')[1])
+
+    if check_tnum('21g'):
+        xx = mdotest("run_with_timeout_map os._exit, rwt_mode='pool'", "Pass, return [RuntimeError (worker_p exit code 3)]",
+               os._exit, [3], rwt_mode='pool')
+        xx = mdotest("run_with_timeout_map after a crashed pool worker", "Pass, return [None, None]",
+               time.sleep, [0.1, 0.1], rwt_mode='pool')
+        xx = mdotest("run_with_timeout_map lambda, rwt_mode='pool'", "Pass, return [pickling exception, pickling exception]",
+               lambda x: x, [1, 2], rwt_mode='pool')
+
+    if check_tnum('21h'):
+        start = time.time()
+        xx = mdotest("run_with_timeout_map time.sleep, 10 hung items, rwt_mode='thread', no rwt_deadline", "Pass, return TimeoutError (thread abandoned) x10, including 2 items not started",
+               time.sleep, [1]*10, rwt_timeout=0.3, rwt_mode='thread')
+        logging.warning (f"Elapsed time less than 0.6s:  {time.time() - start < 0.6}")
+        time.sleep(1)                               # Let the abandoned threads complete for the following thread mode tests
+
+    if check_tnum('21i'):
+        mdotest("run_with_timeout_map rwt_ntries=2", "Raise ValueError",
+               time.sleep, [0.1], rwt_ntries=2)
+        set_logging_level(logging.DEBUG, 'cjnfuncs.rwt')
+
+
+    #-------------------------------------------------------------------------
+    # Test 22 series - rwt_retry and rwt_breaker
+    if check_tnum('22a'):
+        set_logging_level(logging.WARNING)
+        retry = rwt_retry(ntries=3, backoff=0.2, jitter=0, timeout_factor=2)
+        dotest("rwt_retry, time.sleep(0.5) succeeds on third try with growing timeout", "Pass, rwt_timeout 0.2, 0.4, 0.8, Retry in 0.200, 0.400 seconds",
+               time.sleep, 0.5, rwt_timeout=0.2, rwt_retry=retry)
+
+    if check_tnum('22b'):
+        retry = rwt_retry(ntries=5, backoff=0.2, jitter=0, deadline=0.9)
+        dotest("rwt_retry with deadline=0.9, rwt_mode='thread'", "Raise TimeoutError (thread abandoned) after 2 tries",
+               time.sleep, 2, rwt_timeout=0.3, rwt_retry=retry, rwt_mode='thread')
+
+    if check_tnum('22c'):
+        nosuchfile = Path(f'{test_dir}//nosuchfile')
+        dotest("rwt_retry, exception raised by function not in retry_on", "Raise FileNotFoundError, no retry",
+               nosuchfile.unlink, rwt_retry=rwt_retry(ntries=3))
+
+    if check_tnum('22d'):
+        breaker = rwt_breaker(threshold=2, reset_after=0.5)
+        for ncall in range(3):
+            dotest(f"rwt_breaker call {ncall}, threshold=2", "TimeoutError, TimeoutError, CircuitOpenError",
+                   time.sleep, 2, rwt_timeout=0.2, rwt_mode='thread', rwt_breaker=breaker, rwt_breaker_key='/mnt/share')
+        logging.warning (f"Breaker state:  {breaker.state('/mnt/share')}")
+        time.sleep(0.5)
+        logging.warning (f"Breaker state after reset_after:  {breaker.state('/mnt/share')}")
+        dotest("rwt_breaker trial call", "Pass, return True, breaker closed",
+               os.path.exists, test_dir, rwt_mode='thread', rwt_breaker=breaker, rwt_breaker_key='/mnt/share')
+        logging.warning (f"Breaker state:  {breaker.state('/mnt/share')}")
+
+    if check_tnum('22e'):
+        dotest("rwt_retry and rwt_ntries", "Raise ValueError",
+               time.sleep, 0.1, rwt_retry=rwt_retry(), rwt_ntries=2)
+
+
 
     # Debug / development
 